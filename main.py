@@ -1,6 +1,26 @@
+import argparse
 from scripts.core.game import Game
+from scripts.battle.planner import Difficulty
 
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", default=None, help="戦闘のリプレイを保存するファイル")
+    parser.add_argument("--replay", default=None, help="再生するリプレイファイル")
+    parser.add_argument("--difficulty", default=Difficulty.EASY.value, choices=[d.value for d in Difficulty], help="敵の強さ")
+    parser.add_argument("--units", type=int, default=3, help="1陣営のユニット数")
+    parser.add_argument("--dice", type=int, default=1, help="ユニットごとの速度ダイスの数")
+    parser.add_argument("--dirty-rects", action="store_true", help="変わった範囲だけ画面を更新する")
+    parser.add_argument("--profile", action="store_true", help="処理時間の計測を有効にして起動する（F3 で切り替え）")
+    args = parser.parse_args()
+
+    game = Game(
+        record_path=args.record,
+        replay_path=args.replay,
+        difficulty=Difficulty(args.difficulty),
+        unit_count=args.units,
+        velocity_dice_count=args.dice,
+        dirty_rects=args.dirty_rects,
+        profile=args.profile,
+    )
     game.run()
@@ -18,5 +18,8 @@ class Animation:
             if self.frame >= self.duration * len(self.images) - 1:
                 self.done = True
 
+    def get_frame_index(self):
+        return int(self.frame / self.duration)
+
     def get_img(self):
-        return self.images[int(self.frame / self.duration)]
\ No newline at end of file
+        return self.images[self.get_frame_index()]
\ No newline at end of file
@@ -0,0 +1,56 @@
+import pygame
+from scripts.assets.animation import Animation
+
+
+class ScaledImageCache:
+    """
+    拡大縮小済み画像の管理（全UIで共有）
+
+    ・(アセットキー, フレーム番号, サイズ) ごとに1回だけ拡大縮小する
+    ・アニメーションは prewarm で全フレームを先に作っておく
+    ・返す画像は共有なので変更しない（半透明にする場合は alpha を指定して別の画像を取得する）
+
+    Args:
+        assets (dict): Game.assets（画像 or Animation）
+    """
+
+    def __init__(self, assets: dict):
+        self.assets = assets
+
+        # スケーリング画像データ用キャッシュ
+        self._scaled_cache: dict[tuple[str, int, tuple[int, int], int | None], pygame.Surface] = {}
+
+    def get(self, key: str, size: list[int, int] | tuple[int, int], frame: int = 0, alpha: int | None = None) -> pygame.Surface:
+        """拡大縮小した画像を取得（画像のアセットは frame=0、alpha を指定した場合は半透明にした画像）"""
+        size = (int(size[0]), int(size[1]))
+        cache_key = (key, frame, size, alpha)
+
+        # キャッシュにある場合はキャッシュを返す
+        scaled_surf = self._scaled_cache.get(cache_key)
+        if scaled_surf is not None:
+            return scaled_surf
+
+        if alpha is None:
+            asset = self.assets[key]
+            raw_surf = asset.images[frame] if isinstance(asset, Animation) else asset
+            scaled_surf = pygame.transform.scale(raw_surf, size)
+        else:
+            # 不透明の画像を複製して半透明にする
+            scaled_surf = self.get(key, size, frame).copy()
+            scaled_surf.set_alpha(alpha)
+
+        self._scaled_cache[cache_key] = scaled_surf
+        return scaled_surf
+
+    def prewarm(self, key: str, size: list[int, int] | tuple[int, int]) -> None:
+        """アセットの全フレームを拡大縮小しておく"""
+        asset = self.assets[key]
+        frames = len(asset.images) if isinstance(asset, Animation) else 1
+        for frame in range(frames):
+            self.get(key, size, frame)
+
+    def clear(self) -> None:
+        self._scaled_cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._scaled_cache)
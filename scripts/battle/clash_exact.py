@@ -0,0 +1,253 @@
+import threading
+from dataclasses import dataclass
+from typing import NamedTuple
+from scripts.models.card import CardSpec
+from scripts.battle.clash_rules import ATTACK, DICE_CATEGORY, ClashEffect, get_clash_amount, get_clash_rule
+from scripts.models.dice import DieSpec, DiceType
+from scripts.models.unit import ResistanceProfile
+from scripts.utils.cache import LRUCache
+
+
+# DiceType -> 耐性プロファイルの添字
+TYPE_INDEX = {d_type: i for i, d_type in enumerate(DiceType)}
+
+
+class ClashOutcome(NamedTuple):
+    """マッチ1回分の結果（ダメージ/回復は受けた側ごと）"""
+    a_hp_damage: int
+    a_confusion_damage: int
+    a_confusion_heal: int
+    b_hp_damage: int
+    b_confusion_damage: int
+    b_confusion_heal: int
+    a_remaining: int    # マッチ終了時の残りダイス数
+    b_remaining: int
+    winner: int         # 1: a の勝ち, -1: b の勝ち, 0: 引き分け（ダイス勝利数）
+
+
+@dataclass
+class ClashDistribution:
+    """
+    カード同士のマッチ結果の厳密な確率分布
+
+    死亡・混乱による打ち切りは考慮しない
+    """
+    outcomes: dict[ClashOutcome, float]
+
+    def expected(self, name: str) -> float:
+        """項目の期待値"""
+        return sum(getattr(o, name) * p for o, p in self.outcomes.items())
+
+    def marginal(self, name: str) -> dict[int, float]:
+        """項目の周辺分布"""
+        dist: dict[int, float] = {}
+        for o, p in self.outcomes.items():
+            v = getattr(o, name)
+            dist[v] = dist.get(v, 0.0) + p
+        return dist
+
+    @property
+    def a_win_rate(self) -> float:
+        return sum(p for o, p in self.outcomes.items() if o.winner > 0)
+
+    @property
+    def b_win_rate(self) -> float:
+        return sum(p for o, p in self.outcomes.items() if o.winner < 0)
+
+    @property
+    def draw_rate(self) -> float:
+        return sum(p for o, p in self.outcomes.items() if o.winner == 0)
+
+
+# キャッシュの読み書きの排他（HintWorker のスレッドとメインスレッドの両方から使うため）
+_lock = threading.Lock()
+
+# マッチ結果のキャッシュ key: (カードID, カードID, 耐性, 耐性)
+_cache = LRUCache(maxsize=4096)
+
+
+def get_clash_distribution(a_card: CardSpec, b_card: CardSpec, a_profile: ResistanceProfile, b_profile: ResistanceProfile) -> ClashDistribution:
+    """カード同士のマッチ結果の分布を取得（キャッシュあり）"""
+    key = (a_card.id, b_card.id, a_profile, b_profile)
+    with _lock:
+        dist = _cache.get(key)
+    if dist is None:
+        dist = compute_clash_distribution(a_card.dice_list, b_card.dice_list, a_profile, b_profile)
+        with _lock:
+            _cache.put(key, dist)
+    return dist
+
+
+# 期待ダメージのキャッシュ
+_expected_cache = LRUCache(maxsize=4096)
+
+
+def get_expected_clash_damage(a_card: CardSpec, b_card: CardSpec, a_profile: ResistanceProfile, b_profile: ResistanceProfile) -> tuple[float, float, float, float]:
+    """マッチの期待ダメージ (a のHP, a の混乱耐性, b のHP, b の混乱耐性)"""
+    key = ("clash", a_card.id, b_card.id, a_profile, b_profile)
+    with _lock:
+        expected = _expected_cache.get(key)
+    if expected is None:
+        dist = get_clash_distribution(a_card, b_card, a_profile, b_profile)
+        expected = (
+            dist.expected("a_hp_damage"),
+            dist.expected("a_confusion_damage"),
+            dist.expected("b_hp_damage"),
+            dist.expected("b_confusion_damage"),
+        )
+        with _lock:
+            _expected_cache.put(key, expected)
+    return expected
+
+
+def get_expected_one_sided_damage(card: CardSpec, profile: ResistanceProfile) -> tuple[float, float]:
+    """一方攻撃の期待ダメージ (HP, 混乱耐性)"""
+    key = ("one_sided", card.id, profile)
+    with _lock:
+        expected = _expected_cache.get(key)
+    if expected is None:
+        dist = _one_sided_tail(card.dice_list, 0, profile)
+        expected = (
+            sum(hp * p for (hp, _), p in dist.items()),
+            sum(conf * p for (_, conf), p in dist.items()),
+        )
+        with _lock:
+            _expected_cache.put(key, expected)
+    return expected
+
+
+def clear_cache() -> None:
+    with _lock:
+        _cache.clear()
+        _expected_cache.clear()
+
+
+def _damage(val: int, die: DieSpec, profile: ResistanceProfile) -> tuple[int, int]:
+    """(HPダメージ, 混乱耐性ダメージ)"""
+    i = TYPE_INDEX[die.d_type]
+    return int(val * profile.hp[i]), int(val * profile.confusion[i])
+
+
+def _step_transitions(a_die: DieSpec, b_die: DieSpec, a_profile: ResistanceProfile, b_profile: ResistanceProfile):
+    """
+    ダイス1組の比較で起こりうる遷移と確率
+    戻り値: {(a_hp, a_conf, a_heal, b_hp, b_conf, b_heal, win, diff_a, diff_b): 確率}
+    """
+    transitions: dict[tuple, float] = {}
+    p = 1.0 / ((a_die.max_val - a_die.min_val + 1) * (b_die.max_val - b_die.min_val + 1))
+
+    for a_val in range(a_die.min_val, a_die.max_val + 1):
+        for b_val in range(b_die.min_val, b_die.max_val + 1):
+            a_hp = a_conf = a_heal = b_hp = b_conf = b_heal = 0
+            win = (a_val > b_val) - (a_val < b_val)
+
+            rule = get_clash_rule(a_die, b_die, a_val, b_val)
+            diff_a = rule.consume_a
+            diff_b = rule.consume_b
+
+            if rule.effect == ClashEffect.HEAL_CONFUSION:
+                if win > 0:
+                    a_heal = get_clash_amount(rule, a_val, b_val)
+                else:
+                    b_heal = get_clash_amount(rule, a_val, b_val)
+            elif rule.effect != ClashEffect.NONE:
+                # 勝った側のダイスの種類で負けた側の耐性を引く
+                die, profile = (a_die, b_profile) if win > 0 else (b_die, a_profile)
+                hp, conf = _damage(get_clash_amount(rule, a_val, b_val), die, profile)
+                if rule.effect == ClashEffect.CONFUSION_DAMAGE:
+                    hp = 0
+                if win > 0:
+                    b_hp, b_conf = hp, conf
+                else:
+                    a_hp, a_conf = hp, conf
+
+            key = (a_hp, a_conf, a_heal, b_hp, b_conf, b_heal, win, diff_a, diff_b)
+            transitions[key] = transitions.get(key, 0.0) + p
+
+    return transitions
+
+
+def _one_sided_tail(dice_list: list[DieSpec], start: int, profile: ResistanceProfile) -> dict[tuple[int, int], float]:
+    """残りのダイスでの一方攻撃ダメージ分布 {(HP, 混乱耐性): 確率}"""
+    dist = {(0, 0): 1.0}
+
+    # 攻撃ダイスがひとつもない場合は全て保存
+    if not any(DICE_CATEGORY[die.d_type] == ATTACK for die in dice_list):
+        return dist
+
+    for die in dice_list[start:]:
+        if DICE_CATEGORY[die.d_type] != ATTACK:
+            continue
+        p = 1.0 / (die.max_val - die.min_val + 1)
+        new_dist: dict[tuple[int, int], float] = {}
+        for (hp, conf), q in dist.items():
+            for val in range(die.min_val, die.max_val + 1):
+                d_hp, d_conf = _damage(val, die, profile)
+                key = (hp + d_hp, conf + d_conf)
+                new_dist[key] = new_dist.get(key, 0.0) + q * p
+        dist = new_dist
+
+    return dist
+
+
+def compute_clash_distribution(
+    a_dice_list: list[DieSpec],
+    b_dice_list: list[DieSpec],
+    a_profile: ResistanceProfile,
+    b_profile: ResistanceProfile,
+) -> ClashDistribution:
+    """
+    カード同士のマッチ結果の分布を計算する
+
+    ・ダイス1組ごとの遷移を畳み込んで全体の分布を求める
+    ・片方のダイスが切れた後の残りの攻撃ダイスは一方攻撃として加算
+    """
+    a_len = len(a_dice_list)
+    b_len = len(b_dice_list)
+
+    step_cache: dict[tuple[int, int], dict] = {}
+    a_tail_cache: dict[int, dict] = {}
+    b_tail_cache: dict[int, dict] = {}
+
+    # 状態: (ai, bi, a_hp, a_conf, a_heal, b_hp, b_conf, b_heal, 勝利数の差)
+    states: dict[tuple, float] = {(0, 0, 0, 0, 0, 0, 0, 0, 0): 1.0}
+    outcomes: dict[ClashOutcome, float] = {}
+
+    while states:
+        next_states: dict[tuple, float] = {}
+        for state, p in states.items():
+            ai, bi, a_hp, a_conf, a_heal, b_hp, b_conf, b_heal, wins = state
+
+            # どちらかのダイス切れでマッチ終了
+            if ai >= a_len or bi >= b_len:
+                if ai not in a_tail_cache:
+                    a_tail_cache[ai] = _one_sided_tail(a_dice_list, ai, b_profile)
+                if bi not in b_tail_cache:
+                    b_tail_cache[bi] = _one_sided_tail(b_dice_list, bi, a_profile)
+
+                winner = (wins > 0) - (wins < 0)
+                for (tb_hp, tb_conf), qa in a_tail_cache[ai].items():
+                    for (ta_hp, ta_conf), qb in b_tail_cache[bi].items():
+                        outcome = ClashOutcome(
+                            a_hp + ta_hp, a_conf + ta_conf, a_heal,
+                            b_hp + tb_hp, b_conf + tb_conf, b_heal,
+                            a_len - ai, b_len - bi, winner,
+                        )
+                        outcomes[outcome] = outcomes.get(outcome, 0.0) + p * qa * qb
+                continue
+
+            if (ai, bi) not in step_cache:
+                step_cache[(ai, bi)] = _step_transitions(a_dice_list[ai], b_dice_list[bi], a_profile, b_profile)
+
+            for (d_a_hp, d_a_conf, d_a_heal, d_b_hp, d_b_conf, d_b_heal, win, diff_a, diff_b), q in step_cache[(ai, bi)].items():
+                key = (
+                    ai + diff_a, bi + diff_b,
+                    a_hp + d_a_hp, a_conf + d_a_conf, a_heal + d_a_heal,
+                    b_hp + d_b_hp, b_conf + d_b_conf, b_heal + d_b_heal,
+                    wins + win,
+                )
+                next_states[key] = next_states.get(key, 0.0) + p * q
+
+        states = next_states
+
+    return ClashDistribution(outcomes)
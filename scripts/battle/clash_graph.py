@@ -0,0 +1,176 @@
+from bisect import bisect_left, insort
+from scripts.battle.system import ClashInfo, ClashType
+from scripts.models.dice import VelocityDice
+
+
+class ClashGraph:
+    """
+    マッチ/一方攻撃の判定を差分で更新する（BattleSystem.evaluate_clashes と同じ結果）
+
+    ・狙われた側（defender）ごとの攻撃者一覧を速度順で持つ
+    ・defender は「最初の攻撃者の速度順の位置」の順に判定する（evaluate_clashes の incoming の順）
+    ・速度ダイスごとに、どの defender の判定でマッチしたか（defender の位置）を持つ
+    ・1つの速度ダイスのカード/ターゲット/選択順が変わった場合は、関係する defender と、
+      それより後でマッチの状態が変わった速度ダイスを含む defender だけを判定し直す
+    ・速度（val）や速度順が変わった場合は作り直す
+
+    Args:
+        all_slots (list[VelocityDice]): 全速度ダイス（速度順）
+    """
+
+    def __init__(self, all_slots: list[VelocityDice]):
+        self.all_slots = list(all_slots)
+        self._pos = {vel_dice: i for i, vel_dice in enumerate(self.all_slots)}   # 速度順の位置
+
+        self._incoming: dict = {}   # key: defender, val: 攻撃者一覧（速度順）
+        self._target: dict = {}     # key: 有効な攻撃者, val: 反映済みのターゲット
+        self._keys: list[int] = []  # defender の判定順（最初の攻撃者の位置）
+        self._defenders: list = []  # _keys と同じ並びの defender
+
+        self._opponent: dict = {}       # key: 速度ダイス, val: マッチ相手
+        self._chosen: dict = {}         # key: defender, val: その判定でマッチした攻撃者と defender の位置
+        self._matched_at: dict = {}     # key: 速度ダイス, val: マッチした defender の位置
+
+        for vel_dice in self.all_slots:
+            if self._is_active(vel_dice):
+                self._add_attacker(vel_dice.target, vel_dice)
+                self._target[vel_dice] = vel_dice.target
+        self._resolve(set(self._defenders), start=0)
+
+    def infos(self) -> list[ClashInfo]:
+        """マッチ/一方攻撃の一覧（evaluate_clashes と同じ並び）"""
+        opponent = self._opponent
+        return [
+            ClashInfo(a, opponent[a], ClashType.CLASH) if a in opponent
+            else ClashInfo(a, a.target, ClashType.ONE_SIDED)
+            for a in self.all_slots if a in self._target
+        ]
+
+    def update(self, vel_dice: VelocityDice) -> None:
+        """速度ダイスのカード/ターゲット/選択順の変更を反映"""
+        dirty = {vel_dice}
+
+        old_target = self._target.pop(vel_dice, None)
+        if old_target is not None:
+            self._remove_attacker(old_target, vel_dice)
+            dirty.add(old_target)
+
+        if self._is_active(vel_dice):
+            self._add_attacker(vel_dice.target, vel_dice)
+            self._target[vel_dice] = vel_dice.target
+            dirty.add(vel_dice.target)
+
+        # 判定し直す位置（現在の位置と、以前マッチした位置の早い方）
+        start = len(self._pos)
+        for d in dirty:
+            if d in self._incoming:
+                start = min(start, self._pos[self._incoming[d][0]])
+            if d in self._chosen:
+                start = min(start, self._chosen[d][1])
+        self._resolve(dirty, start)
+
+    @staticmethod
+    def _is_active(vel_dice: VelocityDice) -> bool:
+        return vel_dice.card is not None and vel_dice.target is not None and vel_dice.val is not None
+
+    def _add_attacker(self, defender: VelocityDice, attacker: VelocityDice) -> None:
+        attackers = self._incoming.get(defender)
+        pos = self._pos[attacker]
+        if attackers is None:
+            self._incoming[defender] = [attacker]
+            self._insert_order(pos, defender)
+            return
+        first = self._pos[attackers[0]]
+        insort(attackers, attacker, key=self._pos.__getitem__)
+        if pos < first:
+            self._remove_order(first)
+            self._insert_order(pos, defender)
+
+    def _remove_attacker(self, defender: VelocityDice, attacker: VelocityDice) -> None:
+        attackers = self._incoming[defender]
+        first = self._pos[attackers[0]]
+        attackers.remove(attacker)
+        if not attackers:
+            del self._incoming[defender]
+            self._remove_order(first)
+        elif self._pos[attackers[0]] != first:
+            self._remove_order(first)
+            self._insert_order(self._pos[attackers[0]], defender)
+
+    def _insert_order(self, key: int, defender: VelocityDice) -> None:
+        i = bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._defenders.insert(i, defender)
+
+    def _remove_order(self, key: int) -> None:
+        i = bisect_left(self._keys, key)
+        del self._keys[i]
+        del self._defenders[i]
+
+    def _resolve(self, dirty: set, start: int) -> None:
+        """start 以降の defender を判定し直す"""
+        changed = set()     # マッチの状態が変わった速度ダイス
+
+        # 判定し直す defender の以前のマッチを外す
+        for d in dirty:
+            if d in self._chosen:
+                self._unmatch(d, changed)
+
+        i = bisect_left(self._keys, start)
+        for key, defender in zip(self._keys[i:], self._defenders[i:]):
+            if (defender not in dirty and defender not in changed
+                    and not any(a in changed for a in self._incoming[defender])):
+                continue
+
+            old = self._chosen.get(defender)
+            chosen = self._decide(defender, key)
+            if old is not None:
+                if old == (chosen, key):
+                    continue
+                self._unmatch(defender, changed)
+            if chosen is not None:
+                self._chosen[defender] = (chosen, key)
+                self._opponent[defender] = chosen
+                self._opponent[chosen] = defender
+                self._matched_at[defender] = key
+                self._matched_at[chosen] = key
+                changed.add(defender)
+                changed.add(chosen)
+
+    def _unmatch(self, defender: VelocityDice, changed: set) -> None:
+        """defender の判定で決まったマッチを外す（後の判定で別のマッチになっている場合はそのまま）"""
+        chosen, key = self._chosen.pop(defender)
+        for vel_dice in (defender, chosen):
+            if self._matched_at.get(vel_dice) == key:
+                del self._matched_at[vel_dice]
+                del self._opponent[vel_dice]
+            changed.add(vel_dice)
+
+    def _decide(self, defender: VelocityDice, key: int) -> VelocityDice | None:
+        """defender の対戦相手（evaluate_clashes の1回分の判定）"""
+        matched_at = self._matched_at
+
+        # 既にマッチ済みの場合
+        if matched_at.get(defender, key) < key:
+            return None
+        if defender.card is None or defender.val is None:
+            return None
+
+        # 既に使われてない攻撃者だけ
+        cand = [a for a in self._incoming[defender] if matched_at.get(a, key) >= key and a.val is not None]
+
+        # マッチ奪い判定（味方のみ）
+        interceptors = [a for a in cand if a.val > defender.val and a.owner.is_ally]
+        if interceptors:
+            return max(interceptors, key=_order_key)
+
+        # 相互狙い
+        mutuals = [a for a in cand if defender.target is a]
+        if mutuals:
+            return max(mutuals, key=_order_key)
+        return None
+
+
+def _order_key(vel_dice: VelocityDice):
+    # 選択順がない(敵など)場合は0
+    return (getattr(vel_dice, "select_order", 0), vel_dice.val)
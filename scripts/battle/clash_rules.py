@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from enum import Enum, auto
+from scripts.models.dice import DieSpec, DiceType
+
+
+# ダイスの分類（表の添字）
+ATTACK = 0
+BLOCK = 1
+EVADE = 2
+CATEGORIES = (ATTACK, BLOCK, EVADE)
+
+
+# DiceType -> 分類（新しいダイスの種類はここに追加する）
+DICE_CATEGORY = {
+    DiceType.SLASH: ATTACK,
+    DiceType.PIERCE: ATTACK,
+    DiceType.BLUNT: ATTACK,
+    DiceType.BLOCK: BLOCK,
+    DiceType.EVADE: EVADE,
+}
+
+
+class ClashEffect(Enum):
+    NONE = auto()               # 何もしない
+    DAMAGE = auto()             # 負けた側にHP/混乱耐性ダメージ
+    CONFUSION_DAMAGE = auto()   # 負けた側に混乱耐性ダメージ
+    HEAL_CONFUSION = auto()     # 勝った側の混乱耐性を回復
+
+
+class ClashAmount(Enum):
+    WINNER = auto()     # 勝った側の値
+    DIFF = auto()       # 勝った側の値 - 負けた側の値
+
+
+@dataclass(frozen=True)
+class ClashRule:
+    """ダイス1組の比較結果"""
+    effect: ClashEffect     # 効果（ダメージは勝った側のダイスの種類で耐性を引く）
+    amount: ClashAmount     # 効果量
+    winner: int             # 1: a の勝ち, -1: b の勝ち, 0: 引き分け
+    consume_a: int          # a のダイスを消費する場合は 1（再利用する場合は 0）
+    consume_b: int          # b のダイスを消費する場合は 1
+
+
+# 勝った側の分類, 負けた側の分類 -> (効果, 効果量, 勝った側の消費, 負けた側の消費)
+_WIN_RULES = {
+    (ATTACK, ATTACK): (ClashEffect.DAMAGE, ClashAmount.WINNER, 1, 1),
+    (ATTACK, BLOCK): (ClashEffect.DAMAGE, ClashAmount.DIFF, 1, 1),
+    (ATTACK, EVADE): (ClashEffect.DAMAGE, ClashAmount.WINNER, 1, 1),
+    (BLOCK, ATTACK): (ClashEffect.CONFUSION_DAMAGE, ClashAmount.WINNER, 1, 1),
+    (BLOCK, BLOCK): (ClashEffect.CONFUSION_DAMAGE, ClashAmount.WINNER, 1, 1),
+    (BLOCK, EVADE): (ClashEffect.CONFUSION_DAMAGE, ClashAmount.WINNER, 1, 1),
+    # 攻撃ダイスに勝った回避ダイスは再利用
+    (EVADE, ATTACK): (ClashEffect.HEAL_CONFUSION, ClashAmount.WINNER, 0, 1),
+    (EVADE, BLOCK): (ClashEffect.HEAL_CONFUSION, ClashAmount.WINNER, 1, 1),
+    (EVADE, EVADE): (ClashEffect.NONE, ClashAmount.WINNER, 1, 1),
+}
+
+
+def _build_table() -> list[list[list[ClashRule]]]:
+    """勝ち側の規則から (a の分類, b の分類, 比較結果) の表を作る"""
+    table = []
+    for a_cat in CATEGORIES:
+        row = []
+        for b_cat in CATEGORIES:
+            # b の勝ち
+            effect, amount, consume_winner, consume_loser = _WIN_RULES[(b_cat, a_cat)]
+            b_win = ClashRule(effect, amount, -1, consume_loser, consume_winner)
+            # 引き分け
+            draw = ClashRule(ClashEffect.NONE, ClashAmount.WINNER, 0, 1, 1)
+            # a の勝ち
+            effect, amount, consume_winner, consume_loser = _WIN_RULES[(a_cat, b_cat)]
+            a_win = ClashRule(effect, amount, 1, consume_winner, consume_loser)
+            row.append([b_win, draw, a_win])
+        table.append(row)
+    return table
+
+
+# マッチの規則表 CLASH_TABLE[a の分類][b の分類][比較結果 + 1]（比較結果: -1, 0, 1）
+CLASH_TABLE = _build_table()
+
+
+def get_clash_rule(a_die: DieSpec, b_die: DieSpec, a_val: int, b_val: int) -> ClashRule:
+    """ダイス1組の比較結果を取得"""
+    return CLASH_TABLE[DICE_CATEGORY[a_die.d_type]][DICE_CATEGORY[b_die.d_type]][(a_val > b_val) - (a_val < b_val) + 1]
+
+
+def get_clash_amount(rule: ClashRule, a_val: int, b_val: int) -> int:
+    """比較結果の効果量"""
+    winner_val, loser_val = (a_val, b_val) if rule.winner > 0 else (b_val, a_val)
+    if rule.amount == ClashAmount.DIFF:
+        return winner_val - loser_val
+    return winner_val
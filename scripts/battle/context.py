@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from scripts.models.dice import VelocityDice
-from scripts.models.card import Card
+from scripts.models.card import CardSpec
 
 
 @dataclass
@@ -9,8 +9,9 @@ class BattleContext:
     戦闘シーンのデータの一時保存用クラス
     """
     selected_vel: VelocityDice | None = None    # 選択中の速度ダイス
-    selected_card: Card | None = None   # 選択中のカード
+    selected_card: CardSpec | None = None   # 選択中のカード
     selected_target_vel: VelocityDice | None = None     # 選択中のターゲット（速度ダイス）
+    plan_hints: dict = field(default_factory=dict)      # 行動候補 key: 味方の速度ダイス, val: list[PlanHint]（評価順）
 
     def clear_selection(self):
         self.selected_vel = None
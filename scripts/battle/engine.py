@@ -0,0 +1,410 @@
+import random
+from dataclasses import dataclass, field
+from scripts.battle.system import ClashType, ClashInfo
+from scripts.battle.clash_rules import ATTACK, DICE_CATEGORY, ClashEffect, get_clash_amount, get_clash_rule
+from scripts.models.dice import VelocityDice, DieSpec
+from scripts.models.unit import Unit, DamageType, HealType
+
+
+@dataclass
+class StepEffect:
+    """1ステップで発生した効果（ダメージ/回復）"""
+    unit: Unit
+    amount: int
+    damage_type: DamageType | None = None   # ダメージの場合
+    heal_type: HealType | None = None       # 回復の場合
+
+
+@dataclass
+class StepResult:
+    """1ステップ結果保持クラス"""
+    clash_type: ClashType
+    is_use_a_index: bool | None
+    is_clash_remaining_dice: bool | None = None
+    a_vel_dice: VelocityDice | None = None
+    b_vel_dice: VelocityDice | None = None
+    a_die: DieSpec | None = None
+    b_die: DieSpec | None = None
+    a_roll: int | None = None
+    b_roll: int | None = None
+    pair_index: int = 0     # 処理中のペアの番号
+    a_index: int = 0        # ステップ開始時のダイス位置
+    b_index: int = 0
+    diff_a_index: int = 0   # 消費したダイス数
+    diff_b_index: int = 0
+    effects: list[StepEffect] = field(default_factory=list)    # 発生した効果
+
+
+@dataclass
+class ResolverPair:
+    """1つの解決単位（マッチ/一方攻撃）"""
+    kind: ClashType
+    a_vel_dice: VelocityDice
+    b_vel_dice: VelocityDice
+
+
+def build_queue(clash_infos: list[ClashInfo]) -> list[ResolverPair]:
+    """マッチ/一方攻撃判定用のリストを取得"""
+    queue: list[ResolverPair] = []
+
+    # マッチするペア
+    clash_pairs = set()
+    for info in clash_infos:
+        attacker = info.attacker
+        defender = info.defender
+
+        # マッチ
+        if info.clash_type == ClashType.CLASH:
+            pair = (min(id(attacker), id(defender)), max(id(attacker), id(defender)))
+            if pair in clash_pairs:
+                continue
+            clash_pairs.add(pair)
+            queue.append(
+                ResolverPair(
+                    kind=ClashType.CLASH,
+                    a_vel_dice=attacker,
+                    b_vel_dice=defender,
+                )
+            )
+        # 一方攻撃
+        elif info.clash_type == ClashType.ONE_SIDED:
+            queue.append(
+                ResolverPair(
+                    kind=ClashType.ONE_SIDED,
+                    a_vel_dice=attacker,
+                    b_vel_dice=defender,
+                )
+            )
+
+    return queue
+
+
+class BattleEngine:
+    """
+    戦闘解決エンジン（pygame非依存）
+
+    ・マッチ/一方攻撃のルールを1ステップ（ダイス1つ）単位で処理
+    ・prepare_step -> roll_step -> apply_step の順に呼び出して進める
+    ・resolve_round で1ラウンド分をまとめて解決
+
+    Args:
+        clash_infos (list[ClashInfo]): マッチ/一方攻撃の情報
+        rng: ダイスロール用の乱数（randint を持つもの）
+    """
+
+    def __init__(self, clash_infos: list[ClashInfo], rng=random):
+        self.queue: list[ResolverPair] = build_queue(clash_infos)
+        self.rng = rng
+        self.queue_index = 0
+
+        # 現在処理中のペアのダイス位置
+        self.a_index = 0
+        self.b_index = 0
+
+        # 現在処理中のペアで振ったダイスの値 key: カードのダイス位置
+        self.a_rolls: dict[int, int] = {}
+        self.b_rolls: dict[int, int] = {}
+
+    @property
+    def current_pair(self) -> ResolverPair | None:
+        if self.queue_index >= len(self.queue):
+            return None
+        return self.queue[self.queue_index]
+
+    def is_finished(self) -> bool:
+        return self.queue_index >= len(self.queue)
+
+    def resolve_round(self) -> list[StepResult]:
+        """残りのマッチ/一方攻撃をまとめて解決し、ステップ結果一覧を返す"""
+        events: list[StepResult] = []
+        while True:
+            res = self.prepare_step()
+            if res is None:
+                break
+            self.roll_step(res)
+            self.apply_step(res)
+            events.append(res)
+        return events
+
+    def prepare_step(self) -> StepResult | None:
+        """次のステップを準備（全て終了した場合は None）"""
+        while self.queue_index < len(self.queue):
+            pair = self.queue[self.queue_index]
+            done, res = self._prepare_one_step(pair)
+
+            # 現在のペアが終了した場合、次のペアへ
+            if done:
+                self.queue_index += 1
+                self.a_index = 0
+                self.b_index = 0
+                self.a_rolls.clear()
+                self.b_rolls.clear()
+                continue
+
+            # 終了していないのに結果がない場合（保存ダイス）
+            if res is None:
+                continue
+
+            res.pair_index = self.queue_index
+            res.a_index = self.a_index
+            res.b_index = self.b_index
+
+            # これから振るダイスの前回の値を消す
+            for rolls, index in self._roll_slots(res):
+                rolls.pop(index, None)
+            return res
+
+        return None
+
+    def roll_step(self, res: StepResult) -> None:
+        """ダイスロールで値を確定"""
+        if res.a_die and res.a_roll is None:
+            res.a_roll = res.a_die.roll(self.rng)
+        if res.b_die and res.b_roll is None:
+            res.b_roll = res.b_die.roll(self.rng)
+
+        slots = self._roll_slots(res)
+        if slots:
+            rolls, index = slots[0]
+            rolls[index] = res.a_roll
+        if len(slots) > 1:
+            rolls, index = slots[1]
+            rolls[index] = res.b_roll
+
+    def _roll_slots(self, res: StepResult) -> list[tuple[dict, int]]:
+        """ステップで振るカードのダイスの保存先 [(a_rolls か b_rolls, ダイス位置)]（保存ダイスは含まない）"""
+        # 保存ダイスとのマッチ（保存ダイス側は記録しない）
+        if res.is_clash_remaining_dice:
+            return [(self.a_rolls, res.a_index)]
+        # マッチ
+        if res.clash_type == ClashType.CLASH:
+            return [(self.a_rolls, res.a_index), (self.b_rolls, res.b_index)]
+        # 一方攻撃（b 側が攻撃する場合は b のダイス）
+        if res.is_use_a_index:
+            return [(self.a_rolls, res.a_index)]
+        return [(self.b_rolls, res.b_index)]
+
+    def apply_step(self, res: StepResult) -> None:
+        """ダメージを適用し、ダイス位置を進める"""
+        # マッチ
+        if res.clash_type == ClashType.CLASH:
+            res.diff_a_index, res.diff_b_index = self._step_clash_apply(res)
+        # 一方攻撃
+        else:
+            res.diff_a_index, res.diff_b_index = self._step_one_sided_apply(res)
+
+        self.a_index += res.diff_a_index
+
+        # 保存ダイスとマッチ時
+        if res.is_clash_remaining_dice:
+            if res.diff_b_index > 0:
+                defender = res.b_vel_dice.owner
+                defender.remaining_dices.pop(0)
+        else:
+            self.b_index += res.diff_b_index
+
+    def _prepare_one_step(self, pair: ResolverPair) -> tuple[bool, StepResult | None]:
+        """1ダイスだけロール処理"""
+
+        # マッチの場合
+        if pair.kind == ClashType.CLASH:
+            return self._step_clash_prepare(pair)
+        # 一方攻撃の場合
+        else:
+            attacker_vel_dice = pair.a_vel_dice
+            defender_vel_dice = pair.b_vel_dice
+
+            # 被攻撃側が守備の保存ダイスを持っている場合、保存ダイスとマッチ準備
+            if defender_vel_dice.owner.remaining_dices:
+                a_dices = attacker_vel_dice.card.dice_list
+
+                # 攻撃側のダイス切れなら終了
+                if self.a_index >= len(a_dices):
+                    return True, None
+
+                b_dices = defender_vel_dice.owner.remaining_dices
+
+                a_die = a_dices[self.a_index]
+                b_die = b_dices[0]
+
+                res = StepResult(
+                    clash_type=ClashType.CLASH,
+                    is_use_a_index=None,
+                    is_clash_remaining_dice=True,
+                    a_vel_dice=attacker_vel_dice,
+                    b_vel_dice=defender_vel_dice,
+                    a_die=a_die,
+                    b_die=b_die,
+                )
+
+                return False, res
+
+            return self._step_one_sided_prepare(attacker_vel_dice, defender_vel_dice, True)
+
+    def _step_clash_prepare(self, pair: ResolverPair) -> tuple[bool, StepResult | None]:
+        """マッチ判定1ダイス分"""
+        # 速度ダイス
+        a_vel_dice = pair.a_vel_dice
+        b_vel_dice = pair.b_vel_dice
+
+        # どちらもダイス切れの場合、終了
+        if self.a_index >= len(a_vel_dice.card.dice_list) and self.b_index >= len(b_vel_dice.card.dice_list):
+            return True, None
+        # どちらか一方のみがダイス切れの場合、一方攻撃
+        else:
+            if self.a_index >= len(a_vel_dice.card.dice_list):
+                return self._step_one_sided_prepare(attacker_vel_dice=b_vel_dice, defender_vel_dice=a_vel_dice, is_use_a_index=False)
+            elif self.b_index >= len(b_vel_dice.card.dice_list):
+                return self._step_one_sided_prepare(attacker_vel_dice=a_vel_dice, defender_vel_dice=b_vel_dice, is_use_a_index=True)
+
+        # ユニット
+        a_unit = a_vel_dice.owner
+        b_unit = b_vel_dice.owner
+
+        # どちらかが死亡している場合、終了
+        if a_unit.is_dead() or b_unit.is_dead():
+            return True, None
+
+        # どちらも混乱状態の場合、終了
+        if a_unit.is_confused() and b_unit.is_confused():
+            return True, None
+        # どちらか一方のみが混乱状態の場合、一方攻撃
+        else:
+            if a_unit.is_confused():
+                return self._step_one_sided_prepare(attacker_vel_dice=b_vel_dice, defender_vel_dice=a_vel_dice, is_use_a_index=False)
+            elif b_unit.is_confused():
+                return self._step_one_sided_prepare(attacker_vel_dice=a_vel_dice, defender_vel_dice=b_vel_dice, is_use_a_index=True)
+
+        # ダイス
+        a_die = a_vel_dice.card.dice_list[self.a_index]
+        b_die = b_vel_dice.card.dice_list[self.b_index]
+
+        res = StepResult(
+            clash_type=ClashType.CLASH,
+            is_use_a_index=None,
+            a_vel_dice=a_vel_dice,
+            b_vel_dice=b_vel_dice,
+            a_die=a_die,
+            b_die=b_die,
+        )
+
+        return False, res
+
+    def _step_one_sided_prepare(self, attacker_vel_dice, defender_vel_dice, is_use_a_index) -> tuple[bool, StepResult | None]:
+        """一方攻撃判定1ダイス分"""
+        idx = self.a_index if is_use_a_index else self.b_index
+
+        # ダイス切れなら終了
+        if idx >= len(attacker_vel_dice.card.dice_list):
+            return True, None
+
+        attacker = attacker_vel_dice.owner
+        defender = defender_vel_dice.owner
+
+        # 攻撃者のダイス
+        a_dices = attacker_vel_dice.card.dice_list
+
+        # 攻撃ダイスがひとつもない場合、保存して終了
+        if not any(DICE_CATEGORY[die.d_type] == ATTACK for die in a_dices):
+            attacker.remaining_dices.extend(a_dices)
+            return True, None
+
+        a_die = a_dices[idx]
+
+        # 攻撃ダイス以外の場合
+        if DICE_CATEGORY[a_die.d_type] != ATTACK:
+            attacker.remaining_dices.append(a_die)
+            if is_use_a_index:
+                self.a_index += 1
+            else:
+                self.b_index += 1
+            return False, None
+
+        # 攻撃者が混乱している場合は終了
+        if attacker.is_confused():
+            return True, None
+
+        # どちらかが死亡していた場合は終了
+        if attacker.is_dead() or defender.is_dead():
+            return True, None
+
+        res = StepResult(
+            clash_type=ClashType.ONE_SIDED,
+            is_use_a_index=is_use_a_index,
+            a_vel_dice=attacker_vel_dice,
+            b_vel_dice=defender_vel_dice,
+            a_die=a_die,
+            b_die=None,
+        )
+
+        return False, res
+
+    def _damage(self, res: StepResult, unit: Unit, damage: int, die: DieSpec) -> None:
+        """HP/混乱耐性ダメージを与える"""
+        hp_damage, confusion_damage = unit.take_damage(damage=damage, dice_type=die.d_type)
+        res.effects.append(StepEffect(unit, hp_damage, damage_type=DamageType.HP))
+        res.effects.append(StepEffect(unit, confusion_damage, damage_type=DamageType.CONFUSION))
+
+    def _confusion_damage(self, res: StepResult, unit: Unit, damage: int, die: DieSpec) -> None:
+        """混乱耐性ダメージのみ与える"""
+        confusion_damage = unit.take_confusion_resist_damage(damage=damage, dice_type=die.d_type)
+        res.effects.append(StepEffect(unit, confusion_damage, damage_type=DamageType.CONFUSION))
+
+    def _heal_confusion(self, res: StepResult, unit: Unit, amount: int) -> None:
+        """混乱耐性を回復する"""
+        unit.heal_confusion_resist(amount=amount)
+        res.effects.append(StepEffect(unit, amount, heal_type=HealType.CONFUSION))
+
+    def _step_clash_apply(self, res: StepResult) -> tuple[int, int]:
+        """マッチの規則表を引いて結果を反映"""
+        a_val = res.a_roll
+        b_val = res.b_roll
+        rule = get_clash_rule(res.a_die, res.b_die, a_val, b_val)
+
+        # 引き分け/効果なし
+        if rule.effect == ClashEffect.NONE:
+            return rule.consume_a, rule.consume_b
+
+        a_unit = res.a_vel_dice.owner
+        b_unit = res.b_vel_dice.owner
+        if rule.winner > 0:
+            winner, loser, winner_die = a_unit, b_unit, res.a_die
+        else:
+            winner, loser, winner_die = b_unit, a_unit, res.b_die
+        amount = get_clash_amount(rule, a_val, b_val)
+
+        if rule.effect == ClashEffect.DAMAGE:
+            self._damage(res, loser, amount, winner_die)
+        elif rule.effect == ClashEffect.CONFUSION_DAMAGE:
+            self._confusion_damage(res, loser, amount, winner_die)
+        elif rule.effect == ClashEffect.HEAL_CONFUSION:
+            self._heal_confusion(res, winner, amount)
+
+        return rule.consume_a, rule.consume_b
+
+    def _step_one_sided_apply(self, res: StepResult) -> tuple[int, int]:
+        diff_a_index = 0
+        diff_b_index = 0
+
+        a_unit = res.a_vel_dice.owner
+        b_unit = res.b_vel_dice.owner
+        a_die = res.a_die
+
+        if res.is_use_a_index:
+            diff_a_index = 1
+        else:
+            diff_b_index = 1
+
+        # 攻撃ダイスの場合
+        if DICE_CATEGORY[a_die.d_type] == ATTACK:
+            self._damage(res, b_unit, res.a_roll, a_die)
+        # 攻撃ダイス以外の場合、使用せずに保存
+        else:
+            a_unit.remaining_dices.append(a_die)
+
+        return diff_a_index, diff_b_index
+
+
+def resolve_round(clash_infos: list[ClashInfo], rng=random) -> list[StepResult]:
+    """1ラウンド分のマッチ/一方攻撃をまとめて解決する"""
+    return BattleEngine(clash_infos, rng).resolve_round()
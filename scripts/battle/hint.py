@@ -0,0 +1,182 @@
+import queue
+import threading
+import time
+from copy import deepcopy
+from dataclasses import dataclass
+from scripts.battle.planner import expected_damage_score
+from scripts.battle.snapshot import SnapshotCodec
+from scripts.models.card import CardSpec
+from scripts.models.dice import VelocityDice
+from scripts.models.unit import Unit
+from scripts.utils.cache import LRUCache
+
+
+@dataclass
+class PlanHint:
+    """味方の行動候補"""
+    card: CardSpec          # カード
+    target: VelocityDice    # ターゲット（敵の速度ダイス）
+    score: float            # 評価値（大きいほど良い）
+
+
+# スレッドを終了させる依頼
+_STOP = object()
+
+
+@dataclass
+class _HintJob:
+    generation: int
+    buf: tuple[int, ...]            # 依頼時の状態（スナップショット）
+    vel_indexes: list[int]          # 候補を求める味方の速度ダイス（スナップショットの通し番号）
+    select_order: int               # 次に設定する選択順
+    hints: dict                     # 結果の書き込み先
+
+
+class HintWorker:
+    """
+    味方の行動候補をバックグラウンドのスレッドで計算する
+
+    ・ユニットの複製を持ち、依頼のたびにスナップショットで実際の状態に合わせてから計算する
+    ・カード未設定の味方の速度ダイスごとに (カード, ターゲット) を1つずつ試し、期待ダメージで順位を付ける
+    ・結果は依頼時に渡した dict（BattleContext.plan_hints）に速度ダイスごとに書き込む
+    ・新しい依頼が来たら途中で打ち切る。同じ状態の結果は使い回す
+    ・メインスレッドは依頼を積むだけで待たない
+    ・使い終わったら close でスレッドを終了させる
+
+    Args:
+        system (BattleSystem): 戦闘システム（マッチ判定のみ使用）
+        units (list[Unit]): 全ユニット
+    """
+
+    def __init__(self, system: "BattleSystem", units: list[Unit]):
+        self.system = system
+        self.units = list(units)
+        self.codec = SnapshotCodec(self.units)
+
+        # スレッド側で書き換えるユニットの複製（速度ダイスの並びやデッキの中身は元と同じ）
+        self.clone_units = deepcopy(self.units)
+        self.clone_codec = SnapshotCodec(self.clone_units)
+        self.profiles = {id(unit): unit.get_resistance_profile() for unit in self.clone_units}
+
+        self._generation = 0
+        self._jobs: queue.Queue = queue.Queue()
+        self._results = LRUCache(maxsize=64)   # key: (状態, 速度ダイス), val: 行動候補
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def restart(self, ally_slots: list[VelocityDice], hints: dict, focus: VelocityDice | None = None, select_order: int = 0) -> None:
+        """
+        現在の状態で計算をやり直す
+
+        Args:
+            ally_slots (list[VelocityDice]): 味方の速度ダイス（速度順）
+            hints (dict): 結果の書き込み先
+            focus (VelocityDice | None): 先に計算する速度ダイス（選択中のもの）
+            select_order (int): 次に設定する選択順
+        """
+        vel_index = self.codec.vel_index
+        targets = [
+            v for v in ally_slots
+            if v.val is not None and v.card is None and not v.owner.is_confused()
+        ]
+        if focus in targets:
+            targets.remove(focus)
+            targets.insert(0, focus)
+
+        self._generation += 1
+        self._jobs.put(_HintJob(
+            generation=self._generation,
+            buf=self.codec.dump(),
+            vel_indexes=[vel_index[id(v)] for v in targets],
+            select_order=select_order,
+            hints=hints,
+        ))
+
+    def cancel(self) -> None:
+        """計算中の依頼を打ち切る"""
+        self._generation += 1
+
+    def close(self) -> None:
+        """計算中の依頼を打ち切り、スレッドを終了させる（終了は待たない）"""
+        self.cancel()
+        self._jobs.put(_STOP)
+
+    def _is_cancelled(self, job: _HintJob) -> bool:
+        return job.generation != self._generation
+
+    def _run(self) -> None:
+        clone_codec = self.clone_codec
+
+        while True:
+            job = self._jobs.get()
+            # 溜まっている場合は最新の依頼だけ処理（終了の依頼があれば終了）
+            while job is not _STOP and not self._jobs.empty():
+                job = self._jobs.get()
+            if job is _STOP:
+                return
+            if self._is_cancelled(job):
+                continue
+
+            clone_codec.load(job.buf)
+            all_slots = self.system.get_action_order(self.clone_units)
+            enemy_slots = [v for v in all_slots if not v.owner.is_ally]
+
+            for i in job.vel_indexes:
+                key = (job.buf, i)
+                hints = self._results.get(key)
+                if hints is None:
+                    hints = self._rank(job, clone_codec.vel_dice_list[i], enemy_slots, all_slots)
+                    if hints is None:
+                        break
+                    self._results.put(key, hints)
+
+                if self._is_cancelled(job):
+                    break
+                live_vel = self.codec.vel_dice_list[i]
+                job.hints[live_vel] = self._to_live(live_vel, hints)
+
+    def _rank(self, job: _HintJob, vel_dice: VelocityDice, enemy_slots, all_slots) -> list[tuple[int, int, float]] | None:
+        """1つの速度ダイスの行動候補 [(カード番号, ターゲットの通し番号, 評価値)]（打ち切った場合は None）"""
+        clone_codec = self.clone_codec
+        unit = vel_dice.owner
+        vel_index = clone_codec.vel_index
+        card_index = next(index for u, index in zip(clone_codec.units, clone_codec.card_index) if u is unit)
+
+        # 同じカードは先頭のスロットだけ（スロットは load し直しても変わらない）
+        cards = []
+        for slot, card in unit.deck.hand_slots():
+            if unit.can_play_card(card) and all(c.id != card.id for _, c in cards):
+                cards.append((slot, card))
+
+        ranked = []
+        for slot, card in cards:
+            for target in enemy_slots:
+                if self._is_cancelled(job):
+                    return None
+
+                unit.pay_light(card.cost)
+                unit.deck.remove_slot(slot)
+                vel_dice.card = card
+                vel_dice.target = target
+                vel_dice.select_order = job.select_order
+
+                score = expected_damage_score(self.system, all_slots, self.profiles, is_ally_side=True)
+                ranked.append((card_index[id(card)], vel_index[id(target)], score))
+
+                clone_codec.load(job.buf)
+
+                # メインスレッドに処理を譲る
+                time.sleep(0)
+
+        ranked.sort(key=lambda r: r[2], reverse=True)
+        return ranked
+
+    def _to_live(self, vel_dice: VelocityDice, ranked: list[tuple[int, int, float]]) -> list[PlanHint]:
+        """番号から実際のカード/速度ダイスに戻す"""
+        cards = vel_dice.owner.deck.card_list
+        vel_dice_list = self.codec.vel_dice_list
+        return [
+            PlanHint(card=cards[card_i], target=vel_dice_list[target_i], score=score)
+            for card_i, target_i, score in ranked
+        ]
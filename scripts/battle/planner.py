@@ -0,0 +1,342 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from scripts.battle.snapshot import SnapshotCodec
+from scripts.models.dice import VelocityDice
+from scripts.battle.clash_exact import get_expected_clash_damage, get_expected_one_sided_damage
+
+
+# 混乱耐性ダメージの評価の重み
+CONFUSION_WEIGHT = 0.5
+# 倒せる見込みの場合の加点
+KILL_BONUS = 10.0
+
+
+class Difficulty(Enum):
+    EASY = "easy"       # ランダム
+    NORMAL = "normal"   # MCTS（10ms）
+    HARD = "hard"       # MCTS（30ms）
+
+
+@dataclass
+class PlanStats:
+    """行動決定の探索結果"""
+    iterations: int     # 探索回数
+    elapsed: float      # 経過時間（秒）
+
+    @property
+    def iterations_per_second(self) -> float:
+        return self.iterations / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def expected_damage_score(system: "BattleSystem", all_slots: list[VelocityDice], profiles: dict, is_ally_side: bool = False) -> float:
+    """
+    現在の行動決定の評価値（相手陣営の損害 - 自陣営の損害）
+
+    マッチ/一方攻撃ごとの期待ダメージを合計し、HPと混乱耐性の残りで頭打ちにする
+
+    Args:
+        profiles (dict): key: ユニットのID, val: 耐性プロファイル
+        is_ally_side (bool): 評価する陣営（True: 味方, False: 敵）
+    """
+    damage: dict = {}   # key: ユニットのID, val: [ユニット, HPダメージ, 混乱耐性ダメージ]
+    counted = set()
+
+    for info in system.evaluate_clashes(all_slots):
+        a, d = info.attacker, info.defender
+        a_unit, d_unit = a.owner, d.owner
+
+        if system.is_clash(info):
+            # マッチは両方向の情報があるので片方だけ数える
+            if id(d) in counted:
+                continue
+            counted.add(id(a))
+            a_hp, a_conf, d_hp, d_conf = get_expected_clash_damage(a.card, d.card, profiles[id(a_unit)], profiles[id(d_unit)])
+            total = damage.setdefault(id(a_unit), [a_unit, 0.0, 0.0])
+            total[1] += a_hp
+            total[2] += a_conf
+        else:
+            d_hp, d_conf = get_expected_one_sided_damage(a.card, profiles[id(d_unit)])
+
+        total = damage.setdefault(id(d_unit), [d_unit, 0.0, 0.0])
+        total[1] += d_hp
+        total[2] += d_conf
+
+    score = 0.0
+    for unit, hp_damage, confusion_damage in damage.values():
+        value = min(hp_damage, unit.hp) + CONFUSION_WEIGHT * min(confusion_damage, unit.confusion_resist)
+        if not unit.is_dead() and hp_damage >= unit.hp:
+            value += KILL_BONUS
+        score += value if unit.is_ally != is_ally_side else -value
+
+    return score
+
+
+class EnemyPlanner(ABC):
+    """
+    敵の行動決定（速度ダイスにカードとターゲットを設定する）
+    """
+
+    def __init__(self):
+        self.last_stats: PlanStats | None = None   # 直前の探索結果（探索しない場合は None）
+
+    def prepare(self, units: list["Unit"]) -> None:
+        """戦闘開始時の準備（必要な場合のみ）"""
+        pass
+
+    @abstractmethod
+    def plan(self, system: "BattleSystem", enemy_slots: list[VelocityDice], ally_slots: list[VelocityDice]) -> None:
+        pass
+
+
+class RandomPlanner(EnemyPlanner):
+    """
+    プレイできるカードとターゲットをランダムに選ぶ
+    """
+
+    def plan(self, system: "BattleSystem", enemy_slots: list[VelocityDice], ally_slots: list[VelocityDice]) -> None:
+
+        # 速度ダイス順でターゲット選択
+        for vel_dice in enemy_slots:
+            # ダイスが振られていない場合はスキップ
+            if vel_dice.val is None:
+                continue
+
+            # ダイスの所有者
+            enemy = vel_dice.owner
+
+            # 混乱している場合はスキップ
+            if enemy.is_confused():
+                continue
+
+            # プレイできるカードのみ抽出（同じカードが複数ある場合は先頭のスロットから取り除く）
+            playable_cards = []
+            slots = {}
+            for slot, card in enemy.deck.hand_slots():
+                if enemy.can_play_card(card):
+                    playable_cards.append(card)
+                    slots.setdefault(id(card), slot)
+
+            # プレイできるカードがない場合はスキップ
+            if len(playable_cards) <= 0:
+                continue
+
+            # カードをランダムに選択
+            card = system.rng.ai.choice(playable_cards)
+            if not enemy.pay_light(card.cost):
+                continue
+            enemy.deck.remove_slot(slots[id(card)])
+            vel_dice.card = card
+
+            # ターゲットをランダムに選択
+            target = system.rng.ai.choice(ally_slots)
+            vel_dice.target = target
+
+
+class _Node:
+    """探索木のノード"""
+    __slots__ = ("children", "untried", "visits", "value")
+
+    def __init__(self):
+        self.children: dict = {}    # key: 行動, val: 子ノード
+        self.untried: list | None = None    # 未展開の行動（初回訪問時に作成）
+        self.visits = 0
+        self.value = 0.0
+
+
+class MctsPlanner(EnemyPlanner):
+    """
+    モンテカルロ木探索で敵の行動を決める
+
+    ・速度順に各速度ダイスの (カード, ターゲット) を1段ずつ決める木を探索する
+    ・プレイアウトは残りの敵と味方の行動をランダムに決め、マッチ/一方攻撃の期待ダメージで評価する
+    ・探索中はユニットを直接書き換え、1回ごとにスナップショットで元に戻す
+    ・制限時間で探索を打ち切るので、探索回数（結果）は実行環境によって変わる
+
+    Args:
+        time_budget (float): 探索の制限時間（秒）
+        max_iterations (int | None): 探索回数の上限（None の場合は制限時間のみ）
+        exploration (float): UCB1 の探索係数
+    """
+
+    # 評価値を 0〜1 に変換する際の尺度
+    REWARD_SCALE = 10.0
+
+    def __init__(self, time_budget: float = 0.03, max_iterations: int | None = None, exploration: float = 1.4):
+        super().__init__()
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.exploration = exploration
+        self.rng = None     # 探索用の乱数（初回に BattleRng から派生）
+        self._pending: list[tuple] = []    # まだ求めていない期待ダメージ (関数, 引数)
+
+    def prepare(self, units: list["Unit"]) -> None:
+        """
+        探索中に計算が入らないよう、全カードの組み合わせの期待ダメージを求める準備
+
+        ・キャッシュは (カード, 耐性) ごとなので、同じ組み合わせは1つにまとめる
+        ・戦闘開始時には計算せず、plan() の制限時間の中で少しずつ求める
+        """
+        sides: dict[bool, tuple[dict, set]] = {}   # key: 味方か, val: ({カードID: カード}, 耐性の集合)
+        for unit in units:
+            cards, profiles = sides.setdefault(unit.is_ally, ({}, set()))
+            for card in unit.deck.card_list:
+                cards.setdefault(card.id, card)
+            profiles.add(unit.get_resistance_profile())
+
+        pending = {}
+        for is_ally, (a_cards, a_profiles) in sides.items():
+            b_cards, b_profiles = sides.get(not is_ally, ({}, set()))
+            for a_profile in a_profiles:
+                for b_profile in b_profiles:
+                    for a_card in a_cards.values():
+                        pending.setdefault(("one_sided", a_card.id, b_profile), (get_expected_one_sided_damage, (a_card, b_profile)))
+                        for b_card in b_cards.values():
+                            key = ("clash", a_card.id, b_card.id, a_profile, b_profile)
+                            pending.setdefault(key, (get_expected_clash_damage, (a_card, b_card, a_profile, b_profile)))
+        self._pending = list(pending.values())
+
+    def _fill_pending(self, deadline: float) -> None:
+        """prepare で準備した期待ダメージを deadline まで求める"""
+        while self._pending and time.perf_counter() < deadline:
+            func, args = self._pending.pop()
+            func(*args)
+
+    def plan(self, system: "BattleSystem", enemy_slots: list[VelocityDice], ally_slots: list[VelocityDice]) -> None:
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        if self.rng is None:
+            self.rng = system.rng.split("mcts")
+
+        # 残りの期待ダメージを制限時間の半分まで求める（求めていないものは探索中に計算する）
+        self._fill_pending(start + self.time_budget / 2)
+
+        # 行動する速度ダイス
+        slots = [v for v in enemy_slots if v.val is not None and not v.owner.is_confused()]
+        if not slots or not ally_slots:
+            self.last_stats = PlanStats(iterations=0, elapsed=time.perf_counter() - start)
+            return
+
+        units = list({id(v.owner): v.owner for v in ally_slots + enemy_slots}.values())
+        all_slots = system.get_action_order(units)
+        profiles = {id(unit): unit.get_resistance_profile() for unit in units}
+
+        codec = SnapshotCodec(units)
+        saved = codec.dump()
+
+        # 行動を決める陣営（味方の行動決定に使う場合もある）
+        is_ally_side = slots[0].owner.is_ally
+
+        root = _Node()
+        iterations = 0
+        while time.perf_counter() < deadline:
+            if self.max_iterations is not None and iterations >= self.max_iterations:
+                break
+            self._iterate(system, root, slots, enemy_slots, ally_slots, all_slots, profiles, is_ally_side)
+            codec.load(saved)
+            iterations += 1
+
+        # 訪問回数が最も多い行動を順にたどる
+        node = root
+        for vel_dice in slots:
+            if node is not None and node.children:
+                action, node = max(node.children.items(), key=lambda item: item[1].visits)
+            else:
+                node = None
+                action = self.rng.choice(self._legal_actions(vel_dice, ally_slots))
+            self._apply(vel_dice, action, ally_slots)
+
+        self.last_stats = PlanStats(iterations=iterations, elapsed=time.perf_counter() - start)
+
+    def _iterate(self, system, root: _Node, slots, enemy_slots, ally_slots, all_slots, profiles, is_ally_side: bool) -> None:
+        """選択 → 展開 → プレイアウト → 逆伝播 を1回行う"""
+        node = root
+        path = [root]
+        depth = 0
+
+        # 選択/展開
+        while depth < len(slots):
+            vel_dice = slots[depth]
+            if node.untried is None:
+                node.untried = self._legal_actions(vel_dice, ally_slots)
+                self.rng.shuffle(node.untried)
+
+            # 未展開の行動があれば展開して終了
+            if node.untried:
+                action = node.untried.pop()
+                child = _Node()
+                node.children[action] = child
+                self._apply(vel_dice, action, ally_slots)
+                path.append(child)
+                depth += 1
+                break
+
+            action, node = self._select(node)
+            self._apply(vel_dice, action, ally_slots)
+            path.append(node)
+            depth += 1
+
+        # プレイアウト（残りの敵の行動）
+        for vel_dice in slots[depth:]:
+            self._apply(vel_dice, self.rng.choice(self._legal_actions(vel_dice, ally_slots)), ally_slots)
+
+        # プレイアウト（味方の行動）
+        for vel_dice in ally_slots:
+            if vel_dice.val is None or vel_dice.owner.is_confused():
+                continue
+            action = self.rng.choice(self._legal_actions(vel_dice, enemy_slots))
+            self._apply(vel_dice, action, enemy_slots)
+
+        reward = self._evaluate(system, all_slots, profiles, is_ally_side)
+
+        # 逆伝播
+        for n in path:
+            n.visits += 1
+            n.value += reward
+
+    def _select(self, node: _Node) -> tuple:
+        """UCB1 で子ノードを選択"""
+        log_n = math.log(node.visits)
+        c = self.exploration
+        return max(
+            node.children.items(),
+            key=lambda item: item[1].value / item[1].visits + c * math.sqrt(log_n / item[1].visits),
+        )
+
+    def _legal_actions(self, vel_dice: VelocityDice, targets: list[VelocityDice]) -> list:
+        """行動 (カードID, ターゲット番号) の一覧（プレイできるカードがない場合は None のみ）"""
+        unit = vel_dice.owner
+        card_ids = []
+        for card in unit.deck.hand_cards:
+            if card.id not in card_ids and unit.can_play_card(card):
+                card_ids.append(card.id)
+        actions = [(card_id, i) for card_id in card_ids for i in range(len(targets))]
+        return actions or [None]
+
+    def _apply(self, vel_dice: VelocityDice, action, targets: list[VelocityDice]) -> None:
+        """行動を速度ダイスに反映"""
+        if action is None:
+            return
+        card_id, target_index = action
+        unit = vel_dice.owner
+        slot, card = next((slot, card) for slot, card in unit.deck.hand_slots() if card.id == card_id)
+        unit.pay_light(card.cost)
+        unit.deck.remove_slot(slot)
+        vel_dice.card = card
+        vel_dice.target = targets[target_index]
+
+    def _evaluate(self, system, all_slots: list[VelocityDice], profiles: dict, is_ally_side: bool) -> float:
+        """期待ダメージから行動を決める陣営の評価値（0〜1）を求める"""
+        score = expected_damage_score(system, all_slots, profiles, is_ally_side)
+        return 0.5 + 0.5 * math.tanh(score / self.REWARD_SCALE)
+
+
+def create_planner(difficulty: Difficulty) -> EnemyPlanner:
+    """難易度に応じた行動決定を作成"""
+    if difficulty == Difficulty.NORMAL:
+        return MctsPlanner(time_budget=0.01)
+    if difficulty == Difficulty.HARD:
+        return MctsPlanner(time_budget=0.03)
+    return RandomPlanner()
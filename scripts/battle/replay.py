@@ -0,0 +1,183 @@
+import json
+from dataclasses import dataclass
+from scripts.models.dice import VelocityDice
+
+
+# リプレイファイルの形式バージョン（読み込めるのはこのバージョンのみ）
+# 3: 味方と敵の行動、編成の大きさ（1陣営のユニット数, ユニットごとの速度ダイスの数）
+REPLAY_VERSION = 3
+
+
+@dataclass
+class PlanDecision:
+    """味方の行動決定1つ分"""
+    vel: tuple[str, int]        # 速度ダイス (ユニット名, 番号)
+    card: str                   # カードID
+    target: tuple[str, int]     # ターゲットの速度ダイス (ユニット名, 番号)
+    order: int                  # 選択順
+
+
+@dataclass
+class ReplayRound:
+    """1ラウンド分の行動決定"""
+    ally: list[PlanDecision]
+    enemy: list[PlanDecision]
+
+
+@dataclass
+class Replay:
+    """
+    戦闘のリプレイ
+
+    シードと編成の大きさ、ラウンドごとの行動決定だけを持ち、それ以外は乱数から再現する
+    """
+    seed: int | str
+    rounds: list[ReplayRound]
+    units: int                  # 1陣営のユニット数
+    velocity_dice_count: int    # ユニットごとの速度ダイスの数
+
+
+def vel_key(vel_dice: VelocityDice) -> tuple[str, int]:
+    """速度ダイスを (ユニット名, 番号) で表す"""
+    owner = vel_dice.owner
+    return owner.name, owner.velocity_dice_list.index(vel_dice)
+
+
+def collect_plan(ally_slots: list[VelocityDice]) -> list[PlanDecision]:
+    """味方の速度ダイスから行動決定を取得"""
+    decisions = []
+    for vel_dice in ally_slots:
+        if vel_dice.card is None or vel_dice.target is None:
+            continue
+        decisions.append(
+            PlanDecision(
+                vel=vel_key(vel_dice),
+                card=vel_dice.card.id,
+                target=vel_key(vel_dice.target),
+                order=vel_dice.select_order,
+            )
+        )
+    return decisions
+
+
+def apply_plan(decisions: list[PlanDecision], all_slots: list[VelocityDice]) -> None:
+    """
+    行動決定を速度ダイスに反映（AllyPlanState のカード選択/ターゲット選択と同じ処理）
+
+    Raises:
+        ValueError: 記録された速度ダイスが存在しない場合（編成が記録時と異なる）
+    """
+    slots = {vel_key(vel_dice): vel_dice for vel_dice in all_slots}
+
+    for decision in decisions:
+        vel_dice = slots.get(tuple(decision.vel))
+        target = slots.get(tuple(decision.target))
+        if vel_dice is None or target is None:
+            missing = decision.vel if vel_dice is None else decision.target
+            raise ValueError(f"リプレイの速度ダイスが見つかりません: {missing}（編成が記録時と異なります）")
+
+        ally = vel_dice.owner
+        slot, card = next(((slot, c) for slot, c in ally.deck.hand_slots() if c.id == decision.card), (None, None))
+        if card is None or not ally.can_play_card(card):
+            continue
+        if not ally.pay_light(card.cost):
+            continue
+
+        vel_dice.card = card
+        ally.deck.remove_slot(slot)
+        vel_dice.target = target
+        vel_dice.select_order = decision.order
+
+
+class ReplayRecorder:
+    """
+    リプレイの記録（JSONL）
+
+    1行目にシードと編成の大きさ、以降はラウンドごとに1行ずつ追記する
+
+    Args:
+        path (str): 保存先
+        seed (int | str): 戦闘のシード
+        units (int): 1陣営のユニット数
+        velocity_dice_count (int): ユニットごとの速度ダイスの数
+    """
+
+    def __init__(self, path: str, seed: int | str, units: int, velocity_dice_count: int):
+        self.path = path
+        header = {"version": REPLAY_VERSION, "seed": seed, "units": units, "dice": velocity_dice_count}
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+
+    def record_round(self, ally_slots: list[VelocityDice], enemy_slots: list[VelocityDice]) -> None:
+        """ラウンドの行動決定を追記"""
+        plans = {
+            "ally": _encode_plan(collect_plan(ally_slots)),
+            "enemy": _encode_plan(collect_plan(enemy_slots)),
+        }
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(plans, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+class ReplayPlayer:
+    """
+    リプレイの再生（ラウンドごとに行動決定を取り出す）
+
+    Args:
+        replay (Replay): リプレイ
+    """
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self.round_index = 0
+        self.current_round: ReplayRound | None = None   # 再生中のラウンド
+
+    def is_finished(self) -> bool:
+        return self.round_index >= len(self.replay.rounds)
+
+    def next_round(self) -> ReplayRound | None:
+        """次のラウンドの行動決定（全て再生済みの場合は None）"""
+        if self.is_finished():
+            self.current_round = None
+            return None
+        self.current_round = self.replay.rounds[self.round_index]
+        self.round_index += 1
+        return self.current_round
+
+
+def _encode_plan(decisions: list[PlanDecision]) -> list:
+    return [[list(d.vel), d.card, list(d.target), d.order] for d in decisions]
+
+
+def _decode_plan(plans: list) -> list[PlanDecision]:
+    return [
+        PlanDecision(vel=tuple(vel), card=card, target=tuple(target), order=order)
+        for vel, card, target, order in plans
+    ]
+
+
+def load_replay(path: str) -> Replay:
+    """
+    リプレイを読み込む
+
+    Raises:
+        ValueError: REPLAY_VERSION 以外の形式の場合
+    """
+    with open(path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        version = header.get("version")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"未対応のリプレイ形式です: {version}（対応: {REPLAY_VERSION}）")
+
+        rounds = []
+        for line in f:
+            if not line.strip():
+                continue
+            plans = json.loads(line)
+            rounds.append(ReplayRound(ally=_decode_plan(plans["ally"]), enemy=_decode_plan(plans["enemy"])))
+
+    return Replay(
+        seed=header["seed"],
+        rounds=rounds,
+        units=header["units"],
+        velocity_dice_count=header["dice"],
+    )
@@ -0,0 +1,90 @@
+import os
+import random
+import struct
+from itertools import islice
+
+
+class RandomStream:
+    """
+    乱数をまとめて生成しておき、1つずつ取り出す乱数列
+
+    random モジュールと同じ randint / choice / shuffle と、まとめて取り出す randints を持つ
+
+    Args:
+        seed: シード（同じシードなら全プロセスで同じ乱数列になる）
+        block_size (int): 1回にまとめて生成する個数
+    """
+
+    def __init__(self, seed, block_size: int = 1024):
+        self._random = random.Random(seed)
+        self.block_size = block_size
+
+        # 最初の呼び出し時に生成
+        self._iter = iter(())
+        self._next = self._iter.__next__
+
+    def _refill(self) -> None:
+        """32bitの乱数をまとめて生成"""
+        n = self.block_size
+        data = self._random.getrandbits(32 * n).to_bytes(4 * n, "little")
+        self._iter = iter(struct.unpack(f"<{n}I", data))
+        self._next = self._iter.__next__
+
+    def randint(self, a: int, b: int) -> int:
+        """a 以上 b 以下の整数"""
+        try:
+            x = self._next()
+        except StopIteration:
+            self._refill()
+            x = self._next()
+        return a + ((x * (b - a + 1)) >> 32)
+
+    def _take(self, n: int) -> list[int]:
+        """32bitの乱数を n 個まとめて取り出す（足りない場合は生成し直す）"""
+        out = list(islice(self._iter, n))
+        while len(out) < n:
+            self._refill()
+            out.extend(islice(self._iter, n - len(out)))
+        return out
+
+    def randints(self, a: int, b: int, n: int) -> list[int]:
+        """a 以上 b 以下の整数を n 個まとめて取得（randint を n 回呼んだ場合と同じ値）"""
+        span = b - a + 1
+        return [a + ((x * span) >> 32) for x in self._take(n)]
+
+    def choice(self, seq):
+        return seq[self.randint(0, len(seq) - 1)]
+
+    def shuffle(self, seq: list) -> None:
+        """Fisher–Yates でシャッフル（乱数はまとめて取り出す、randint で入れ替え先を決めた場合と同じ結果）"""
+        n = len(seq)
+        if n < 2:
+            return
+        for i, x in zip(range(n - 1, 0, -1), self._take(n - 1)):
+            j = (x * (i + 1)) >> 32
+            seq[i], seq[j] = seq[j], seq[i]
+
+
+class BattleRng:
+    """
+    戦闘ごとの乱数
+
+    用途ごとに独立した乱数列を持つので、一方の呼び出し回数が変わっても他方に影響しない
+
+    Args:
+        seed (int | str | None): シード（None の場合はランダムに決める）
+    """
+
+    def __init__(self, seed: int | str | None = None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.seed = seed
+
+        self.speed = self.split("speed")    # 速度ダイス
+        self.dice = self.split("dice")      # カードのダイス
+        self.deck = self.split("deck")      # 山札のシャッフル
+        self.ai = self.split("ai")          # 敵の行動決定
+
+    def split(self, name: str) -> RandomStream:
+        """用途名から派生した乱数列を作成"""
+        return RandomStream(f"{self.seed}/{name}")
@@ -0,0 +1,110 @@
+from array import array
+from scripts.models.unit import Unit
+
+
+class SnapshotCodec:
+    """
+    戦闘状態のスナップショット（int のタプル）の作成/復元
+
+    ・カードやダイスはデッキ内の番号、速度ダイスは全体の番号で保存する
+    ・復元は同じユニットのオブジェクトに対して状態だけを書き戻す
+    ・乱数の状態は含まない
+    ・ファイルに保存する場合は encode_snapshot / decode_snapshot でバイト列にする
+
+    ユニットごとの配置:
+        HP, 混乱耐性, 光,
+        山札の枚数, 山札のカード番号...,
+        手札の枚数, 手札のカード番号...,
+        保存ダイスの数, 保存ダイスの番号...,
+        速度ダイスごとに (値, カード番号, ターゲット番号, チェック済み, 選択順)
+        （None は -1）
+
+    Args:
+        units (list[Unit]): 対象のユニット一覧
+    """
+
+    def __init__(self, units: list[Unit]):
+        self.units = list(units)
+
+        # 速度ダイスの通し番号
+        self.vel_dice_list = [vel_dice for unit in self.units for vel_dice in unit.velocity_dice_list]
+        self.vel_index = {id(vel_dice): i for i, vel_dice in enumerate(self.vel_dice_list)}
+
+        # デッキごとのカード/ダイスの番号
+        self.card_index: list[dict[int, int]] = []
+        self.die_list: list[list] = []
+        self.die_index: list[dict[int, int]] = []
+        for unit in self.units:
+            cards = unit.deck.card_list
+            dices = [die for card in cards for die in card.dice_list]
+            self.card_index.append({id(card): i for i, card in enumerate(cards)})
+            self.die_list.append(dices)
+            self.die_index.append({id(die): i for i, die in enumerate(dices)})
+
+    def dump(self) -> tuple[int, ...]:
+        """現在の状態を保存"""
+        buf = []
+        extend = buf.extend
+        vel_index = self.vel_index
+        for unit, card_index, die_index in zip(self.units, self.card_index, self.die_index):
+            deck = unit.deck
+            draw_pile = deck.draw_pile
+            hand_cards = deck.hand_cards
+            remaining_dices = unit.remaining_dices
+            extend((unit.hp, unit.confusion_resist, unit.light, len(draw_pile)))
+            extend(map(card_index.__getitem__, map(id, draw_pile)))
+            buf.append(len(hand_cards))
+            extend(map(card_index.__getitem__, map(id, hand_cards)))
+            buf.append(len(remaining_dices))
+            if remaining_dices:
+                extend(map(die_index.__getitem__, map(id, remaining_dices)))
+            for vel_dice in unit.velocity_dice_list:
+                val, card, target = vel_dice.val, vel_dice.card, vel_dice.target
+                extend((
+                    -1 if val is None else val,
+                    -1 if card is None else card_index[id(card)],
+                    -1 if target is None else vel_index[id(target)],
+                    vel_dice.is_checked,
+                    vel_dice.select_order,
+                ))
+        return tuple(buf)
+
+    def load(self, buf: tuple[int, ...]) -> None:
+        """保存した状態に戻す"""
+        pos = 0
+        vel_dice_list = self.vel_dice_list
+        for unit, die_list in zip(self.units, self.die_list):
+            deck = unit.deck
+            cards = deck.card_list
+            unit.hp, unit.confusion_resist, unit.light, n = buf[pos:pos + 4]
+            pos += 4
+            deck.draw_pile = list(map(cards.__getitem__, buf[pos:pos + n]))
+            pos += n
+            n = buf[pos]
+            pos += 1
+            deck.hand_cards = list(map(cards.__getitem__, buf[pos:pos + n]))
+            pos += n
+            n = buf[pos]
+            pos += 1
+            unit.remaining_dices = list(map(die_list.__getitem__, buf[pos:pos + n])) if n else []
+            pos += n
+            for vel_dice in unit.velocity_dice_list:
+                val, card, target, is_checked, select_order = buf[pos:pos + 5]
+                pos += 5
+                vel_dice.val = None if val < 0 else val
+                vel_dice.card = None if card < 0 else cards[card]
+                vel_dice.target = None if target < 0 else vel_dice_list[target]
+                vel_dice.is_checked = is_checked != 0
+                vel_dice.select_order = select_order
+
+
+def encode_snapshot(buf: tuple[int, ...]) -> bytes:
+    """スナップショットをバイト列に変換（クイックセーブ用）"""
+    return array("i", buf).tobytes()
+
+
+def decode_snapshot(data: bytes) -> tuple[int, ...]:
+    """バイト列からスナップショットに戻す"""
+    buf = array("i")
+    buf.frombytes(data)
+    return tuple(buf)
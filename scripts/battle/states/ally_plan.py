@@ -1,9 +1,12 @@
-import pygame
-import math
 from enum import Enum, auto
 from scripts.battle.states.base import BattleState
 from scripts.ui.battle.card import CardView
 from scripts.ui.battle.hand import HandView
+from scripts.battle.replay import apply_plan
+from scripts.battle.hint import HintWorker
+from scripts.battle.clash_graph import ClashGraph
+from scripts.ui.battle.clash_overlay import ClashOverlay
+from scripts.utils.draw import draw_text, render_text
 
 
 class AllyPlanPhase(Enum):
@@ -28,8 +31,10 @@ class AllyPlanState(BattleState):
         self.phase = AllyPlanPhase.SELECT_VELOCITY  # 初期フェーズ
         self.scene.context.clear_selection()    # 初期化
 
-        # 一方攻撃/マッチの判定
-        self.scene.clash_infos = self.scene.system.evaluate_clashes(self.scene.all_slots)
+        # 一方攻撃/マッチの判定（以降は変更した速度ダイスの分だけ更新）
+        self.clash_graph = ClashGraph(self.scene.all_slots)
+        self.scene.clash_infos = self.clash_graph.infos()
+        self.clash_overlay = ClashOverlay(self.scene)
 
         self.pinned_vel = None  # クリックで固定した味方Vel
         self.pinned_hand = False    # 手札固定判定
@@ -43,10 +48,36 @@ class AllyPlanState(BattleState):
         )
         self.hand_cards_owner = None  # 今表示している手札の持ち主(Unit)
 
+        # ホバーした速度ダイスのカードUI（カードか位置が変わった時だけ作り直す）
+        self.hovered_card_view: CardView | None = None
+
+        # このフレームの表示内容（layer_key で求めたものを render でも使う、update で破棄）
+        self._frame_view = None
+
+        # 差分更新用に描いた要素 (キー, 範囲, 状態)
+        self.drawn_items = []
+
         # 速度ダイス設定カウント
         self.plan_counter = 0
 
+        # 行動候補の計算を開始（リプレイ再生中は不要）
+        if not self.scene.replay_player:
+            if self.scene.hint_worker is None:
+                self.scene.hint_worker = HintWorker(self.scene.system, self.scene.allies + self.scene.enemies)
+            self._restart_hints()
+
+        # リプレイ再生中は記録された行動を反映して次へ
+        if self.scene.replay_player:
+            replay_round = self.scene.replay_player.current_round
+            if replay_round is not None:
+                apply_plan(replay_round.ally, self.scene.all_slots)
+                self._go_next_state()
+
     def exit(self) -> None:
+        # 行動候補の計算を中止
+        if self.scene.hint_worker:
+            self.scene.hint_worker.cancel()
+        self.scene.context.plan_hints = {}
         print("Exit: AllyPlanState")
 
     def handle(self) -> None:
@@ -76,9 +107,10 @@ class AllyPlanState(BattleState):
                         self._refund_card_to_hand(clicked_vel)
 
                         # マッチ判定更新
-                        self.scene.clash_infos = self.scene.system.evaluate_clashes(self.scene.all_slots)
+                        self._update_clashes(clicked_vel)
 
                     self.scene.context.selected_vel = clicked_vel   # クリックした速度ダイス保存
+                    self._restart_hints()
                     self.pinned_vel = clicked_vel   # 手札を表示する対象の速度ダイス
                     self.pinned_hand = True         # 手札固定判定
                     self.selected_hand_card = None  # 選択した手札のカードを初期化
@@ -111,8 +143,9 @@ class AllyPlanState(BattleState):
                 self.scene.context.selected_card = clicked_card
                 self.selected_hand_card = clicked_card
 
-                # 手札から選択したカードを削除
-                ally.deck.remove_card(clicked_card)
+                # 手札から選択したカードを削除（同じカードが複数ある場合は先頭のスロット）
+                slot = next(slot for slot, card in ally.deck.hand_slots() if card is clicked_card)
+                ally.deck.remove_slot(slot)
 
                 # 次のフェーズ（ターゲット選択）に遷移
                 self.phase = AllyPlanPhase.SELECT_TARGET
@@ -137,10 +170,11 @@ class AllyPlanState(BattleState):
                     self.plan_counter += 1
 
                     # マッチ判定更新
-                    self.scene.clash_infos = self.scene.system.evaluate_clashes(self.scene.all_slots)
+                    self._update_clashes(vel_dice)
 
                     # 次の速度へ
                     self._finish_current_vel_and_next()
+                    self._restart_hints()
                 return
 
         if self.scene.game.inputs["right_click_down"]:
@@ -160,7 +194,8 @@ class AllyPlanState(BattleState):
                     # カードを戻す
                     self._refund_card_to_hand(vel_dice)
                     # マッチ判定更新
-                    self.scene.clash_infos = self.scene.system.evaluate_clashes(self.scene.all_slots)
+                    self._update_clashes(vel_dice)
+                    self._restart_hints()
 
                 # 選択したカード初期化
                 self.scene.context.selected_card = None
@@ -171,33 +206,29 @@ class AllyPlanState(BattleState):
                 return
 
     def update(self, dt: float) -> None:
-        pass
+        self._frame_view = None
 
     def render(self, surface) -> None:
-        # ホバー情報
-        hovered_ally_vel = None
-        hovered_card = None
-
-        hovered_vel_dice_ui = self._get_hovered_vel_dice_ui(self.scene.game.mouse_pos)
-        if hovered_vel_dice_ui:
-            vel = hovered_vel_dice_ui.velocity_dice
-            if vel.owner.is_ally:
-                hovered_ally_vel = vel
-                hovered_card = vel.card  # None か Card
-
-        # 手札の持ち主（固定があれば固定優先）
-        hand_owner = None
-        if self.pinned_hand and self.pinned_vel:
-            hand_owner = self.pinned_vel.owner
-        else:
-            # ホバー中にカードが「未設定」のときだけ手札を出す
-            if hovered_ally_vel and (hovered_card is None):
-                hand_owner = hovered_ally_vel.owner
+        self.drawn_items = []
+        hovered_vel_dice_ui, hand_owner, hint_text = self._frame_view or self._get_view()
 
         # 味方手札表示
         if hand_owner is not None:
             self.hand_view.set_hand(hand_owner.deck.hand_cards)
             self.hand_view.render(surface)
+            self.drawn_items.append(("hand", self.hand_view.get_bounds(), tuple(id(c) for c in self.hand_view.cards)))
+
+            # 行動候補表示
+            if hint_text:
+                draw_text(
+                    surface=surface,
+                    font=self.scene.font,
+                    text=hint_text,
+                    color=(30, 30, 30),
+                    pos=(20, 410),
+                )
+                text_rect = render_text(self.scene.font, hint_text, True, (30, 30, 30)).get_rect(topleft=(20, 410))
+                self.drawn_items.append(("hint", text_rect, hint_text))
 
         # ホバーした速度ダイスのカード表示
         if hovered_vel_dice_ui:
@@ -211,49 +242,75 @@ class AllyPlanState(BattleState):
                 else:
                     x, y = 20, 20
 
-                CardView(self.scene.game, card, (x, y)).render(surface)
+                card_view = self.hovered_card_view
+                if card_view is None or card_view.card is not card or card_view.pos != [x, y]:
+                    card_view = self.hovered_card_view = CardView(self.scene.game, card, (x, y))
+                card_view.render(surface)
+                self.drawn_items.append(("card", card_view.bounds, card.id))
 
         # マッチ/一方攻撃の矢印を描画
-        processed_clash_pairs = set()
-        for info in self.scene.clash_infos:
-            a_vel = info.attacker
-            b_vel = info.defender
+        self.clash_overlay.render(surface)
+        if self.clash_overlay.rect is not None:
+            self.drawn_items.append(("clash_overlay", self.clash_overlay.rect, self.clash_overlay.version))
+
+    def layer_key(self):
+        self._frame_view = self._get_view()
+        hovered_vel_dice_ui, hand_owner, hint_text = self._frame_view
+        hand = tuple(id(c) for c in hand_owner.deck.hand_cards) if hand_owner else None
+        card = hovered_vel_dice_ui.velocity_dice.card if hovered_vel_dice_ui else None
+        return (
+            hovered_vel_dice_ui, id(hand_owner), hand, hint_text, id(card),
+            # clash_infos は置き換えた時だけ変わる（前のリストは ClashOverlay が持っているので id は再利用されない）
+            id(self.scene.clash_infos), self.scene.layout_version,
+        )
 
-            a_vel_ui = self._find_vel_ui(a_vel)
-            b_vel_ui = self._find_vel_ui(b_vel)
+    def _get_view(self):
+        """表示内容 (ホバー中の速度ダイスUI, 手札を表示するユニット, 行動候補の文字列)"""
+        # ホバー情報
+        hovered_ally_vel = None
+        hovered_card = None
 
-            if not a_vel_ui or not b_vel_ui:
-                continue
+        hovered_vel_dice_ui = self._get_hovered_vel_dice_ui(self.scene.game.mouse_pos)
+        if hovered_vel_dice_ui:
+            vel = hovered_vel_dice_ui.velocity_dice
+            if vel.owner.is_ally:
+                hovered_ally_vel = vel
+                hovered_card = vel.card  # None か CardSpec
 
-            point_a = a_vel_ui.rect.center
-            point_b = b_vel_ui.rect.center
-
-            # マッチ判定
-            if self.scene.system.is_clash(info):
-                # マッチは (A,B) と (B,A) が来ても1回だけ描く
-                key = (min(id(a_vel), id(b_vel)), max(id(a_vel), id(b_vel)))
-                if key in processed_clash_pairs:
-                    continue
-                processed_clash_pairs.add(key)
-
-                self._draw_curved_arrow(
-                    surface, point_a, point_b,
-                    color=(255, 100, 100),
-                    width=5,
-                    curvature=0.22,
-                    arrow_size=15,
-                    bidirectional=True
-                )
-            # 一方攻撃判定
-            elif self.scene.system.is_one_sided(info):
-                self._draw_curved_arrow(
-                    surface, point_a, point_b,
-                    color=(100, 100, 255),
-                    width=5,
-                    curvature=0.22,
-                    arrow_size=15,
-                    bidirectional=False
-                )
+        # 手札の持ち主（固定があれば固定優先）
+        hand_owner = None
+        if self.pinned_hand and self.pinned_vel:
+            hand_owner = self.pinned_vel.owner
+        else:
+            # ホバー中にカードが「未設定」のときだけ手札を出す
+            if hovered_ally_vel and (hovered_card is None):
+                hand_owner = hovered_ally_vel.owner
+
+        # 行動候補
+        hint_text = None
+        if hand_owner is not None:
+            hint_vel = self.pinned_vel if self.pinned_hand else hovered_ally_vel
+            hints = self.scene.context.plan_hints.get(hint_vel)
+            if hints:
+                best = hints[0]
+                hint_text = f"ヒント: {best.card.name} → {best.target.owner.name} ({best.score:+.1f})"
+
+        return hovered_vel_dice_ui, hand_owner, hint_text
+
+    def collect_dirty(self, tracker) -> bool:
+        for key, rect, state in self.drawn_items:
+            tracker.mark(key, rect, state)
+        return True
+
+    def _restart_hints(self):
+        """行動候補を計算し直す（結果は BattleContext.plan_hints に入る）"""
+        self.scene.context.plan_hints = {}
+        self.scene.hint_worker.restart(
+            self.scene.ally_slots,
+            hints=self.scene.context.plan_hints,
+            focus=self.scene.context.selected_vel,
+            select_order=self.plan_counter,
+        )
 
     def _select_next_vel_dice(self) -> bool:
         """カード未設定ダイスを取得"""
@@ -282,16 +339,21 @@ class AllyPlanState(BattleState):
         self.phase = AllyPlanPhase.SELECT_VELOCITY
 
     def _go_next_state(self):
+        # リプレイ記録
+        if self.scene.replay_recorder:
+            self.scene.replay_recorder.record_round(self.scene.ally_slots, self.scene.enemy_slots)
+
         # 次の状態へ遷移
         from scripts.battle.states.resolve import ResolveState
         self.scene.change_state(ResolveState(self.scene))
 
     def _get_hovered_vel_dice_ui(self, mouse_pos):
-        for unit_view in self.scene.allies_ui + self.scene.enemies_ui:
-            vel_dice_ui = unit_view.get_hovered_vel_dice_ui(mouse_pos)
-            if vel_dice_ui:
-                return vel_dice_ui
-        return None
+        return self.scene.get_vel_dice_view_at(mouse_pos)
+
+    def _update_clashes(self, vel_dice):
+        """速度ダイスの変更をマッチ判定に反映"""
+        self.clash_graph.update(vel_dice)
+        self.scene.clash_infos = self.clash_graph.infos()
 
     def _refund_card_to_hand(self, vel_dice):
         """速度ダイスの選択項目を元に戻す"""
@@ -305,63 +367,3 @@ class AllyPlanState(BattleState):
 
         # 設定順初期化
         vel_dice.select_order = 0
-
-    def _find_vel_ui(self, vel_dice):
-        all_units_ui = self.scene.allies_ui + self.scene.enemies_ui
-        for unit_ui in all_units_ui:
-            for vel_ui in unit_ui.vel_dice_ui_list:
-                if vel_ui.velocity_dice is vel_dice:
-                    return vel_ui
-        return None
-
-    def _draw_curved_arrow(self, surface, a_pos, b_pos, color, width=3,
-                           curvature=0.25, arrow_size=12, bidirectional=False):
-        """
-        a_pos -> b_pos をカーブ線で描き、矢印を付ける
-        - bidirectional=True なら両端に矢印（CLASH用）
-        """
-
-        ax, ay = a_pos
-        bx, by = b_pos
-        dx, dy = bx - ax, by - ay
-        dist = math.hypot(dx, dy)
-        if dist < 1:
-            return
-
-        # 制御点：常に「上」に膨らませる（yを減らす）
-        mx, my = (ax + bx) * 0.5, (ay + by) * 0.5
-        offset = dist * curvature
-        cx, cy = mx, my - offset
-
-        # 2次ベジェを折れ線で近似
-        points = []
-        steps = max(12, int(dist / 20))
-        for i in range(steps + 1):
-            t = i / steps
-            x = (1 - t) * (1 - t) * ax + 2 * (1 - t) * t * cx + t * t * bx
-            y = (1 - t) * (1 - t) * ay + 2 * (1 - t) * t * cy + t * t * by
-            points.append((x, y))
-
-        pygame.draw.lines(surface, color, False, points, width)
-
-        # 終点側の矢印
-        self._draw_arrow_head(surface, points[-2], points[-1], color, arrow_size)
-
-        # CLASH用：始点側にも矢印（1本の線に両矢印）
-        if bidirectional:
-            self._draw_arrow_head(surface, points[1], points[0], color, arrow_size)
-
-    def _draw_arrow_head(self, surface, from_pos, to_pos, color, size=12):
-        """from_pos -> to_pos の向きに矢印ヘッド（三角）を描く"""
-        fx, fy = from_pos
-        tx, ty = to_pos
-        dx, dy = (tx - fx), (ty - fy)
-        ang = math.atan2(dy, dx)
-
-        # 三角形の2点（左右）
-        left = (tx - size * math.cos(ang - math.pi / 6),
-                ty - size * math.sin(ang - math.pi / 6))
-        right = (tx - size * math.cos(ang + math.pi / 6),
-                 ty - size * math.sin(ang + math.pi / 6))
-
-        pygame.draw.polygon(surface, color, [(tx, ty), left, right])
@@ -28,3 +28,11 @@ class BattleState(ABC):
     @abstractmethod
     def render(self, surface) -> None:
         pass
+
+    def layer_key(self):
+        """render の内容が変わったかを判定する値（None の場合は毎フレーム描き直す）"""
+        return None
+
+    def collect_dirty(self, tracker) -> bool:
+        """描画した要素を差分更新用に登録（対応していない場合は False で画面全体を更新）"""
+        return True
@@ -2,7 +2,6 @@ from scripts.battle.states.base import BattleState
 from scripts.utils.dev_utils import create_sample_cards, create_sample_units
 from scripts.models.deck import Deck
 from scripts.models.unit import Unit
-from copy import deepcopy
 
 
 class BattleStartState(BattleState):
@@ -41,6 +40,10 @@ class BattleStartState(BattleState):
     def render(self, surface) -> None:
         pass
 
+    def layer_key(self):
+        # 何も描かない
+        return ()
+
     def _create_units(self):
         # サンプルカードリスト作成
         card_list = create_sample_cards()
@@ -49,10 +52,12 @@ class BattleStartState(BattleState):
         deck = Deck(card_list)
 
         # ユニット作成
-        ally_units = create_sample_units(deck, num=3, is_ally=True)
+        num = self.scene.unit_count
+        dice = self.scene.velocity_dice_count
+        ally_units = create_sample_units(deck, num=num, is_ally=True, velocity_dice_count=dice)
         self.scene.allies.extend(ally_units)
 
-        enemy_units = create_sample_units(deck, num=3, is_ally=False)
+        enemy_units = create_sample_units(deck, num=num, is_ally=False, velocity_dice_count=dice)
         self.scene.enemies.extend(enemy_units)
 
     def _go_next_state(self):
@@ -1,5 +1,5 @@
-import random
 from scripts.battle.states.base import BattleState
+from scripts.battle.replay import apply_plan
 
 
 class EnemyPlanState(BattleState):
@@ -13,11 +13,24 @@ class EnemyPlanState(BattleState):
         print("Enter: EnemyPlanState")
         self.scene.state_name = "ENEMY PLAN STATE"
 
-        # 敵の準備処理を実行
-        self.scene.system.plan_enemy(
-            enemy_slots=self.scene.enemy_slots,
-            ally_slots=self.scene.ally_slots,
-        )
+        # リプレイ再生中は記録された行動を反映
+        replay_round = None
+        if self.scene.replay_player:
+            replay_round = self.scene.replay_player.next_round()
+
+        if replay_round is not None:
+            apply_plan(replay_round.enemy, self.scene.all_slots)
+        else:
+            # 敵の準備処理を実行
+            self.scene.system.plan_enemy(
+                enemy_slots=self.scene.enemy_slots,
+                ally_slots=self.scene.ally_slots,
+            )
+
+            # 探索結果
+            stats = self.scene.system.planner.last_stats
+            if stats is not None:
+                print(f"Planner: {stats.iterations} iterations in {stats.elapsed * 1000:.1f}ms ({stats.iterations_per_second:.0f} it/s)")
 
         # 次の状態へ遷移
         self._go_next_state()
@@ -34,6 +47,10 @@ class EnemyPlanState(BattleState):
     def render(self, surface) -> None:
         pass
 
+    def layer_key(self):
+        # 何も描かない
+        return ()
+
     def _go_next_state(self):
         # 次の状態へ遷移
         from scripts.battle.states.ally_plan import AllyPlanState
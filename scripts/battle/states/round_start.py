@@ -27,32 +27,46 @@ class RoundStartState(BattleState):
         if self.scene.game.inputs["left_click_down"]:
 
             if self.scene.battle_start_button.is_hovered(self.scene.game.mouse_pos):
-                # ラウンド開始処理
-                units = self.scene.allies + self.scene.enemies
-                self.scene.system.start_round(units)
+                self._start_round()
 
-                # 全体の速度順（速度ダイス）決定
-                self.scene.all_slots = self.scene.system.get_action_order(units)
+    def update(self, dt: float) -> None:
+        # リプレイ再生中は自動で開始
+        if self.scene.replay_player:
+            # 再生が終わったら通常の操作に戻す
+            if self.scene.replay_player.is_finished():
+                print("Replay finished")
+                self.scene.replay_player = None
+                return
+            self._start_round()
 
-                # 味方の速度順（速度ダイス）決定
-                self.scene.ally_slots = [
-                    v for v in self.scene.all_slots if v.owner.is_ally
-                ]
+    def _start_round(self):
+        # ラウンド開始処理
+        units = self.scene.allies + self.scene.enemies
+        self.scene.system.start_round(units)
 
-                # 敵の速度順（速度ダイス）決定
-                self.scene.enemy_slots = [
-                    v for v in self.scene.all_slots if not v.owner.is_ally
-                ]
+        # 全体の速度順（速度ダイス）決定
+        self.scene.all_slots = self.scene.system.get_action_order(units)
 
-                # 次の状態へ遷移
-                self._go_next_state()
+        # 味方の速度順（速度ダイス）決定
+        self.scene.ally_slots = [
+            v for v in self.scene.all_slots if v.owner.is_ally
+        ]
 
-    def update(self, dt: float) -> None:
-        pass
+        # 敵の速度順（速度ダイス）決定
+        self.scene.enemy_slots = [
+            v for v in self.scene.all_slots if not v.owner.is_ally
+        ]
+
+        # 次の状態へ遷移
+        self._go_next_state()
 
     def render(self, surface) -> None:
         pass
 
+    def layer_key(self):
+        # 何も描かない
+        return ()
+
     def _go_next_state(self):
         # 次の状態へ遷移
         from scripts.battle.states.enemy_plan import EnemyPlanState
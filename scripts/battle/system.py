@@ -1,4 +1,6 @@
-import random
+from scripts.battle.rng import BattleRng
+from scripts.battle.planner import EnemyPlanner, RandomPlanner
+from scripts.battle.snapshot import SnapshotCodec
 from scripts.models.unit import Unit
 from scripts.models.dice import VelocityDice
 from enum import Enum, auto
@@ -21,12 +23,26 @@ class ClashInfo:
 class BattleSystem:
     """
     戦闘処理のシステムクラス
+
+    Args:
+        rng (BattleRng | None): 戦闘用の乱数（None の場合はランダムなシード）
+        planner (EnemyPlanner | None): 敵の行動決定（None の場合はランダム）
     """
+    def __init__(self, rng: BattleRng | None = None, planner: EnemyPlanner | None = None):
+        self.rng = rng if rng is not None else BattleRng()
+        self.planner = planner if planner is not None else RandomPlanner()
+
+        # スナップショット用（同じユニット一覧の間は使い回す）
+        self._snapshot_codec: SnapshotCodec | None = None
+        self._snapshot_key: tuple = ()
+
     def start_battle(self, units: list[Unit]):
+        self.planner.prepare(units)
+
         for unit in units:
             # カードをドロー
-            unit.deck.shuffle_draw_pile()
-            unit.deck.draw(num=3)
+            unit.deck.shuffle_draw_pile(self.rng.deck)
+            unit.deck.draw(num=3, rng=self.rng.deck)
 
     def start_round(self, units: list[Unit]):
         for unit in units:
@@ -35,57 +51,41 @@ class BattleSystem:
             unit.recover_light(amount=1)
 
             # カードをドロー
-            unit.deck.draw(num=1)
+            unit.deck.draw(num=1, rng=self.rng.deck)
 
             # 混乱していない場合、速度ダイスを振る
             if not unit.is_confused():
                 for vel_dice in unit.velocity_dice_list:
-                    vel_dice.roll()
+                    vel_dice.roll(self.rng.speed)
 
     def get_action_order(self, units: list[Unit]):
-        vel_dice_list = []
-        for unit in units:
-            vel_dice_list.extend(unit.velocity_dice_list)
+        """
+        速度順（速い順、同じ速度はユニット/速度ダイスの並び順、振っていないものは最後）
 
-        return sorted(
-            vel_dice_list,
-            key=lambda v: (v.val is not None, v.val or -1),
-            reverse=True
-        )
+        速度の範囲は小さいので、速度ごとのバケットに振り分けて並べる
+        """
+        buckets: dict[int, list] = {}
+        not_rolled = []
+        for unit in units:
+            for vel_dice in unit.velocity_dice_list:
+                if vel_dice.val is None:
+                    not_rolled.append(vel_dice)
+                else:
+                    bucket = buckets.get(vel_dice.val)
+                    if bucket is None:
+                        buckets[vel_dice.val] = [vel_dice]
+                    else:
+                        bucket.append(vel_dice)
+
+        order = []
+        for val in sorted(buckets, reverse=True):
+            order.extend(buckets[val])
+        order.extend(not_rolled)
+        return order
 
     def plan_enemy(self, enemy_slots: list[VelocityDice], ally_slots: list[VelocityDice]):
-
-        # 速度ダイス順でターゲット選択
-        for vel_dice in enemy_slots:
-            # ダイスが振られていない場合はスキップ
-            if vel_dice.val is None:
-                continue
-
-            # ダイスの所有者
-            enemy = vel_dice.owner
-
-            # 混乱している場合はスキップ
-            if enemy.is_confused():
-                continue
-
-            # プレイできるカードのみ抽出
-            playable_cards = [card for card in enemy.deck.hand_cards if enemy.can_play_card(card)]
-
-            # プレイできるカードがない場合はスキップ
-            if len(playable_cards) <= 0:
-                continue
-
-            # カードをランダムに選択
-            card = random.choice(playable_cards)
-            if not enemy.pay_light(card.cost):
-                continue
-            enemy.deck.remove_card(card)
-            vel_dice.card = card
-
-            # ターゲットをランダムに選択
-            target_candidates = [vel_dice for vel_dice in ally_slots]
-            target = random.choice(target_candidates)
-            vel_dice.target = target
+        """敵の行動決定（planner に任せる）"""
+        self.planner.plan(self, enemy_slots=enemy_slots, ally_slots=ally_slots)
 
     def evaluate_clashes(self, all_slots: list) -> list[ClashInfo]:
         """マッチ/一方攻撃を判定して返す"""
@@ -154,6 +154,21 @@ class BattleSystem:
 
         return infos
 
+    def snapshot(self, units: list[Unit]) -> tuple[int, ...]:
+        """ユニットの状態をスナップショットとして保存"""
+        return self._get_snapshot_codec(units).dump()
+
+    def restore(self, units: list[Unit], buf: tuple[int, ...]) -> None:
+        """スナップショットの状態に戻す（units は保存時と同じ並び）"""
+        self._get_snapshot_codec(units).load(buf)
+
+    def _get_snapshot_codec(self, units: list[Unit]) -> SnapshotCodec:
+        key = tuple(map(id, units))
+        if self._snapshot_codec is None or key != self._snapshot_key:
+            self._snapshot_codec = SnapshotCodec(units)
+            self._snapshot_key = key
+        return self._snapshot_codec
+
     def is_clash(self, clash_info: ClashInfo):
         return clash_info.clash_type == ClashType.CLASH
 
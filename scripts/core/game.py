@@ -1,25 +1,67 @@
 import os
 import sys
+import time
 import pygame
 from scripts.core.constants import Constants
+from scripts.battle.planner import Difficulty
 from scripts.scene.base import SceneId, SceneManager
 from scripts.assets.fonts import FontManager
 from scripts.assets.animation import Animation
 from scripts.assets.card_art_manager import CardArtManager
+from scripts.assets.scaled_images import ScaledImageCache
+from scripts.ui.dirty_rects import DirtyRectTracker
+from scripts.ui.profiler_overlay import ProfilerOverlay
+from scripts.utils.profiler import FrameProfiler
 from scripts.utils.img import load_image, load_images
 
 
 class Game:
+    """
+    ゲーム本体
 
-    def __init__(self):
+    Args:
+        record_path (str | None): 戦闘のリプレイの保存先
+        replay_path (str | None): 再生するリプレイ
+        difficulty (Difficulty): 敵の強さ
+        unit_count (int): 1陣営のユニット数
+        velocity_dice_count (int): ユニットごとの速度ダイスの数
+        dirty_rects (bool): 変わった範囲だけ画面を更新する（対応していないシーンは全体を更新）
+        profile (bool): 処理時間の計測を有効にして起動する（F3 で切り替え、F4 で CSV に保存）
+    """
+
+    def __init__(
+        self,
+        record_path: str | None = None,
+        replay_path: str | None = None,
+        difficulty: Difficulty = Difficulty.EASY,
+        unit_count: int = 3,
+        velocity_dice_count: int = 1,
+        dirty_rects: bool = False,
+        profile: bool = False,
+    ):
         pygame.init()
 
+        # リプレイ
+        self.record_path = record_path
+        self.replay_path = replay_path
+
+        # 難易度
+        self.difficulty = difficulty
+
+        # 編成の大きさ
+        self.unit_count = unit_count
+        self.velocity_dice_count = velocity_dice_count
+
         # ウィンドウの設定
         self.screen = pygame.display.set_mode((Constants.SCREEN_WIDTH, Constants.SCREEN_HEIGHT))
 
         # FPSの設定
         self.clock = pygame.time.Clock()
 
+        # 画面の差分更新
+        self.dirty_rects = dirty_rects
+        self.dirty_tracker = DirtyRectTracker(self.screen.get_rect())
+
         # 入力
         self.inputs = {
             "left_click": False,
@@ -71,12 +113,54 @@ class Game:
             "battle_start_button": load_image("assets/images/button/battle_start_button.png")
         }
 
+        # 拡大縮小済みの画像
+        self.scaled_images = ScaledImageCache(self.assets)
+
         # マウス位置
         self.mouse_pos = pygame.mouse.get_pos()
 
         # シーン
         self.scenes = SceneManager(self, SceneId.TITLE)
 
+        # 処理時間の計測
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler, self.fonts.get("dot", 14))
+        self._add_profile_targets()
+        if profile:
+            self.profiler.enable()
+
+    def _add_profile_targets(self):
+        """処理時間を計測するメソッドを登録"""
+        from scripts.battle.states.base import BattleState
+        from scripts.battle.states import battle_start, round_start, enemy_plan, ally_plan, resolve  # サブクラスを登録するため
+        from scripts.ui.compositor import Compositor
+        from scripts.ui.battle.unit import UnitView
+        from scripts.ui.battle.hand import HandView
+        from scripts.ui.battle.card import CardView
+        from scripts.ui.battle.clash_overlay import ClashOverlay
+
+        for attr in ("handle", "update", "render"):
+            self.profiler.add_target(SceneManager, attr)
+        self.profiler.add_subclasses(BattleState, ["enter", "handle", "update", "render"])
+        self.profiler.add_target(Compositor, "render")
+        self.profiler.add_target(UnitView, "render")
+        self.profiler.add_target(UnitView, "render_effects")
+        self.profiler.add_target(HandView, "render")
+        self.profiler.add_target(CardView, "render")
+        self.profiler.add_target(ClashOverlay, "_redraw")
+        self.profiler.add_target(Game, "update_display")
+
+    def toggle_profiler(self):
+        self.profiler.toggle()
+
+    def export_profile(self):
+        """計測結果を CSV に保存"""
+        if not self.profiler.enabled:
+            return
+        path = time.strftime("profile_%Y%m%d_%H%M%S.csv")
+        self.profiler.export_csv(path)
+        print(f"Profile saved: {path}")
+
     def exit(self):
         pygame.quit()
         sys.exit()
@@ -112,6 +196,10 @@ class Game:
                     self.inputs["left"] = True
                 if event.key == pygame.K_RIGHT:
                     self.inputs["right"] = True
+                if event.key == pygame.K_F3:
+                    self.toggle_profiler()
+                if event.key == pygame.K_F4:
+                    self.export_profile()
             if event.type == pygame.KEYUP:
                 if event.key == pygame.K_ESCAPE:
                     self.inputs["esc"] = False
@@ -153,19 +241,45 @@ class Game:
             # デルタタイム
             dt = self.clock.tick(Constants.FPS) / 1000.0
 
+            # 処理時間の計測開始（tick の待ち時間は含めない）
+            if self.profiler.enabled:
+                self.profiler.begin_frame()
+
             # マウス位置
             self.mouse_pos = pygame.mouse.get_pos()
 
             # イベント処理
             self.handle_events()
 
-            # 背景の塗りつぶし
-            self.screen.fill((200, 200, 200))
-
             # シーンの更新と描画
             self.scenes.handle()
             self.scenes.update(dt)
             self.scenes.render(self.screen)
 
+            # 処理時間の表示
+            if self.profiler.enabled:
+                self.profiler_overlay.render(self.screen)
+
             # 画面更新
+            self.update_display()
+
+            if self.profiler.enabled:
+                self.profiler.end_frame()
+
+    def update_display(self):
+        """画面を更新（差分更新が有効で、シーンが対応していれば変わった範囲だけ）"""
+        if not self.dirty_rects:
+            pygame.display.update()
+            return
+
+        self.dirty_tracker.begin()
+        if not self.scenes.collect_dirty(self.dirty_tracker):
+            self.dirty_tracker.invalidate()
+        # 処理時間の表示は毎フレーム変わる（消えた場合は前回の範囲が更新される）
+        if self.profiler.enabled:
+            self.dirty_tracker.mark("profiler_overlay", self.profiler_overlay.rect, self.profiler_overlay.render_count)
+        rects = self.dirty_tracker.end()
+        if rects is None:
             pygame.display.update()
+        elif rects:
+            pygame.display.update(rects)
@@ -1,10 +1,21 @@
 from dataclasses import dataclass
-from scripts.models.dice import Dice
+from scripts.models.dice import DieSpec
 
 
-@dataclass
-class Card:
+@dataclass(frozen=True, slots=True)
+class CardSpec:
+    """
+    カードの定義（変更不可、全ユニットで共有する）
+    """
     id: str     # ID
     name: str   # カード名
     cost: int   # コスト
-    dice_list: list[Dice]   # ダイスリスト（回避や斬撃）
+    dice_list: tuple[DieSpec, ...]   # ダイスリスト（回避や斬撃）
+
+    def __post_init__(self):
+        # list で渡された場合も変更できないようにする
+        object.__setattr__(self, "dice_list", tuple(self.dice_list))
+
+    def __deepcopy__(self, memo):
+        # 変更不可なのでコピーせずに共有
+        return self
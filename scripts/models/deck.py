@@ -1,35 +1,79 @@
 import random
 from dataclasses import dataclass
-from scripts.models.card import Card
+from scripts.models.card import CardSpec
 
 
 @dataclass
 class Deck:
-    card_list: list[Card]    # カードリスト
+    card_list: list[CardSpec]    # カードリスト
 
     def __post_init__(self):
-        self.draw_pile = self.card_list.copy()  # 山札
+        self.draw_pile = self.card_list.copy()  # 山札（末尾が一番上）
         self.hand_cards = []
         self.hand_limit = 9
 
-    def shuffle_draw_pile(self):
+    def shuffle_draw_pile(self, rng=random):
         """山札をシャッフル"""
-        random.shuffle(self.draw_pile)
+        rng.shuffle(self.draw_pile)
 
-    def remove_card(self, card: Card):
+    def peek(self, num: int = 1) -> list[CardSpec]:
+        """山札の上から num 枚を見る（引く順）"""
+        if num <= 0:
+            return []
+        return self.draw_pile[:-num - 1:-1]
+
+    def hand_slots(self) -> list[tuple[int, CardSpec]]:
+        """手札の (スロット, カード) 一覧（スロットは手札の位置）"""
+        return list(enumerate(self.hand_cards))
+
+    def remove_slot(self, slot: int) -> CardSpec:
+        """スロット指定で手札から取り除く（カード同士の比較をしない）"""
+        return self.hand_cards.pop(slot)
+
+    def remove_card(self, card: CardSpec):
         self.hand_cards.remove(card)
 
-    def draw(self, num: int):
+    def draw(self, num: int, rng=random):
         """カードを山札から引く"""
         for _ in range(num):
 
             # 山札が空の場合、補充してシャッフル
             if len(self.draw_pile) <= 0:
                 self.draw_pile = self.card_list.copy()
-                self.shuffle_draw_pile()
+                self.shuffle_draw_pile(rng)
 
             draw_card = self.draw_pile.pop()
 
             # 手札が上限に達していない場合、手札に加える
             if len(self.hand_cards) < self.hand_limit:
                 self.hand_cards.append(draw_card)
+
+    def draw_many(self, num: int, rng=random) -> list[CardSpec]:
+        """
+        カードを山札から num 枚引き、手札に加えたカードを返す
+
+        ・draw と同じ順番で引く（手札が上限の場合は捨てる）
+        ・山札の上からまとめて取り出すので、1枚ずつ引くより速い
+        """
+        drawn = []
+        while num > 0:
+
+            # 山札が空の場合、補充してシャッフル
+            if len(self.draw_pile) <= 0:
+                self.draw_pile = self.card_list.copy()
+                self.shuffle_draw_pile(rng)
+
+            # 山札の上からまとめて引く
+            take = min(num, len(self.draw_pile))
+            num -= take
+            cards = self.draw_pile[:-take - 1:-1]
+            del self.draw_pile[-take:]
+
+            # 手札が上限に達していない分だけ手札に加える（上から順）
+            space = self.hand_limit - len(self.hand_cards)
+            if space > 0:
+                cards = cards[:space]
+                self.hand_cards.extend(cards)
+                drawn.extend(cards)
+
+        return drawn
@@ -13,45 +13,23 @@ class DiceType(Enum):
     BLUNT = "打撃"
 
 
-EVADE_TYPES = [
-    DiceType.EVADE,
-]
+@dataclass(frozen=True, slots=True)
+class DieSpec:
+    """
+    カードのダイスの定義（変更不可、全ユニットで共有する）
 
-
-BLOCK_TYPES = [
-    DiceType.BLOCK,
-]
-
-
-ATTACK_TYPES = [
-    DiceType.SLASH,
-    DiceType.PIERCE,
-    DiceType.BLUNT,
-]
-
-
-def is_evade(dice):
-    return dice.d_type in EVADE_TYPES
-
-
-def is_block(dice):
-    return dice.d_type in BLOCK_TYPES
-
-
-def is_attack(dice):
-    return dice.d_type in ATTACK_TYPES
-
-
-@dataclass
-class Dice:
+    振った値は持たない（BattleEngine がマッチごとに保持する）
+    """
     min_val: int        # ダイスの最小値
     max_val: int        # ダイスの最大値
     d_type: DiceType    # ダイスの種類
-    val: int | None = None     # ダイスの値
 
-    def roll(self):
-        self.val = random.randint(self.min_val, self.max_val)
-        return self.val
+    def roll(self, rng=random) -> int:
+        return rng.randint(self.min_val, self.max_val)
+
+    def __deepcopy__(self, memo):
+        # 変更不可なのでコピーせずに共有
+        return self
 
 
 @dataclass(eq=False)
@@ -61,7 +39,7 @@ class VelocityDice:
     val: int | None = None
     owner: "Unit" = None
     target: "VelocityDice" = None
-    card: "Card" = None
+    card: "CardSpec" = None
     is_checked: bool = False
     select_order: int = 0
 
@@ -72,6 +50,6 @@ class VelocityDice:
         self.is_checked = False
         self.select_order = 0
 
-    def roll(self):
-        self.val = random.randint(self.min_val, self.max_val)
+    def roll(self, rng=random):
+        self.val = rng.randint(self.min_val, self.max_val)
         return self.val
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum, auto
 from scripts.models.deck import Deck
-from scripts.models.card import Card
+from scripts.models.card import CardSpec
 from scripts.models.dice import VelocityDice, DiceType
 
 
@@ -28,6 +28,13 @@ class UnitStates(Enum):
     IDLE = "idle"
 
 
+@dataclass(frozen=True)
+class ResistanceProfile:
+    """ダイス種類ごとの耐性倍率（DiceType の定義順）"""
+    hp: tuple[float, ...]           # HPの倍率
+    confusion: tuple[float, ...]    # 混乱耐性の倍率
+
+
 @dataclass
 class Unit:
     name: str       # ユニット名
@@ -45,12 +52,14 @@ class Unit:
     confusion_pierce_resistance: ResistanceType = ResistanceType.NORMAL  # 突き耐性（混乱耐性）
     confusion_blunt_resistance: ResistanceType = ResistanceType.NORMAL   # 打撃耐性（混乱耐性）
     states: UnitStates = UnitStates.IDLE
+    velocity_dice_count: int = 1    # 速度ダイスの数
+    sprite: str | None = None       # 画像の名前（None の場合はユニット名）
 
     def __post_init__(self):
         self.hp = self.max_hp   # 現在のHP
         self.confusion_resist = self.max_confusion_resist           # 現在の混乱耐性
         self.light = self.max_light     # 現在の光
-        self.velocity_dice_list = self._create_velocity_dice(1)     # 速度ダイスリスト
+        self.velocity_dice_list = self._create_velocity_dice(self.velocity_dice_count)     # 速度ダイスリスト
         # HPの耐性
         self.hp_resistance = {
             DiceType.SLASH.name: self.hp_slash_resistance.value,
@@ -65,6 +74,13 @@ class Unit:
         }
         self.remaining_dices = []   # 保存ダイス
 
+    def get_resistance_profile(self) -> ResistanceProfile:
+        """耐性プロファイルを取得"""
+        return ResistanceProfile(
+            hp=tuple(self.hp_resistance.get(d_type.name, 1.0) for d_type in DiceType),
+            confusion=tuple(self.confusion_resistance.get(d_type.name, 1.0) for d_type in DiceType),
+        )
+
     def init(self):
         self.remaining_dices = []
         for vel_dice in self.velocity_dice_list:
@@ -84,7 +100,7 @@ class Unit:
     def is_confused(self):
         return self.confusion_resist <= 0
 
-    def can_play_card(self, card: Card) -> bool:
+    def can_play_card(self, card: CardSpec) -> bool:
         return self.light >= card.cost and not self.is_confused()
 
     def is_dead(self):
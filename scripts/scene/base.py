@@ -5,6 +5,9 @@ from enum import Enum, auto
 
 class Scene(ABC):
 
+    # 層ごとに合成する場合の Compositor（None の場合は render で直接描画）
+    compositor = None
+
     @abstractmethod
     def handle(self):
         """入力処理を行います。"""
@@ -20,6 +23,17 @@ class Scene(ABC):
         """描画を行います。"""
         pass
 
+    def on_exit(self):
+        """シーンから離れる時に呼ばれます（スレッドなどの後片付け）。"""
+        pass
+
+    def collect_dirty(self, tracker) -> bool:
+        """
+        描画した要素を差分更新用に登録します（DirtyRectTracker.mark）。
+        対応していない場合は False を返し、画面全体を更新します。
+        """
+        return False
+
 
 class SceneId(Enum):
     TITLE = auto()      # タイトル画面
@@ -47,6 +61,9 @@ class SceneManager:
         self._old_surface = None  # トランジション用の古い画面キャプチャ
         self._new_surface = None  # トランジション用の新しい画面キャプチャ
 
+        # 差分更新で前フレームに登録したシーン
+        self._dirty_scene = None
+
     def push_overlay(self, scene: Scene):
         self.overlay_stack.append(scene)
 
@@ -74,6 +91,7 @@ class SceneManager:
     def change_scene(self, scene_id: SceneId, transition=None):
         # トランジション無しの場合、即切り替え
         if transition is None:
+            self.current_scene.on_exit()
             self.current_scene = self._create_scene(scene_id)
             return
 
@@ -94,6 +112,18 @@ class SceneManager:
         # トランジション開始
         self.transition.start()
 
+    def collect_dirty(self, tracker) -> bool:
+        """差分更新用に描画した要素を登録（遷移中/オーバーレイ表示中は全体を更新）"""
+        if self.transition or self.overlay_stack:
+            self._dirty_scene = None
+            return False
+
+        # シーンが変わった場合は全体を更新
+        if self.current_scene is not self._dirty_scene:
+            self._dirty_scene = self.current_scene
+            tracker.invalidate()
+        return self.current_scene.collect_dirty(tracker)
+
     def handle(self):
         if self.transition is None:
             self._top_scene().handle()
@@ -106,6 +136,7 @@ class SceneManager:
             # 遷移が完了した場合、次のシーンに切り替え
             is_finished = self.transition.update(dt)
             if is_finished:
+                self.current_scene.on_exit()
                 self.current_scene = self._next_scene
                 self._next_scene = None
                 self.transition = None
@@ -124,7 +155,13 @@ class SceneManager:
                 self._old_surface,
                 self._new_surface
             )
+        elif self.current_scene.compositor is not None:
+            # ベースシーンの層にオーバーレイシーンを重ねて合成
+            self.current_scene.compositor.render(surface, overlays=self.overlay_stack)
         else:
+            # 背景の塗りつぶし（Compositor を使うシーンは層で画面全体を描くので不要）
+            surface.fill((200, 200, 200))
+
             # ベースシーン
             self.current_scene.render(surface)
 
@@ -1,11 +1,18 @@
 import pygame
 from scripts.scene.base import Scene
-from scripts.utils.draw import draw_text, Anchor
+from scripts.utils.draw import draw_text, render_text, Anchor
 from scripts.battle.states.battle_start import BattleStartState
 from scripts.battle.context import BattleContext
 from scripts.battle.system import BattleSystem
+from scripts.battle.rng import BattleRng
+from scripts.battle.planner import create_planner
+from scripts.battle.replay import ReplayRecorder, ReplayPlayer, load_replay
+from scripts.battle.hint import HintWorker
 from scripts.ui.battle.unit import UnitView
+from scripts.ui.battle.layout import compute_unit_layout
 from scripts.ui.battle.battle_start_button import BattleStartButton
+from scripts.ui.hit_index import HitIndex
+from scripts.ui.compositor import Compositor
 
 
 class BattleScene(Scene):
@@ -30,11 +37,40 @@ class BattleScene(Scene):
         self.enemies_ui = []
         self.unit_ui_id_map = {}
 
+        # 速度ダイスUIの当たり判定（ユニットUIの配置を変えたら作り直す）
+        self.vel_dice_views: dict = {}  # key: 速度ダイス, val: 速度ダイスUI
+        self.vel_dice_hit_index = HitIndex()
+        self.layout_version = 0     # ユニットUIを配置し直すたびに増える
+
         # コンテキスト
         self.context = BattleContext()
 
+        # 行動候補の計算（AllyPlanState で作成）
+        self.hint_worker: HintWorker | None = None
+
+        # リプレイ
+        self.replay_player: ReplayPlayer | None = None
+        self.replay_recorder: ReplayRecorder | None = None
+        seed = None
+        # 編成の大きさ（再生時はリプレイに記録された大きさ）
+        self.unit_count = self.game.unit_count
+        self.velocity_dice_count = self.game.velocity_dice_count
+        if self.game.replay_path:
+            replay = load_replay(self.game.replay_path)
+            self.replay_player = ReplayPlayer(replay)
+            seed = replay.seed
+            self.unit_count = replay.units
+            self.velocity_dice_count = replay.velocity_dice_count
+
         # システム
-        self.system = BattleSystem()
+        self.system = BattleSystem(BattleRng(seed), planner=create_planner(self.game.difficulty))
+        if self.game.record_path:
+            self.replay_recorder = ReplayRecorder(
+                self.game.record_path,
+                self.system.rng.seed,
+                units=self.unit_count,
+                velocity_dice_count=self.velocity_dice_count,
+            )
 
         # マッチ/一方攻撃の情報
         self.clash_infos = self.system.evaluate_clashes(self.all_slots)
@@ -50,6 +86,13 @@ class BattleScene(Scene):
         # バトル開始ボタン
         self.battle_start_button = BattleStartButton(self.game, size=(64, 64), pos=(self.game.screen.get_width() // 2 - 64/2, 10))
 
+        # 描画する層（内容が変わった層から上だけ描き直す）
+        self.compositor = Compositor()
+        self.compositor.add_layer("static", self._render_static, key=lambda: self.state_name)
+        self.compositor.add_layer("unit", self._render_units, key=self._get_units_layer_key)
+        self.compositor.add_layer("plan", lambda surface: self.state.render(surface), key=self._get_plan_layer_key)
+        self.compositor.add_layer("effect", self._render_effects)
+
     def handle(self):
         self.state.handle()
 
@@ -64,7 +107,17 @@ class BattleScene(Scene):
 
         self.state.update(dt)
 
+    def on_exit(self):
+        # 行動候補の計算スレッドを終了
+        if self.hint_worker:
+            self.hint_worker.close()
+            self.hint_worker = None
+
     def render(self, surface):
+        self.compositor.render(surface)
+
+    def _render_static(self, surface):
+        """背景・状態名・バトル開始ボタン"""
         surface.fill((200, 200, 200))
 
         # 現在の状態表示
@@ -76,6 +129,9 @@ class BattleScene(Scene):
             pos=(20, 20)
         )
 
+        self.battle_start_button.render(surface)
+
+    def _render_units(self, surface):
         # 味方UI表示
         for ally_ui in self.allies_ui:
             ally_ui.render(surface)
@@ -84,10 +140,47 @@ class BattleScene(Scene):
         for enemy_ui in self.enemies_ui:
             enemy_ui.render(surface)
 
-        self.battle_start_button.render(surface)
+    def _get_units_layer_key(self):
+        return self.layout_version, tuple(unit_ui.get_layer_key() for unit_ui in self.allies_ui + self.enemies_ui)
+
+    def _get_plan_layer_key(self):
+        key = self.state.layer_key()
+        return None if key is None else (self.state, key)
+
+    def _render_effects(self, surface):
+        """ダメージフラッシュ・数字ポップ"""
+        for unit_ui in self.allies_ui + self.enemies_ui:
+            unit_ui.render_effects(surface)
+
+    def collect_dirty(self, tracker) -> bool:
+        # 現在の状態表示
+        text_rect = render_text(self.font, self.state_name, True, (30, 30, 30)).get_rect(topleft=(20, 20))
+        tracker.mark("state_name", text_rect, self.state_name)
+
+        # ユニットUI
+        for unit_ui in self.allies_ui + self.enemies_ui:
+            rect, state = unit_ui.get_dirty_state()
+            tracker.mark(unit_ui, rect, state)
+
+        tracker.mark("battle_start_button", self.battle_start_button.rect)
 
         # 各状態ごとの表示
-        self.state.render(surface)
+        return self.state.collect_dirty(tracker)
+
+    def snapshot(self):
+        """戦闘の状態を保存（ステートや乱数の状態は含まない）"""
+        return self.system.snapshot(self.allies + self.enemies)
+
+    def restore(self, buf) -> None:
+        """保存した戦闘の状態に戻す"""
+        units = self.allies + self.enemies
+        self.system.restore(units, buf)
+
+        # 速度順とマッチ情報を作り直す
+        self.all_slots = self.system.get_action_order(units)
+        self.ally_slots = [v for v in self.all_slots if v.owner.is_ally]
+        self.enemy_slots = [v for v in self.all_slots if not v.owner.is_ally]
+        self.clash_infos = self.system.evaluate_clashes(self.all_slots)
 
     def change_state(self, next_state):
         """状態を変更する"""
@@ -102,19 +195,38 @@ class BattleScene(Scene):
         self.enemies_ui.clear()
         self.unit_ui_id_map.clear()
 
-        w, h = 128, 128
+        screen_w = self.game.screen.get_width()
 
         # 左：敵
-        enemy_pos_list = [(200, 250), (350, 100), (350, 400), (50, 100), (50, 400)]
+        size, enemy_pos_list = compute_unit_layout(len(self.enemies), screen_w, is_left=True)
         for i, unit in enumerate(self.enemies):
-            unit_ui = UnitView(game=self.game, unit=unit, size=(w, h), pos=enemy_pos_list[i])
+            unit_ui = UnitView(game=self.game, unit=unit, size=(size, size), pos=enemy_pos_list[i])
             self.enemies_ui.append(unit_ui)
             self.unit_ui_id_map[id(unit)] = unit_ui
 
         # 右：味方
-        screen_w = self.game.screen.get_width()
-        ally_pos_list = [(screen_w - 200 - w, 250), (screen_w - 350 - w, 100), (screen_w - 350 - w, 400), (screen_w - 50 - w, 100), (screen_w - 50 - w, 400)]
+        size, ally_pos_list = compute_unit_layout(len(self.allies), screen_w, is_left=False)
         for i, unit in enumerate(self.allies):
-            unit_ui = UnitView(game=self.game, unit=unit, size=(w, h), pos=ally_pos_list[i])
+            unit_ui = UnitView(game=self.game, unit=unit, size=(size, size), pos=ally_pos_list[i])
             self.allies_ui.append(unit_ui)
             self.unit_ui_id_map[id(unit)] = unit_ui
+
+        self._rebuild_hit_index()
+
+    def _rebuild_hit_index(self):
+        """速度ダイスUIの当たり判定を作り直す"""
+        self.layout_version += 1
+        self.vel_dice_views.clear()
+        self.vel_dice_hit_index.clear()
+        for unit_ui in self.allies_ui + self.enemies_ui:
+            for vel_dice_ui in unit_ui.vel_dice_ui_list:
+                self.vel_dice_views[vel_dice_ui.velocity_dice] = vel_dice_ui
+                self.vel_dice_hit_index.add(vel_dice_ui.rect, vel_dice_ui)
+
+    def get_vel_dice_view(self, vel_dice):
+        """速度ダイスのUI（ない場合は None）"""
+        return self.vel_dice_views.get(vel_dice)
+
+    def get_vel_dice_view_at(self, pos):
+        """座標にある速度ダイスのUI（ない場合は None）"""
+        return self.vel_dice_hit_index.query(pos)
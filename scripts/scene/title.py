@@ -24,6 +24,10 @@ class TitleScene(Scene):
     def update(self, dt):
         pass
 
+    def collect_dirty(self, tracker) -> bool:
+        # 毎フレーム同じ内容
+        return True
+
     def render(self, surface):
         surface.fill((50, 50, 50))
         draw_text(
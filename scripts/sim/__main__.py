@@ -0,0 +1,5 @@
+from scripts.sim.tournament import main
+
+
+if __name__ == "__main__":
+    main()
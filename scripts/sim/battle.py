@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from scripts.battle.engine import resolve_round
+from scripts.battle.system import BattleSystem
+from scripts.models.unit import Unit
+
+
+@dataclass
+class BattleResult:
+    """1戦闘の結果"""
+    winner: int     # 1: 味方の勝ち, -1: 敵の勝ち, 0: 引き分け（ラウンド上限）
+    rounds: int     # 経過ラウンド数
+    ally_hp: int    # 味方の残りHP合計
+    enemy_hp: int   # 敵の残りHP合計
+
+
+def _alive(units: list[Unit]) -> list[Unit]:
+    return [unit for unit in units if not unit.is_dead()]
+
+
+def run_battle(allies: list[Unit], enemies: list[Unit], system: BattleSystem | None = None, max_rounds: int = 100) -> BattleResult:
+    """
+    描画なしで1戦闘を最後まで進める
+
+    ・戦闘の流れは BattleScene の各ステートと同じ
+    ・味方も敵と同じ方針（BattleSystem.plan_enemy）で行動を決める
+    ・死亡したユニットは行動せず、ターゲットにもならない
+    """
+    if system is None:
+        system = BattleSystem()
+
+    system.start_battle(units=allies + enemies)
+
+    rounds = 0
+    while rounds < max_rounds:
+        alive_allies = _alive(allies)
+        alive_enemies = _alive(enemies)
+        if not alive_allies or not alive_enemies:
+            break
+
+        rounds += 1
+        units = alive_allies + alive_enemies
+
+        # ラウンド開始
+        for unit in units:
+            unit.init()
+        system.start_round(units)
+
+        # 速度順
+        all_slots = system.get_action_order(units)
+        ally_slots = [v for v in all_slots if v.owner.is_ally]
+        enemy_slots = [v for v in all_slots if not v.owner.is_ally]
+
+        # 行動決定
+        system.plan_enemy(enemy_slots=enemy_slots, ally_slots=ally_slots)
+        system.plan_enemy(enemy_slots=ally_slots, ally_slots=enemy_slots)
+
+        # 戦闘処理
+        resolve_round(system.evaluate_clashes(all_slots), rng=system.rng.dice)
+
+    alive_allies = _alive(allies)
+    alive_enemies = _alive(enemies)
+    if alive_allies and not alive_enemies:
+        winner = 1
+    elif alive_enemies and not alive_allies:
+        winner = -1
+    else:
+        winner = 0
+
+    return BattleResult(
+        winner=winner,
+        rounds=rounds,
+        ally_hp=sum(unit.hp for unit in allies),
+        enemy_hp=sum(unit.hp for unit in enemies),
+    )
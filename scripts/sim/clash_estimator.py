@@ -0,0 +1,202 @@
+import numpy as np
+from dataclasses import dataclass
+from scripts.models.card import CardSpec
+from scripts.battle.clash_rules import ATTACK, CLASH_TABLE, DICE_CATEGORY, ClashAmount, ClashEffect
+from scripts.models.dice import DieSpec, DiceType
+from scripts.models.unit import Unit, ResistanceProfile
+
+
+# DiceType -> 耐性プロファイルの添字
+TYPE_INDEX = {d_type: i for i, d_type in enumerate(DiceType)}
+
+
+def _rule_array(get) -> np.ndarray:
+    """マッチの規則表を [a の分類, b の分類, 比較結果 + 1] の配列に変換"""
+    return np.array([[[get(rule) for rule in rules] for rules in row] for row in CLASH_TABLE])
+
+
+# マッチの規則表（配列版）
+RULE_DAMAGE = _rule_array(lambda rule: rule.effect == ClashEffect.DAMAGE)
+RULE_CONFUSION = _rule_array(lambda rule: rule.effect in (ClashEffect.DAMAGE, ClashEffect.CONFUSION_DAMAGE))
+RULE_HEAL = _rule_array(lambda rule: rule.effect == ClashEffect.HEAL_CONFUSION)
+RULE_DIFF = _rule_array(lambda rule: rule.amount == ClashAmount.DIFF)
+RULE_CONSUME_A = _rule_array(lambda rule: rule.consume_a).astype(np.int64)
+RULE_CONSUME_B = _rule_array(lambda rule: rule.consume_b).astype(np.int64)
+
+
+@dataclass
+class ClashEstimate:
+    """
+    カード同士のマッチの推定結果
+
+    ダメージ/回復は受けた側ごとの期待値（死亡・混乱による打ち切りは考慮しない）
+    """
+    trials: int
+    a_win_rate: float   # a がダイス勝利数で上回った割合
+    b_win_rate: float
+    draw_rate: float
+    a_hp_damage: float          # a が受けるHPダメージ
+    a_confusion_damage: float   # a が受ける混乱耐性ダメージ
+    a_confusion_heal: float     # a の混乱耐性回復
+    b_hp_damage: float
+    b_confusion_damage: float
+    b_confusion_heal: float
+    a_remaining_dist: np.ndarray    # マッチ終了時の a の残りダイス数の分布
+    b_remaining_dist: np.ndarray
+
+
+def _dice_arrays(dice_list: list[DieSpec]):
+    """ダイスリストを配列に変換 (最小値, 最大値+1, 分類, 種類)"""
+    lo = np.array([die.min_val for die in dice_list], dtype=np.int64)
+    hi = np.array([die.max_val + 1 for die in dice_list], dtype=np.int64)
+    cat = np.array([DICE_CATEGORY[die.d_type] for die in dice_list], dtype=np.int64)
+    kind = np.array([TYPE_INDEX[die.d_type] for die in dice_list], dtype=np.int64)
+    return lo, hi, cat, kind
+
+
+def estimate_clash(
+    a_dice_list: list[DieSpec],
+    b_dice_list: list[DieSpec],
+    a_profile: ResistanceProfile,
+    b_profile: ResistanceProfile,
+    trials: int = 100_000,
+    rng: np.random.Generator | int | None = None,
+    batch_size: int = 1 << 18,
+) -> ClashEstimate:
+    """
+    カード同士のマッチを trials 回まとめてシミュレーションする
+
+    ・ダイス比較のルールは BattleEngine と共通の規則表（clash_rules.CLASH_TABLE）
+    ・片方のダイスが切れた後の残りの攻撃ダイスは一方攻撃として加算
+    """
+    if not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng)
+
+    a_len = len(a_dice_list)
+    b_len = len(b_dice_list)
+
+    totals = np.zeros(6, dtype=np.float64)
+    wins = np.zeros(3, dtype=np.int64)
+    a_remaining = np.zeros(a_len + 1, dtype=np.int64)
+    b_remaining = np.zeros(b_len + 1, dtype=np.int64)
+
+    done = 0
+    while done < trials:
+        n = min(batch_size, trials - done)
+        a_hp, a_conf, a_heal, b_hp, b_conf, b_heal, a_wins, b_wins, ai, bi = _simulate_batch(
+            a_dice_list, b_dice_list, a_profile, b_profile, n, rng,
+        )
+        totals += [a_hp.sum(), a_conf.sum(), a_heal.sum(), b_hp.sum(), b_conf.sum(), b_heal.sum()]
+        wins += [np.count_nonzero(a_wins > b_wins), np.count_nonzero(a_wins < b_wins), np.count_nonzero(a_wins == b_wins)]
+        a_remaining += np.bincount(a_len - ai, minlength=a_len + 1)
+        b_remaining += np.bincount(b_len - bi, minlength=b_len + 1)
+        done += n
+
+    means = totals / trials
+    return ClashEstimate(
+        trials=trials,
+        a_win_rate=wins[0] / trials,
+        b_win_rate=wins[1] / trials,
+        draw_rate=wins[2] / trials,
+        a_hp_damage=means[0],
+        a_confusion_damage=means[1],
+        a_confusion_heal=means[2],
+        b_hp_damage=means[3],
+        b_confusion_damage=means[4],
+        b_confusion_heal=means[5],
+        a_remaining_dist=a_remaining / trials,
+        b_remaining_dist=b_remaining / trials,
+    )
+
+
+def estimate_card_clash(a_card: CardSpec, b_card: CardSpec, a_unit: Unit, b_unit: Unit, trials: int = 100_000, rng=None) -> ClashEstimate:
+    """ユニットの耐性を使ってカード同士のマッチを推定する"""
+    return estimate_clash(
+        a_card.dice_list,
+        b_card.dice_list,
+        a_unit.get_resistance_profile(),
+        b_unit.get_resistance_profile(),
+        trials=trials,
+        rng=rng,
+    )
+
+
+def _simulate_batch(a_dice_list, b_dice_list, a_profile, b_profile, n, rng):
+    """n 試行分のマッチを配列演算で処理"""
+    a_lo, a_hi, a_cat, a_kind = _dice_arrays(a_dice_list)
+    b_lo, b_hi, b_cat, b_kind = _dice_arrays(b_dice_list)
+    a_len = len(a_dice_list)
+    b_len = len(b_dice_list)
+
+    # 受ける側の倍率（攻撃側のダイス種類で引く）
+    a_hp_mul = np.array(a_profile.hp)
+    a_conf_mul = np.array(a_profile.confusion)
+    b_hp_mul = np.array(b_profile.hp)
+    b_conf_mul = np.array(b_profile.confusion)
+
+    ai = np.zeros(n, dtype=np.int64)
+    bi = np.zeros(n, dtype=np.int64)
+    a_hp = np.zeros(n, dtype=np.int64)
+    a_conf = np.zeros(n, dtype=np.int64)
+    a_heal = np.zeros(n, dtype=np.int64)
+    b_hp = np.zeros(n, dtype=np.int64)
+    b_conf = np.zeros(n, dtype=np.int64)
+    b_heal = np.zeros(n, dtype=np.int64)
+    a_wins = np.zeros(n, dtype=np.int64)
+    b_wins = np.zeros(n, dtype=np.int64)
+
+    # マッチ（1ステップで最低1つはダイスを消費する）
+    for _ in range(a_len + b_len):
+        idx = np.flatnonzero((ai < a_len) & (bi < b_len))
+        if idx.size == 0:
+            break
+
+        ia = ai[idx]
+        ib = bi[idx]
+        av = rng.integers(a_lo[ia], a_hi[ia])
+        bv = rng.integers(b_lo[ib], b_hi[ib])
+        ac = a_cat[ia]
+        bc = b_cat[ib]
+        ak = a_kind[ia]
+        bk = b_kind[ib]
+        a_gt = av > bv
+        a_lt = av < bv
+
+        a_wins[idx] += a_gt
+        b_wins[idx] += a_lt
+
+        # 規則表を引く
+        sign = a_gt.astype(np.int64) - a_lt + 1
+        damage = RULE_DAMAGE[ac, bc, sign]
+        confusion = RULE_CONFUSION[ac, bc, sign]
+        heal = RULE_HEAL[ac, bc, sign]
+        amount = np.where(a_gt, av, bv) - np.where(RULE_DIFF[ac, bc, sign], np.where(a_gt, bv, av), 0)
+
+        # b が受けるダメージ（a の勝ち、a のダイスの種類で耐性を引く）
+        b_hp[idx] += (amount * (damage & a_gt) * b_hp_mul[ak]).astype(np.int64)
+        b_conf[idx] += (amount * (confusion & a_gt) * b_conf_mul[ak]).astype(np.int64)
+        # a が受けるダメージ
+        a_hp[idx] += (amount * (damage & a_lt) * a_hp_mul[bk]).astype(np.int64)
+        a_conf[idx] += (amount * (confusion & a_lt) * a_conf_mul[bk]).astype(np.int64)
+
+        # 勝った側の混乱耐性回復
+        a_heal[idx] += amount * (heal & a_gt)
+        b_heal[idx] += amount * (heal & a_lt)
+
+        # ダイスの消費（攻撃ダイスに勝った回避ダイスは再利用）
+        ai[idx] += RULE_CONSUME_A[ac, bc, sign]
+        bi[idx] += RULE_CONSUME_B[ac, bc, sign]
+
+    # 残りの攻撃ダイスは一方攻撃（攻撃ダイスのないカードは全て保存）
+    for j in np.flatnonzero(a_cat == ATTACK):
+        idx = np.flatnonzero(ai <= j)
+        val = rng.integers(a_lo[j], a_hi[j], size=idx.size)
+        b_hp[idx] += (val * b_hp_mul[a_kind[j]]).astype(np.int64)
+        b_conf[idx] += (val * b_conf_mul[a_kind[j]]).astype(np.int64)
+    for j in np.flatnonzero(b_cat == ATTACK):
+        idx = np.flatnonzero(bi <= j)
+        val = rng.integers(b_lo[j], b_hi[j], size=idx.size)
+        a_hp[idx] += (val * a_hp_mul[b_kind[j]]).astype(np.int64)
+        a_conf[idx] += (val * a_conf_mul[b_kind[j]]).astype(np.int64)
+
+    return a_hp, a_conf, a_heal, b_hp, b_conf, b_heal, a_wins, b_wins, ai, bi
@@ -0,0 +1,130 @@
+import argparse
+import random
+import time
+from dataclasses import dataclass
+from scripts.models.card import CardSpec
+from scripts.models.deck import Deck
+from scripts.utils.dev_utils import create_sample_cards
+
+
+@dataclass
+class _ListDeck:
+    """比較用：draw_many/peek/スロット指定の削除を追加する前の Deck"""
+    card_list: list[CardSpec]    # カードリスト
+
+    def __post_init__(self):
+        self.draw_pile = self.card_list.copy()  # 山札
+        self.hand_cards = []
+        self.hand_limit = 9
+
+    def shuffle_draw_pile(self, rng=random):
+        """山札をシャッフル"""
+        rng.shuffle(self.draw_pile)
+
+    def remove_card(self, card: CardSpec):
+        self.hand_cards.remove(card)
+
+    def draw(self, num: int, rng=random):
+        """カードを山札から引く"""
+        for _ in range(num):
+
+            # 山札が空の場合、補充してシャッフル
+            if len(self.draw_pile) <= 0:
+                self.draw_pile = self.card_list.copy()
+                self.shuffle_draw_pile(rng)
+
+            draw_card = self.draw_pile.pop()
+
+            # 手札が上限に達していない場合、手札に加える
+            if len(self.hand_cards) < self.hand_limit:
+                self.hand_cards.append(draw_card)
+
+
+def bench_bulk_draw(deck_cls, cards: list[CardSpec], draws: int, seed: int, use_many: bool) -> float:
+    """
+    draws 枚をまとめて引く（手札が上限になった後は捨てる）
+
+    ・use_many=True の場合は draw_many で引く（新しい Deck のみ）
+    """
+    deck = deck_cls(cards)
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    if use_many:
+        deck.draw_many(draws, rng)
+    else:
+        deck.draw(draws, rng)
+    return time.perf_counter() - start
+
+
+def bench_draw_play(deck_cls, cards: list[CardSpec], draws: int, seed: int, use_slots: bool) -> float:
+    """
+    1枚引いて手札の先頭を1枚使う、を draws 回繰り返す（ラウンドごとの引き/行動決定と同じ使い方）
+
+    ・手札は上限 - 1 枚まで埋めてから計測する
+    ・use_slots=True の場合はスロット（先頭なので 0）を指定して remove_slot で取り除く（新しい Deck のみ）
+    """
+    deck = deck_cls(cards)
+    rng = random.Random(seed)
+    deck.draw(deck.hand_limit - 1, rng)
+
+    start = time.perf_counter()
+    if use_slots:
+        for _ in range(draws):
+            deck.draw(1, rng)
+            deck.remove_slot(0)
+    else:
+        for _ in range(draws):
+            deck.draw(1, rng)
+            deck.remove_card(deck.hand_cards[0])
+    return time.perf_counter() - start
+
+
+def check_same_hands(cards: list[CardSpec], draws: int, seed: int) -> bool:
+    """同じシードで以前の Deck と同じ順番で引けるか（draw_many と1枚ずつの draw も比較）"""
+    old, new = _ListDeck(cards), Deck(cards)
+    old.hand_limit = new.hand_limit = draws
+    old.draw(draws, random.Random(seed))
+    if new.draw_many(draws, random.Random(seed)) != old.hand_cards:
+        return False
+
+    old, new = _ListDeck(cards), Deck(cards)
+    old_rng, new_rng = random.Random(seed), random.Random(seed)
+    old.draw(old.hand_limit - 1, old_rng)
+    new.draw(new.hand_limit - 1, new_rng)
+    for _ in range(draws):
+        old.draw(1, old_rng)
+        new.draw(1, new_rng)
+        if old.hand_cards != new.hand_cards:
+            return False
+        old.remove_card(old.hand_cards[0])
+        new.remove_slot(new.hand_slots()[0][0])
+    return True
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m scripts.sim.deck_bench", description="Deck の引き/手札の削除の時間を以前の実装と比較する")
+    parser.add_argument("--draws", type=int, default=1_000_000, help="引く枚数")
+    parser.add_argument("--repeat", type=int, default=3, help="繰り返し回数（最速の結果を表示）")
+    parser.add_argument("--seed", type=int, default=0, help="乱数のシード")
+    args = parser.parse_args(argv)
+
+    cards = create_sample_cards()
+    cases = [
+        ("bulk draw_many", lambda: bench_bulk_draw(_ListDeck, cards, args.draws, args.seed, use_many=False),
+                           lambda: bench_bulk_draw(Deck, cards, args.draws, args.seed, use_many=True)),
+        ("draw + remove_card", lambda: bench_draw_play(_ListDeck, cards, args.draws, args.seed, use_slots=False),
+                               lambda: bench_draw_play(Deck, cards, args.draws, args.seed, use_slots=False)),
+        ("draw + remove_slot", lambda: bench_draw_play(_ListDeck, cards, args.draws, args.seed, use_slots=False),
+                               lambda: bench_draw_play(Deck, cards, args.draws, args.seed, use_slots=True)),
+    ]
+
+    print(f"draws: {args.draws}, same hands as list deck: {check_same_hands(cards, min(args.draws, 10_000), args.seed)}")
+    print(f"{'case':<20} {'list (s)':>9} {'deck (s)':>9} {'ratio':>7}")
+    for name, run_old, run_new in cases:
+        old = min(run_old() for _ in range(args.repeat))
+        new = min(run_new() for _ in range(args.repeat))
+        print(f"{name:<20} {old:>9.3f} {new:>9.3f} {old / new:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import time
+from scripts.battle.engine import resolve_round
+from scripts.battle.replay import Replay, ReplayPlayer, apply_plan, load_replay
+from scripts.battle.rng import BattleRng
+from scripts.battle.system import BattleSystem
+from scripts.models.unit import Unit
+from scripts.sim.roster import Roster
+
+
+def play_replay(replay: Replay, roster: Roster | None = None) -> tuple[list[Unit], list[Unit]]:
+    """
+    リプレイを描画なしで最後まで再生し、(味方, 敵) の最終状態を返す
+
+    ・処理の順番は BattleScene の各ステートと同じ（ResolveState の待ち時間なし）
+    ・roster がない場合はリプレイに記録された大きさのサンプル編成
+    """
+    if roster is None:
+        roster = Roster(units=replay.units, velocity_dice_count=replay.velocity_dice_count)
+
+    # 戦闘開始
+    allies, enemies = roster.build()
+    units = allies + enemies
+    system = BattleSystem(BattleRng(replay.seed))
+    system.start_battle(units)
+
+    player = ReplayPlayer(replay)
+    while not player.is_finished():
+        # ラウンド開始
+        for unit in units:
+            unit.init()
+        system.start_round(units)
+        all_slots = system.get_action_order(units)
+
+        # 敵/味方の行動決定
+        replay_round = player.next_round()
+        apply_plan(replay_round.enemy, all_slots)
+        apply_plan(replay_round.ally, all_slots)
+
+        # 戦闘処理
+        resolve_round(system.evaluate_clashes(all_slots), rng=system.rng.dice)
+
+    return allies, enemies
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m scripts.sim.replay", description="リプレイを描画なしで再生する")
+    parser.add_argument("path", help="リプレイファイル")
+    parser.add_argument("--repeat", type=int, default=1, help="繰り返し回数（計測用）")
+    args = parser.parse_args(argv)
+
+    replay = load_replay(args.path)
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        allies, enemies = play_replay(replay)
+    elapsed = time.perf_counter() - start
+
+    for unit in allies + enemies:
+        print(f"{unit.name}: HP {unit.hp}/{unit.max_hp}, Confusion {unit.confusion_resist}/{unit.max_confusion_resist}")
+    print(f"rounds: {len(replay.rounds)}, elapsed: {elapsed:.3f}s ({args.repeat / elapsed:.1f} replays/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import json
+from scripts.models.card import CardSpec
+from scripts.models.deck import Deck
+from scripts.models.dice import DieSpec, DiceType
+from scripts.models.unit import Unit, ResistanceType
+from scripts.utils.dev_utils import create_sample_cards, create_sample_units
+
+
+# データファイルで指定できるユニットの耐性項目
+RESISTANCE_FIELDS = [
+    "hp_slash_resistance",
+    "hp_pierce_resistance",
+    "hp_blunt_resistance",
+    "confusion_slash_resistance",
+    "confusion_pierce_resistance",
+    "confusion_blunt_resistance",
+]
+
+
+class Roster:
+    """
+    シミュレーション用の編成
+
+    build() を呼ぶたびに新しいユニットを作成する（カードは変更不可なので全ユニットで共有）
+
+    Args:
+        data (dict | None): 編成データ（None の場合はサンプル編成）
+        units (int): サンプル編成の1陣営のユニット数
+        velocity_dice_count (int): サンプル編成のユニットごとの速度ダイスの数
+    """
+
+    def __init__(self, data: dict | None = None, units: int = 3, velocity_dice_count: int = 1):
+        self.data = data
+        self.units = units
+        self.velocity_dice_count = velocity_dice_count
+
+        self._cards: dict[str, CardSpec] = {}
+        if data is None:
+            self._sample_cards = create_sample_cards()
+        else:
+            for card_data in data["cards"]:
+                card = CardSpec(
+                    id=card_data["id"],
+                    name=card_data.get("name", card_data["id"]),
+                    cost=card_data["cost"],
+                    dice_list=[
+                        DieSpec(min_val=d["min"], max_val=d["max"], d_type=DiceType[d["type"]])
+                        for d in card_data["dice"]
+                    ],
+                )
+                self._cards[card.id] = card
+
+    def build(self) -> tuple[list[Unit], list[Unit]]:
+        """(味方ユニット一覧, 敵ユニット一覧) を作成"""
+        if self.data is None:
+            deck = Deck(self._sample_cards)
+            return (
+                create_sample_units(deck, num=self.units, is_ally=True, velocity_dice_count=self.velocity_dice_count),
+                create_sample_units(deck, num=self.units, is_ally=False, velocity_dice_count=self.velocity_dice_count),
+            )
+
+        allies = [self._create_unit(unit_data, is_ally=True) for unit_data in self.data["allies"]]
+        enemies = [self._create_unit(unit_data, is_ally=False) for unit_data in self.data["enemies"]]
+        return allies, enemies
+
+    def _create_unit(self, unit_data: dict, is_ally: bool) -> Unit:
+        resistances = {
+            name: ResistanceType[unit_data[name]]
+            for name in RESISTANCE_FIELDS if name in unit_data
+        }
+        return Unit(
+            name=unit_data["name"],
+            max_hp=unit_data["max_hp"],
+            max_confusion_resist=unit_data["max_confusion_resist"],
+            max_light=unit_data["max_light"],
+            min_speed=unit_data["min_speed"],
+            max_speed=unit_data["max_speed"],
+            deck=Deck([self._cards[card_id] for card_id in unit_data["deck"]]),
+            is_ally=is_ally,
+            velocity_dice_count=unit_data.get("velocity_dice", 1),
+            sprite=unit_data.get("sprite"),
+            **resistances,
+        )
+
+
+def load_roster(path: str | None, units: int = 3, velocity_dice_count: int = 1) -> Roster:
+    """
+    編成データを読み込む（path が None の場合はサンプル編成。units, velocity_dice_count はサンプル編成のみ）
+
+    データファイル（JSON）の形式:
+        {
+            "cards": [{"id": "one_slash", "cost": 1, "dice": [{"min": 1, "max": 6, "type": "SLASH"}]}],
+            "allies": [{"name": "ally/1", "max_hp": 30, "max_confusion_resist": 20, "max_light": 3,
+                        "min_speed": 1, "max_speed": 6, "deck": ["one_slash"],
+                        "velocity_dice": 1, "sprite": "ally/1"}],   # velocity_dice, sprite は省略可
+            "enemies": [...]
+        }
+    """
+    if path is None:
+        return Roster(units=units, velocity_dice_count=velocity_dice_count)
+
+    with open(path, encoding="utf-8") as f:
+        return Roster(json.load(f))
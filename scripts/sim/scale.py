@@ -0,0 +1,97 @@
+import argparse
+import time
+from dataclasses import dataclass
+from scripts.battle.engine import resolve_round
+from scripts.battle.rng import BattleRng
+from scripts.battle.system import BattleSystem
+from scripts.sim.roster import Roster
+
+
+@dataclass
+class ScaleResult:
+    """1つの編成サイズの計測結果（1ラウンドあたりの平均、ミリ秒）"""
+    units: int          # 1陣営のユニット数
+    dice: int           # ユニットごとの速度ダイスの数
+    rounds: int         # 計測したラウンド数
+    order_ms: float     # ラウンド開始 + 速度順
+    plan_ms: float      # 敵/味方の行動決定
+    clash_ms: float     # マッチ判定
+    resolve_ms: float   # 戦闘処理
+
+    @property
+    def total_ms(self) -> float:
+        return self.order_ms + self.plan_ms + self.clash_ms + self.resolve_ms
+
+
+def measure(units: int, dice: int, battles: int = 3, max_rounds: int = 20, seed: int = 0) -> ScaleResult:
+    """
+    N 対 N（速度ダイス K 個）の戦闘を描画なしで進め、処理ごとの時間を計測する
+
+    ・行動決定は BattleSystem.plan_enemy（ランダム）を味方/敵の両方に使う
+    ・死亡したユニットは行動しない（sim.battle.run_battle と同じ流れ）
+    """
+    roster = Roster(units=units, velocity_dice_count=dice)
+    totals = [0.0, 0.0, 0.0, 0.0]
+    rounds = 0
+    clock = time.perf_counter
+
+    for i in range(battles):
+        allies, enemies = roster.build()
+        system = BattleSystem(BattleRng(f"{seed}/{units}/{dice}/{i}"))
+        system.start_battle(allies + enemies)
+
+        for _ in range(max_rounds):
+            alive = [unit for unit in allies + enemies if not unit.is_dead()]
+            if all(unit.is_ally for unit in alive) or not any(unit.is_ally for unit in alive):
+                break
+            rounds += 1
+
+            t0 = clock()
+            for unit in alive:
+                unit.init()
+            system.start_round(alive)
+            all_slots = system.get_action_order(alive)
+            ally_slots = [v for v in all_slots if v.owner.is_ally]
+            enemy_slots = [v for v in all_slots if not v.owner.is_ally]
+
+            t1 = clock()
+            system.plan_enemy(enemy_slots=enemy_slots, ally_slots=ally_slots)
+            system.plan_enemy(enemy_slots=ally_slots, ally_slots=enemy_slots)
+
+            t2 = clock()
+            clash_infos = system.evaluate_clashes(all_slots)
+
+            t3 = clock()
+            resolve_round(clash_infos, rng=system.rng.dice)
+            t4 = clock()
+
+            totals[0] += t1 - t0
+            totals[1] += t2 - t1
+            totals[2] += t3 - t2
+            totals[3] += t4 - t3
+
+    n = max(1, rounds)
+    order_ms, plan_ms, clash_ms, resolve_ms = (total / n * 1000 for total in totals)
+    return ScaleResult(units, dice, rounds, order_ms, plan_ms, clash_ms, resolve_ms)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m scripts.sim.scale", description="編成サイズごとの行動決定/戦闘処理の時間を計測する")
+    parser.add_argument("--units", type=int, nargs="+", default=[3, 5, 10, 20, 40], help="1陣営のユニット数")
+    parser.add_argument("--dice", type=int, nargs="+", default=[1, 3], help="ユニットごとの速度ダイスの数")
+    parser.add_argument("--battles", type=int, default=3, help="編成ごとの戦闘数")
+    parser.add_argument("--max-rounds", type=int, default=20, help="1戦闘の最大ラウンド数")
+    args = parser.parse_args(argv)
+
+    print(f"{'N':>4} {'K':>3} {'dice':>6} {'rounds':>7} {'order':>8} {'plan':>8} {'clash':>8} {'resolve':>8} {'total':>8}  (ms/round)")
+    for dice in args.dice:
+        for units in args.units:
+            r = measure(units, dice, battles=args.battles, max_rounds=args.max_rounds)
+            print(
+                f"{r.units:>4} {r.dice:>3} {2 * r.units * r.dice:>6} {r.rounds:>7} "
+                f"{r.order_ms:>8.3f} {r.plan_ms:>8.3f} {r.clash_ms:>8.3f} {r.resolve_ms:>8.3f} {r.total_ms:>8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
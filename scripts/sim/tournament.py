@@ -0,0 +1,131 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from scripts.battle.planner import Difficulty, create_planner
+from scripts.battle.rng import BattleRng
+from scripts.battle.system import BattleSystem
+from scripts.sim.battle import BattleResult, run_battle
+from scripts.sim.roster import load_roster
+
+
+@dataclass
+class TournamentStats:
+    """複数戦闘の集計結果"""
+    battles: int = 0
+    ally_wins: int = 0
+    enemy_wins: int = 0
+    draws: int = 0
+    rounds: int = 0     # ラウンド数の合計
+    ally_hp: int = 0    # 味方の残りHP合計
+    enemy_hp: int = 0   # 敵の残りHP合計
+
+    def add(self, result: BattleResult) -> None:
+        self.battles += 1
+        if result.winner > 0:
+            self.ally_wins += 1
+        elif result.winner < 0:
+            self.enemy_wins += 1
+        else:
+            self.draws += 1
+        self.rounds += result.rounds
+        self.ally_hp += result.ally_hp
+        self.enemy_hp += result.enemy_hp
+
+    def merge(self, other: "TournamentStats") -> None:
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+
+def run_chunk(
+    roster_path: str | None,
+    seed: int,
+    start: int,
+    num_battles: int,
+    max_rounds: int,
+    units: int = 3,
+    velocity_dice_count: int = 1,
+    difficulty: Difficulty = Difficulty.EASY,
+) -> TournamentStats:
+    """
+    戦闘をまとめて実行し、集計結果だけを返す（ワーカープロセスで実行）
+
+    乱数は戦闘ごとに通し番号（start から）で決めるので、ワーカー数やチャンクの大きさによらず結果は同じになる
+    """
+    roster = load_roster(roster_path, units=units, velocity_dice_count=velocity_dice_count)
+    stats = TournamentStats()
+    for i in range(num_battles):
+        allies, enemies = roster.build()
+        system = BattleSystem(BattleRng(f"{seed}/{start + i}"), planner=create_planner(difficulty))
+        stats.add(run_battle(allies, enemies, system=system, max_rounds=max_rounds))
+    return stats
+
+
+def run_tournament(
+    battles: int,
+    workers: int,
+    seed: int = 0,
+    chunk_size: int = 500,
+    roster_path: str | None = None,
+    max_rounds: int = 100,
+    units: int = 3,
+    velocity_dice_count: int = 1,
+    difficulty: Difficulty = Difficulty.EASY,
+) -> TournamentStats:
+    """戦闘を複数プロセスで実行して集計する"""
+    chunks = []
+    for start in range(0, battles, chunk_size):
+        chunks.append((roster_path, seed, start, min(chunk_size, battles - start), max_rounds, units, velocity_dice_count, difficulty))
+
+    total = TournamentStats()
+
+    # 1プロセスの場合はそのまま実行
+    if workers <= 1:
+        for chunk in chunks:
+            total.merge(run_chunk(*chunk))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_chunk, *chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            total.merge(future.result())
+
+    return total
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m scripts.sim", description="描画なしで戦闘をまとめて実行する")
+    parser.add_argument("--battles", type=int, default=1000, help="戦闘数")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="ワーカープロセス数")
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    parser.add_argument("--chunk-size", type=int, default=500, help="1回のやり取りでまとめて実行する戦闘数")
+    parser.add_argument("--roster", default=None, help="編成データ（JSON）。省略時はサンプル編成")
+    parser.add_argument("--max-rounds", type=int, default=100, help="1戦闘の最大ラウンド数")
+    parser.add_argument("--units", type=int, default=3, help="サンプル編成の1陣営のユニット数")
+    parser.add_argument("--dice", type=int, default=1, help="サンプル編成のユニットごとの速度ダイスの数")
+    parser.add_argument("--difficulty", default=Difficulty.EASY.value, choices=[d.value for d in Difficulty], help="両陣営の行動決定（easy 以外は制限時間で探索するので結果は実行ごとに変わる）")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = run_tournament(
+        battles=args.battles,
+        workers=args.workers,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        roster_path=args.roster,
+        max_rounds=args.max_rounds,
+        units=args.units,
+        velocity_dice_count=args.dice,
+        difficulty=Difficulty(args.difficulty),
+    )
+    elapsed = time.perf_counter() - start
+
+    n = max(1, stats.battles)
+    print(f"battles:    {stats.battles}")
+    print(f"ally wins:  {stats.ally_wins} ({stats.ally_wins / n:.1%})")
+    print(f"enemy wins: {stats.enemy_wins} ({stats.enemy_wins / n:.1%})")
+    print(f"draws:      {stats.draws} ({stats.draws / n:.1%})")
+    print(f"avg rounds: {stats.rounds / n:.2f}")
+    print(f"avg hp:     ally {stats.ally_hp / n:.2f} / enemy {stats.enemy_hp / n:.2f}")
+    print(f"elapsed:    {elapsed:.2f}s ({stats.battles / elapsed:.0f} battles/s, workers={args.workers})")
@@ -0,0 +1,161 @@
+import numpy as np
+from dataclasses import dataclass
+from scripts.models.dice import DiceType
+from scripts.models.unit import Unit
+from scripts.sim.clash_estimator import TYPE_INDEX
+
+
+@dataclass
+class UnitBatch:
+    """
+    複数戦闘のユニットの状態を配列（戦闘 × ユニット）でまとめて持つ
+
+    ・各処理は Unit の同名メソッドと同じ計算を全戦闘に対して一度に行う
+    ・mask（戦闘 × ユニット）を渡した場合はその要素だけ処理する
+    ・ダイスの種類は DiceType 1つ、または TYPE_INDEX の番号の配列（戦闘 × ユニット）で渡す
+    ・Unit とは独立しているので、必要に応じて from_units / write_back で同期する
+    """
+    names: list[str]                    # ユニット名（列ごと）
+    is_ally: np.ndarray                 # 味方判定 (unit,)
+    max_hp: np.ndarray                  # 最大HP (battle, unit)
+    max_confusion_resist: np.ndarray    # 最大混乱耐性
+    max_light: np.ndarray               # 最大光
+    hp: np.ndarray                      # 現在のHP
+    confusion_resist: np.ndarray        # 現在の混乱耐性
+    light: np.ndarray                   # 現在の光
+    hp_resistance: np.ndarray           # HPの耐性倍率 (battle, unit, DiceType)
+    confusion_resistance: np.ndarray    # 混乱耐性の耐性倍率 (battle, unit, DiceType)
+
+    @classmethod
+    def from_units(cls, battles: list[list[Unit]]) -> "UnitBatch":
+        """戦闘ごとのユニット一覧（並びは全戦闘で同じ）から作成"""
+        first = battles[0]
+        if any(len(units) != len(first) for units in battles):
+            raise ValueError("戦闘ごとのユニット数が異なります")
+
+        def field(get, dtype=np.int64):
+            return np.array([[get(unit) for unit in units] for units in battles], dtype=dtype)
+
+        profiles = [[unit.get_resistance_profile() for unit in units] for units in battles]
+        return cls(
+            names=[unit.name for unit in first],
+            is_ally=np.array([unit.is_ally for unit in first], dtype=bool),
+            max_hp=field(lambda u: u.max_hp),
+            max_confusion_resist=field(lambda u: u.max_confusion_resist),
+            max_light=field(lambda u: u.max_light),
+            hp=field(lambda u: u.hp),
+            confusion_resist=field(lambda u: u.confusion_resist),
+            light=field(lambda u: u.light),
+            hp_resistance=np.array([[p.hp for p in row] for row in profiles], dtype=np.float64),
+            confusion_resistance=np.array([[p.confusion for p in row] for row in profiles], dtype=np.float64),
+        )
+
+    @classmethod
+    def tile(cls, units: list[Unit], battles: int) -> "UnitBatch":
+        """同じユニット構成の戦闘を battles 個作成"""
+        one = cls.from_units([units])
+
+        def rep(array: np.ndarray) -> np.ndarray:
+            return np.repeat(array, battles, axis=0)
+
+        return cls(
+            names=one.names,
+            is_ally=one.is_ally,
+            max_hp=rep(one.max_hp),
+            max_confusion_resist=rep(one.max_confusion_resist),
+            max_light=rep(one.max_light),
+            hp=rep(one.hp),
+            confusion_resist=rep(one.confusion_resist),
+            light=rep(one.light),
+            hp_resistance=rep(one.hp_resistance),
+            confusion_resistance=rep(one.confusion_resistance),
+        )
+
+    @property
+    def battles(self) -> int:
+        return self.hp.shape[0]
+
+    @property
+    def units(self) -> int:
+        return self.hp.shape[1]
+
+    def write_back(self, battles: list[list[Unit]]) -> None:
+        """現在の HP/混乱耐性/光 を Unit に書き戻す"""
+        for b, units in enumerate(battles):
+            for u, unit in enumerate(units):
+                unit.hp = int(self.hp[b, u])
+                unit.confusion_resist = int(self.confusion_resist[b, u])
+                unit.light = int(self.light[b, u])
+
+    # 判定 ---------------------------------------------------
+    def is_confused(self) -> np.ndarray:
+        return self.confusion_resist <= 0
+
+    def is_dead(self) -> np.ndarray:
+        return self.hp <= 0
+
+    def can_play_card(self, cost) -> np.ndarray:
+        """コスト（スカラーまたは戦闘 × ユニット）のカードをプレイできるか"""
+        return (self.light >= cost) & ~self.is_confused()
+
+    def is_finished(self) -> np.ndarray:
+        """味方か敵が全滅した戦闘 (battle,)"""
+        alive = ~self.is_dead()
+        return ~(alive[:, self.is_ally].any(axis=1) & alive[:, ~self.is_ally].any(axis=1))
+    # -------------------------------------------------------
+
+    # 光 -----------------------------------------------------
+    def recover_light(self, amount=1, mask: np.ndarray | None = None) -> None:
+        amount = _masked(amount, mask)
+        np.minimum(self.max_light, self.light + amount, out=self.light)
+
+    def pay_light(self, cost, mask: np.ndarray | None = None) -> np.ndarray:
+        """光を払う（足りない要素は払わない）。払えたかどうかを返す"""
+        paid = self.light >= cost
+        if mask is not None:
+            paid &= mask
+        self.light -= np.where(paid, cost, 0)
+        return paid
+    # -------------------------------------------------------
+
+    # ダメージ/回復 -----------------------------------------
+    def take_damage(self, damage, dice_type, mask: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        hp_damage = self.take_hp_damage(damage, dice_type, mask)
+        confusion_damage = self.take_confusion_resist_damage(damage, dice_type, mask)
+        return hp_damage, confusion_damage
+
+    def take_hp_damage(self, damage, dice_type, mask: np.ndarray | None = None) -> np.ndarray:
+        """HPダメージを受ける"""
+        dmg = (_masked(damage, mask) * self._resistance(self.hp_resistance, dice_type)).astype(np.int64)
+        np.maximum(0, self.hp - dmg, out=self.hp)
+        return dmg
+
+    def take_confusion_resist_damage(self, damage, dice_type, mask: np.ndarray | None = None) -> np.ndarray:
+        """混乱抵抗値ダメージを受ける"""
+        dmg = (_masked(damage, mask) * self._resistance(self.confusion_resistance, dice_type)).astype(np.int64)
+        np.maximum(0, self.confusion_resist - dmg, out=self.confusion_resist)
+        return dmg
+
+    def heal_hp(self, amount, mask: np.ndarray | None = None) -> None:
+        """HPを回復する"""
+        np.minimum(self.max_hp, self.hp + _masked(amount, mask), out=self.hp)
+
+    def heal_confusion_resist(self, amount, mask: np.ndarray | None = None) -> None:
+        """混乱抵抗値を回復する"""
+        np.minimum(self.max_confusion_resist, self.confusion_resist + _masked(amount, mask), out=self.confusion_resist)
+
+    @staticmethod
+    def _resistance(table: np.ndarray, dice_type) -> np.ndarray:
+        """ダイスの種類に対応する倍率 (battle, unit)"""
+        if isinstance(dice_type, DiceType):
+            return table[:, :, TYPE_INDEX[dice_type]]
+        kind = np.broadcast_to(np.asarray(dice_type, dtype=np.int64), table.shape[:2])
+        return np.take_along_axis(table, kind[:, :, None], axis=2)[:, :, 0]
+    # -------------------------------------------------------
+
+
+def _masked(amount, mask: np.ndarray | None):
+    """mask の外の要素を 0 にした量"""
+    if mask is None:
+        return amount
+    return np.where(mask, amount, 0)
@@ -1,6 +1,3 @@
-import pygame
-
-
 class BattleStartButton:
 
     def __init__(
@@ -13,7 +10,7 @@ class BattleStartButton:
         self.size = list(size)
         self.pos = list(pos)
 
-        self.img = pygame.transform.scale(self.game.assets["battle_start_button"], size=self.size)
+        self.img = self.game.scaled_images.get("battle_start_button", self.size)
         self.rect = self.img.get_rect(topleft=self.pos)
 
     def render(self, surface):
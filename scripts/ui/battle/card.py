@@ -1,5 +1,11 @@
-from scripts.models.card import Card
+import pygame
+from scripts.models.card import CardSpec
 from scripts.models.dice import DiceType
+from scripts.utils.draw import render_text, fit_text
+
+
+# 描き込み済みのカード画像（key: (カードID, 倍率)）
+_face_cache: dict[tuple[str, float], pygame.Surface] = {}
 
 
 class CardView:
@@ -7,35 +13,55 @@ class CardView:
     def __init__(
         self,
         game: "Game",
-        card: Card,
+        card: CardSpec,
         pos: list[int, int] | tuple[int, int],
     ):
         self.game = game
         self.card = card
         self.pos = list(pos)
 
-        # 画像
-        self.img = self.game.card_art_manager.get(id=self.card.id, scale=2.0)
-        self.rect = self.img.get_rect(topleft=self.pos)
+        # 画像の倍率
+        self.scale = 2.0
 
         # フォント
         self.font = self.game.fonts.get("dot", 20)
 
+        # 画像（カード名・コスト・ダイスを描き込み済み）
+        self.img = self._get_face()
+        self.rect = self.game.card_art_manager.get(id=self.card.id, scale=self.scale).get_rect(topleft=self.pos)
+        self.bounds = self.img.get_rect(topleft=self.pos)  # 描画範囲（はみ出す文字を含む）
+
     def render(self, surface):
-        # カード
-        surface.blit(self.img, self.rect)
+        surface.blit(self.img, self.rect.topleft)
+
+    def _get_face(self) -> pygame.Surface:
+        """描き込み済みのカード画像を取得"""
+        key = (self.card.id, self.scale)
+
+        # キャッシュにある場合はキャッシュを返す
+        face = _face_cache.get(key)
+        if face is not None:
+            return face
+
+        face = self._compose_face(self.game.card_art_manager.get(id=self.card.id, scale=self.scale))
+        _face_cache[key] = face
+        return face
+
+    def _compose_face(self, art: pygame.Surface) -> pygame.Surface:
+        """カード画像にカード名・コスト・ダイスを描き込んだ画像を作る（はみ出す分は大きくする）"""
+        parts = []  # (画像, 位置)
 
         # カード名
-        name_x = self.rect.x + 50
-        name_y = self.rect.y + 13
-        max_width = self.rect.right - name_x - 10  # 右に余白10
+        name_x = 50
+        name_y = 13
+        max_width = art.get_width() - name_x - 10  # 右に余白10
 
         font, name_surf = self._fit_text(self.card.name, max_width, base_size=20, min_size=12)
-        surface.blit(name_surf, (name_x, name_y))
+        parts.append((name_surf, (name_x, name_y)))
 
         # コスト
-        cost_surf = self.font.render(f"{self.card.cost}", True, (0, 0, 0))
-        surface.blit(cost_surf, (self.rect.x + 19, self.rect.y + 13))
+        cost_surf = render_text(self.font, f"{self.card.cost}", True, (0, 0, 0))
+        parts.append((cost_surf, (19, 13)))
 
         # ダイスの内容
         for i, die in enumerate(self.card.dice_list):
@@ -59,34 +85,29 @@ class CardView:
 
             # アイコン画像
             if icon:
-                surface.blit(icon, (self.rect.x + 10, self.rect.y + 155 + i * 30))
+                parts.append((icon, (10, 155 + i * 30)))
 
             # ダイスの値の範囲
-            dice_val_surf = self.font.render(f"{die.min_val} - {die.max_val}", True, (0, 0, 0))
-            surface.blit(dice_val_surf, (self.rect.x + 50, self.rect.y + 160 + i * 30))
+            dice_val_surf = render_text(self.font, f"{die.min_val} - {die.max_val}", True, (0, 0, 0))
+            parts.append((dice_val_surf, (50, 160 + i * 30)))
+
+        bounds = art.get_rect()
+        for surf, pos in parts:
+            bounds.union_ip(surf.get_rect(topleft=pos))
+
+        face = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        face.blit(art, (0, 0))
+        for surf, pos in parts:
+            face.blit(surf, pos)
+        return face
 
     def is_hovered(self, mouse_pos):
         return self.rect.collidepoint(mouse_pos)
 
     def _fit_text(self, text: str, max_width: int, base_size: int = 20, min_size: int = 12):
         """
-        1) base_size から min_size まで縮小して幅に収まるか試す
-        2) それでも無理なら min_size のまま末尾を '…' で省略
+        base_size から min_size の間で幅に収まるサイズで描画（無理なら末尾を '…' で省略）
         戻り値: (font, rendered_surface)
         """
-        # 縮小
-        for size in range(base_size, min_size - 1, -1):
-            font = self.game.fonts.get("dot", size)
-            if font.size(text)[0] <= max_width:
-                return font, font.render(text, True, (0, 0, 0))
-
-        # 省略
-        font = self.game.fonts.get("dot", min_size)
-        ell = "…"
-        if font.size(text)[0] <= max_width:
-            return font, font.render(text, True, (0, 0, 0))
-
-        s = text
-        while s and font.size(s + ell)[0] > max_width:
-            s = s[:-1]
-        return font, font.render(s + ell if s else ell, True, (0, 0, 0))
+        font, fitted = fit_text(self.game.fonts, "dot", text, max_width, base_size, min_size)
+        return font, render_text(font, fitted, True, (0, 0, 0))
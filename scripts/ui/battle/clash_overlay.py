@@ -0,0 +1,199 @@
+import math
+import pygame
+from scripts.utils.cache import LRUCache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy がない場合は1点ずつ計算
+    np = None
+
+
+# 矢印の形（key: (始点, 終点, 曲がり具合, 分割数, 矢印の大きさ, 両矢印), val: (折れ線, 矢印ヘッド一覧)）
+_geometry_cache = LRUCache(maxsize=1024)
+
+# 透過色（矢印に使わない色）
+_COLORKEY = (0, 0, 0)
+
+
+def get_curved_arrow_geometry(a_pos, b_pos, curvature=0.25, arrow_size=12, bidirectional=False):
+    """
+    a_pos -> b_pos のカーブ矢印の形を取得（結果はキャッシュ）
+
+    ・制御点は常に「上」に膨らませた2次ベジェを折れ線で近似
+    ・bidirectional=True なら始点側にも矢印ヘッド（CLASH用）
+
+    Returns:
+        tuple[list, list] | None: (折れ線の点一覧, 矢印ヘッドの三角形一覧)、近すぎる場合は None
+    """
+    ax, ay = a_pos
+    bx, by = b_pos
+    dist = math.hypot(bx - ax, by - ay)
+    if dist < 1:
+        return None
+    steps = max(12, int(dist / 20))
+
+    key = (a_pos, b_pos, curvature, steps, arrow_size, bidirectional)
+    geometry = _geometry_cache.get(key)
+    if geometry is not None:
+        return geometry
+
+    # 制御点：常に「上」に膨らませる（yを減らす）
+    cx, cy = (ax + bx) * 0.5, (ay + by) * 0.5 - dist * curvature
+    points = _bezier_points(ax, ay, cx, cy, bx, by, steps)
+
+    # 終点側の矢印（CLASH用は始点側にも）
+    heads = [_arrow_head(points[-2], points[-1], arrow_size)]
+    if bidirectional:
+        heads.append(_arrow_head(points[1], points[0], arrow_size))
+
+    geometry = (points, heads)
+    _geometry_cache.put(key, geometry)
+    return geometry
+
+
+def _bezier_points(ax, ay, cx, cy, bx, by, steps) -> list[tuple[float, float]]:
+    """2次ベジェを steps 分割した点一覧"""
+    if np is not None:
+        t = np.arange(steps + 1) / steps
+        x = (1 - t) * (1 - t) * ax + 2 * (1 - t) * t * cx + t * t * bx
+        y = (1 - t) * (1 - t) * ay + 2 * (1 - t) * t * cy + t * t * by
+        return list(zip(x.tolist(), y.tolist()))
+
+    points = []
+    for i in range(steps + 1):
+        t = i / steps
+        x = (1 - t) * (1 - t) * ax + 2 * (1 - t) * t * cx + t * t * bx
+        y = (1 - t) * (1 - t) * ay + 2 * (1 - t) * t * cy + t * t * by
+        points.append((x, y))
+    return points
+
+
+def _arrow_head(from_pos, to_pos, size) -> list[tuple[float, float]]:
+    """from_pos -> to_pos の向きの矢印ヘッド（三角形）"""
+    fx, fy = from_pos
+    tx, ty = to_pos
+    ang = math.atan2(ty - fy, tx - fx)
+
+    # 三角形の2点（左右）
+    left = (tx - size * math.cos(ang - math.pi / 6),
+            ty - size * math.sin(ang - math.pi / 6))
+    right = (tx - size * math.cos(ang + math.pi / 6),
+             ty - size * math.sin(ang + math.pi / 6))
+    return [(tx, ty), left, right]
+
+
+class ClashOverlay:
+    """
+    マッチ/一方攻撃の矢印を描いた画像
+
+    ・scene.clash_infos が置き換わった時か、ユニットUIの配置が変わった時だけ描き直す
+    ・画像は矢印が収まる範囲（画面内）の大きさで、背景は透過色
+
+    Args:
+        scene (BattleScene): 戦闘シーン
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+
+        self._clash_infos = None
+        self._layout_version = None
+        self._surf: pygame.Surface | None = None
+        self._pos = (0, 0)
+        self.version = 0    # 描き直した回数
+
+    @property
+    def rect(self) -> pygame.Rect | None:
+        """矢印を描いた範囲（矢印がない場合は None）"""
+        if self._surf is None:
+            return None
+        return self._surf.get_rect(topleft=self._pos)
+
+    def render(self, surface: pygame.Surface):
+        if self.scene.clash_infos is not self._clash_infos or self.scene.layout_version != self._layout_version:
+            self._redraw(surface.get_rect())
+            self._clash_infos = self.scene.clash_infos
+            self._layout_version = self.scene.layout_version
+
+        if self._surf is not None:
+            surface.blit(self._surf, self._pos)
+
+    def _redraw(self, screen_rect: pygame.Rect):
+        self.version += 1
+        arrows = self._collect_arrows()
+        if not arrows:
+            self._surf = None
+            return
+
+        # 描画範囲（線の太さと矢印ヘッドを含む）
+        xs = []
+        ys = []
+        for points, heads, color, width in arrows:
+            for x, y in points:
+                xs.append(x)
+                ys.append(y)
+            for head in heads:
+                for x, y in head:
+                    xs.append(x)
+                    ys.append(y)
+        pad = max(width for _, _, _, width in arrows) + 2
+        bounds = pygame.Rect(0, 0, 0, 0)
+        bounds.left = int(min(xs)) - pad
+        bounds.top = int(min(ys)) - pad
+        bounds.width = int(max(xs)) + pad - bounds.left
+        bounds.height = int(max(ys)) + pad - bounds.top
+        bounds = bounds.clip(screen_rect)
+        if bounds.width <= 0 or bounds.height <= 0:
+            self._surf = None
+            return
+
+        ox, oy = bounds.topleft
+        surf = pygame.Surface(bounds.size)
+        surf.fill(_COLORKEY)
+        surf.set_colorkey(_COLORKEY, pygame.RLEACCEL)
+        for points, heads, color, width in arrows:
+            pygame.draw.lines(surf, color, False, [(x - ox, y - oy) for x, y in points], width)
+            for head in heads:
+                pygame.draw.polygon(surf, color, [(x - ox, y - oy) for x, y in head])
+
+        self._surf = surf
+        self._pos = (ox, oy)
+
+    def _collect_arrows(self) -> list:
+        """描く矢印の一覧 (折れ線, 矢印ヘッド一覧, 色, 太さ)"""
+        arrows = []
+        processed_clash_pairs = set()
+        for info in self.scene.clash_infos:
+            a_vel = info.attacker
+            b_vel = info.defender
+
+            a_vel_ui = self.scene.get_vel_dice_view(a_vel)
+            b_vel_ui = self.scene.get_vel_dice_view(b_vel)
+
+            if not a_vel_ui or not b_vel_ui:
+                continue
+
+            point_a = a_vel_ui.rect.center
+            point_b = b_vel_ui.rect.center
+
+            # マッチ判定
+            if self.scene.system.is_clash(info):
+                # マッチは (A,B) と (B,A) が来ても1回だけ描く
+                key = (min(id(a_vel), id(b_vel)), max(id(a_vel), id(b_vel)))
+                if key in processed_clash_pairs:
+                    continue
+                processed_clash_pairs.add(key)
+
+                geometry = get_curved_arrow_geometry(point_a, point_b, curvature=0.22, arrow_size=15, bidirectional=True)
+                color = (255, 100, 100)
+            # 一方攻撃判定
+            elif self.scene.system.is_one_sided(info):
+                geometry = get_curved_arrow_geometry(point_a, point_b, curvature=0.22, arrow_size=15, bidirectional=False)
+                color = (100, 100, 255)
+            else:
+                continue
+
+            if geometry is not None:
+                points, heads = geometry
+                arrows.append((points, heads, color, 5))
+        return arrows
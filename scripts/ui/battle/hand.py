@@ -1,5 +1,6 @@
 import pygame
 from scripts.ui.battle.card import CardView
+from scripts.ui.hit_index import HitIndex
 
 
 class HandView:
@@ -17,10 +18,21 @@ class HandView:
         self.rect = pygame.Rect(self.pos[0], self.pos[1], self.size[0], self.size[1])
 
         # 手札のカードUI
+        self.cards = []
         self.card_views = []
 
+        # カードの当たり判定（手札を変えたら最初の判定時に作り直す）
+        self.hit_index = HitIndex(cell_size=128)
+        self._hit_index_dirty = True
+
     def set_hand(self, cards):
+        # 手札が変わっていない場合は作り直さない
+        if len(cards) == len(self.cards) and all(a is b for a, b in zip(cards, self.cards)):
+            return
+        self.cards = list(cards)
+
         self.card_views.clear()
+        self._hit_index_dirty = True
         card_w = 212
         pad = 8
         card_w, card_h = card_w - pad*2, 200
@@ -37,8 +49,16 @@ class HandView:
         for cv in self.card_views:
             cv.render(surface)
 
+    def get_bounds(self) -> pygame.Rect:
+        """描画範囲（はみ出すカードを含む）"""
+        return self.rect.unionall([cv.bounds for cv in self.card_views])
+
     def get_clicked_card(self, mouse_pos):
-        for cv in self.card_views:
-            if cv.is_hovered(mouse_pos):
-                return cv.card
-        return None
+        if self._hit_index_dirty:
+            self.hit_index.clear()
+            for cv in self.card_views:
+                self.hit_index.add(cv.rect, cv)
+            self._hit_index_dirty = False
+
+        cv = self.hit_index.query(mouse_pos)
+        return cv.card if cv else None
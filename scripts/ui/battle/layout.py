@@ -0,0 +1,55 @@
+import math
+
+
+# 5体までの配置（左側の陣営、左上座標）
+FORMATION_5 = [(200, 250), (350, 100), (350, 400), (50, 100), (50, 400)]
+
+# ユニット画像の最大サイズ
+UNIT_SIZE = 128
+
+# 並べる範囲（左側の陣営）
+AREA_LEFT = 50
+AREA_TOP = 100
+AREA_BOTTOM = 528
+
+# ユニット画像の上下に必要な余白（上: 光/速度ダイス, 下: HP/混乱耐性バー）
+MARGIN_TOP = 34
+MARGIN_BOTTOM = 28
+
+
+def compute_unit_layout(count: int, screen_w: int, is_left: bool) -> tuple[int, list[tuple[int, int]]]:
+    """
+    ユニットの配置を計算
+
+    ・5体までは従来の配置
+    ・それ以上は画面の半分に格子状に並べ、セルが最も大きくなる行数を選ぶ
+    ・右側の陣営は左右反転
+
+    Returns:
+        tuple[int, list[tuple[int, int]]]: (ユニット画像のサイズ, 左上座標の一覧)
+    """
+    size = UNIT_SIZE
+    if count <= len(FORMATION_5):
+        positions = FORMATION_5[:count]
+    else:
+        area_w = screen_w // 2 - AREA_LEFT - 40
+        area_h = AREA_BOTTOM - AREA_TOP
+
+        # セルが最も大きくなる (行数, 列数)
+        rows = max(range(1, count + 1), key=lambda r: min(area_w / math.ceil(count / r), area_h / r))
+        cols = math.ceil(count / rows)
+        cell_w = area_w / cols
+        cell_h = area_h / rows
+
+        # 上下のバー/速度ダイス、右のバーの数値の分の余白を残す
+        size = max(16, min(UNIT_SIZE, int(cell_w * 0.6), int(cell_h - MARGIN_TOP - MARGIN_BOTTOM)))
+        positions = []
+        for i in range(count):
+            row, col = divmod(i, cols)
+            x = AREA_LEFT + int(col * cell_w + (cell_w - size) / 2)
+            y = AREA_TOP + int(row * cell_h + MARGIN_TOP + (cell_h - MARGIN_TOP - MARGIN_BOTTOM - size) / 2)
+            positions.append((x, y))
+
+    if not is_left:
+        positions = [(screen_w - x - size, y) for x, y in positions]
+    return size, positions
@@ -1,6 +1,7 @@
 import pygame
 from scripts.models.unit import Unit, DamageType, HealType
 from scripts.ui.battle.velocity_dice import VelocityDiceView
+from scripts.utils.draw import render_text
 
 
 class DamagePopup:
@@ -53,28 +54,40 @@ class UnitView:
         self.pos = list(pos)
 
         # 画像
-        self.animation = self.game.assets.get(f"{self.unit.name}/{self.unit.states.value}")
-        self.img = pygame.transform.scale(self.animation.get_img(), size=self.size)
+        self.animation_key = f"{self.unit.sprite or self.unit.name}/{self.unit.states.value}"
+        # 同じ画像を使うユニットがいるので、再生位置はユニットごとに持つ
+        self.animation = self.game.assets[self.animation_key].copy()
+        self.game.scaled_images.prewarm(self.animation_key, self.size)
+        self.frame_index = self.animation.get_frame_index()
+        self.img = self.game.scaled_images.get(self.animation_key, self.size, self.frame_index)
         self.rect = self.img.get_rect(topleft=self.pos)
 
         # 半透明
         self.is_dimmed = False
         self.alpha = 100
 
+        # HP/混乱耐性バー・光のUI（値が変わった時だけ描き直す）
+        self._status_surf: pygame.Surface | None = None
+        self._status_pos = (0, 0)
+        self._status_key = None
+
         # ダメージUI
         self.hit_flash = 0.0
+        self._flash_surf: pygame.Surface | None = None
         self.popups_damage: list[DamagePopup] = []
 
         # 回復UI
         self.popups_heal: list[HealPopup] = []
 
-        # 速度ダイス画像
+        # 速度ダイス画像（複数ある場合はユニットの幅に収まるよう縮めて中央揃え）
+        n = len(self.unit.velocity_dice_list)
+        dice_size = max(12, min(32, self.size[0] // n))
         self.vel_dice_ui_list = [
             VelocityDiceView(
                 game=game,
                 velocity_dice=vel_dice,
-                size=(32, 32),
-                pos=(self.rect.centerx - i * 32, self.rect.top - 8)
+                size=(dice_size, dice_size),
+                pos=(self.rect.centerx + ((n - 1) / 2 - i) * dice_size, self.rect.top - 8)
             )
             for i, vel_dice in enumerate(self.unit.velocity_dice_list)
         ]
@@ -96,7 +109,8 @@ class UnitView:
 
     def update(self, dt: float):
         self.animation.update(dt)
-        self.img = pygame.transform.scale(self.animation.get_img(), size=self.size)
+        self.frame_index = self.animation.get_frame_index()
+        self.img = self.game.scaled_images.get(self.animation_key, self.size, self.frame_index)
 
         # ダメージ判定
         if self.hit_flash > 0:
@@ -111,74 +125,42 @@ class UnitView:
         self.popups_heal = [p for p in self.popups_heal if p.alive]
 
     def render(self, surface: pygame.Surface):
-        ui_surf = pygame.Surface(surface.size, pygame.SRCALPHA)
-
         img = self.img
-        img.set_alpha(255)
         if self.is_dimmed:
-            img.set_alpha(self.alpha)
+            img = self.game.scaled_images.get(self.animation_key, self.size, self.frame_index, alpha=self.alpha)
         surface.blit(img, self.rect)
 
-        # HPバー
-        self._render_bar(
-            ui_surf,
-            pygame.Rect(self.rect.left, self.rect.bottom, self.rect.width, 5),
-            current=self.unit.hp,
-            maximum=self.unit.max_hp,
-            color=(255, 0, 0, self.alpha) if self.is_dimmed else (255, 0, 0),
-            label=f"{self.unit.hp}/{self.unit.max_hp}",
-        )
-
-        # 混乱耐性バー
-        self._render_bar(
-            ui_surf,
-            pygame.Rect(self.rect.left, self.rect.bottom + 15, self.rect.width, 5),
-            current=self.unit.confusion_resist,
-            maximum=self.unit.max_confusion_resist,
-            color=(255, 255, 0, self.alpha) if self.is_dimmed else (255, 255, 0),
-            label=f"{self.unit.confusion_resist}/{self.unit.max_confusion_resist}",
-        )
-
-        # 光（Light）
-        gap = 10
-        n = self.unit.max_light
-        cx = self.rect.centerx
-        y = self.rect.y - 32
-
-        # 全体の左端（中心合わせ）
-        start_x = cx - (n - 1) * gap / 2
-
-        for i in range(n):
-            x = int(round(start_x + i * gap))
-
-            if i >= self.unit.light:
-                color = (255, 255, 0, self.alpha) if self.is_dimmed else (255, 255, 0)
-            else:
-                color = (255, 255, 100, self.alpha) if self.is_dimmed else (255, 255, 100)
-
-            pygame.draw.circle(surface, color, (x, y), 3)
-
         # 速度ダイス
         for vel_dice_ui in self.vel_dice_ui_list:
             vel_dice_ui.render(surface)
 
+        # HPバー・混乱耐性バー・光
+        key = self._get_status_key()
+        if key != self._status_key:
+            self._render_status()
+            self._status_key = key
+        surface.blit(self._status_surf, self._status_pos)
+
+    def render_effects(self, surface: pygame.Surface):
+        """ダメージフラッシュ・数字ポップ（render の上に重ねる）"""
         # ダメージフラッシュ
         if self.hit_flash > 0:
-            overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 140))
-            surface.blit(overlay, self.rect.topleft)
+            if self._flash_surf is None:
+                self._flash_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+                self._flash_surf.fill((255, 255, 255, 140))
+            surface.blit(self._flash_surf, self.rect.topleft)
 
         # ダメージ数字ポップ
         for p in self.popups_damage:
             text = f"-{p.amount}"
             # HPダメージの場合
             if p.damage_type == DamageType.HP:
-                surf = self.font.render(text, True, (255, 0, 0))
+                surf = render_text(self.font, text, True, (255, 0, 0))
                 x = self.rect.centerx - surf.get_width() // 2 - 20
                 y = self.rect.top - 20 + int(p.y_offset)
             # 混乱ダメージの場合
             else:
-                surf = self.font.render(text, True, (255, 255, 0))
+                surf = render_text(self.font, text, True, (255, 255, 0))
                 x = self.rect.centerx - surf.get_width() // 2 + 20
                 y = self.rect.top - 20 + int(p.y_offset)
 
@@ -187,7 +169,7 @@ class UnitView:
         # 回復数字ポップ
         for p in self.popups_heal:
             text = f"+{p.amount}"
-            surf = self.font.render(text, True, (0, 255, 255))
+            surf = render_text(self.font, text, True, (0, 255, 255))
             # HPダメージの場合
             if p.heal_type == DamageType.HP:
                 x = self.rect.centerx - surf.get_width() // 2 - 20
@@ -199,9 +181,96 @@ class UnitView:
 
             surface.blit(surf, (x, y))
 
-        surface.blit(ui_surf, (0, 0))
+    def get_layer_key(self) -> tuple:
+        """render の内容が変わったかを判定する値（ダメージフラッシュ・数字ポップは含まない）"""
+        return (
+            self.frame_index,
+            self._get_status_key(),
+            tuple(vel_dice_ui.velocity_dice.val for vel_dice_ui in self.vel_dice_ui_list),
+        )
+
+    def _get_status_key(self) -> tuple:
+        return (
+            self.unit.hp, self.unit.max_hp,
+            self.unit.confusion_resist, self.unit.max_confusion_resist,
+            self.unit.light, self.unit.max_light,
+            self.is_dimmed,
+        )
+
+    def get_dirty_state(self) -> tuple[pygame.Rect, tuple]:
+        """差分更新用の (描画範囲, 状態)"""
+        rect = self.rect.unionall([vel_dice_ui.rect for vel_dice_ui in self.vel_dice_ui_list])
+        if self._status_surf is not None:
+            rect.union_ip(self._status_surf.get_rect(topleft=self._status_pos))
+
+        # 数字ポップ（上に移動する分を含む）
+        popups = tuple((p.amount, int(p.y_offset)) for p in self.popups_damage + self.popups_heal)
+        if popups:
+            h = self.font.get_height()
+            rect.union_ip(pygame.Rect(self.rect.centerx - 120, self.rect.top - 50, 240, h + 50))
+
+        return rect, (self.get_layer_key(), self.hit_flash > 0, popups)
+
+    def _render_status(self):
+        """HPバー・混乱耐性バー・光を、それらが収まる大きさの画像に描き直す"""
+        hp_label = render_text(self.small_font, f"{self.unit.hp}/{self.unit.max_hp}", True, (0, 0, 0))
+        cr_label = render_text(
+            self.small_font,
+            f"{self.unit.confusion_resist}/{self.unit.max_confusion_resist}", True, (0, 0, 0)
+        )
+        hp_rect = pygame.Rect(self.rect.left, self.rect.bottom, self.rect.width, 5)
+        cr_rect = pygame.Rect(self.rect.left, self.rect.bottom + 15, self.rect.width, 5)
+
+        # 光（Light）の位置（中心合わせ）
+        gap = 10
+        n = self.unit.max_light
+        start_x = self.rect.centerx - (n - 1) * gap / 2
+        light_y = self.rect.y - 32
+        light_xs = [int(round(start_x + i * gap)) for i in range(n)]
+
+        # 描画範囲
+        bounds = hp_rect.union(cr_rect)
+        bounds.union_ip(hp_label.get_rect(topleft=(hp_rect.right, hp_rect.y - 3)))
+        bounds.union_ip(cr_label.get_rect(topleft=(cr_rect.right, cr_rect.y - 3)))
+        if light_xs:
+            bounds.union_ip(pygame.Rect(light_xs[0] - 3, light_y - 3, light_xs[-1] - light_xs[0] + 7, 7))
+        ox, oy = bounds.topleft
+
+        ui_surf = pygame.Surface(bounds.size, pygame.SRCALPHA)
+
+        # HPバー
+        self._render_bar(
+            ui_surf,
+            hp_rect.move(-ox, -oy),
+            current=self.unit.hp,
+            maximum=self.unit.max_hp,
+            color=(255, 0, 0, self.alpha) if self.is_dimmed else (255, 0, 0),
+            label_surf=hp_label,
+        )
+
+        # 混乱耐性バー
+        self._render_bar(
+            ui_surf,
+            cr_rect.move(-ox, -oy),
+            current=self.unit.confusion_resist,
+            maximum=self.unit.max_confusion_resist,
+            color=(255, 255, 0, self.alpha) if self.is_dimmed else (255, 255, 0),
+            label_surf=cr_label,
+        )
+
+        # 光（Light）
+        for i, x in enumerate(light_xs):
+            if i >= self.unit.light:
+                color = (255, 255, 0, self.alpha) if self.is_dimmed else (255, 255, 0)
+            else:
+                color = (255, 255, 100, self.alpha) if self.is_dimmed else (255, 255, 100)
+
+            pygame.draw.circle(ui_surf, color, (x - ox, light_y - oy), 3)
+
+        self._status_surf = ui_surf
+        self._status_pos = (ox, oy)
 
-    def _render_bar(self, surface, rect, current, maximum, color, label: str):
+    def _render_bar(self, surface, rect, current, maximum, color, label_surf: pygame.Surface):
         # 背景（空ゲージ）
         if self.is_dimmed:
             pygame.draw.rect(surface, (50, 50, 50), rect, border_radius=6)
@@ -219,7 +288,6 @@ class UnitView:
         pygame.draw.rect(surface, color, fill_rect, border_radius=6)
 
         # ラベル（小さめに表示）
-        label_surf = self.small_font.render(label, True, (0, 0, 0))
         surface.blit(label_surf, (rect.right, rect.y - 3))
 
     def is_hovered(self, mouse_pos):
@@ -1,5 +1,6 @@
 import pygame
 from scripts.models.dice import VelocityDice
+from scripts.utils.draw import render_text
 
 
 class VelocityDiceView:
@@ -16,7 +17,7 @@ class VelocityDiceView:
         self.pos = list(pos)
 
         # 画像
-        self.img = pygame.transform.scale(self.game.assets.get("vel_dice"), self.size)
+        self.img = self.game.scaled_images.get("vel_dice", self.size)
         self.rect = self.img.get_rect(center=self.pos)
 
         # フォント
@@ -26,7 +27,7 @@ class VelocityDiceView:
         surface.blit(self.img, self.rect)
 
         text = "-" if self.velocity_dice.val is None else str(self.velocity_dice.val)
-        surf = self.font.render(text, True, (0, 0, 0))
+        surf = render_text(self.font, text, True, (0, 0, 0))
         surface.blit(surf, (self.rect.centerx - surf.get_width() // 2,
                             self.rect.centery - surf.get_height() // 2))
 
@@ -0,0 +1,91 @@
+from typing import Callable
+import pygame
+
+
+class Layer:
+    """
+    合成する層
+
+    Args:
+        name (str): 層の名前
+        draw (Callable[[pygame.Surface], None]): 層の内容を描く関数
+        key (Callable[[], object] | None): 内容が変わったかを判定する値を返す関数
+            （関数が None の場合は毎フレーム描き直し、上の層のために画像も保持しない。値が None の場合はそのフレームだけ描き直す）
+    """
+
+    def __init__(self, name: str, draw: Callable[[pygame.Surface], None], key: Callable[[], object] | None = None):
+        self.name = name
+        self.draw = draw
+        self.key = key
+
+        self.dirty = True   # 次のフレームで描き直すか
+        self._last_key = None
+        self._cache: pygame.Surface | None = None   # この層までを合成した画像
+
+    def invalidate(self) -> None:
+        """次のフレームで描き直す"""
+        self.dirty = True
+
+
+class Compositor:
+    """
+    層ごとに画面を合成する
+
+    ・層は下から順に描き、key がある層は「その層までを合成した画像」を保持する
+    ・key が変わった層（または invalidate した層）より上だけを、1つ下の層の画像から描き直す
+    ・key がない層（毎フレーム変わる演出など）とその上の層は毎フレーム描き直す
+    ・overlays（SceneManager.overlay_stack）は最上位の層として合成する
+    """
+
+    def __init__(self):
+        self.layers: list[Layer] = []
+
+    def add_layer(self, name: str, draw: Callable[[pygame.Surface], None], key: Callable[[], object] | None = None) -> Layer:
+        layer = Layer(name, draw, key)
+        self.layers.append(layer)
+        return layer
+
+    def get_layer(self, name: str) -> Layer:
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        raise KeyError(f"Layer '{name}' is not registered")
+
+    def invalidate(self, name: str | None = None) -> None:
+        """層を描き直す（name がない場合は全ての層）"""
+        layers = self.layers if name is None else [self.get_layer(name)]
+        for layer in layers:
+            layer.invalidate()
+
+    def render(self, surface: pygame.Surface, overlays: list = ()) -> None:
+        # オーバーレイシーンは毎フレーム描き直す
+        layers = self.layers + [Layer(type(scene).__name__, scene.render) for scene in overlays]
+
+        # 描き直す最初の層（上の層の key も更新しておく）
+        start = len(layers)
+        for i, layer in enumerate(layers):
+            if layer.key is None:
+                changed = True
+            else:
+                key = layer.key()
+                changed = layer.dirty or key is None or key != layer._last_key
+                layer._last_key = key
+            if changed and start == len(layers):
+                start = i
+
+        # 変わっていない層までは保持した画像を使う
+        if start > 0:
+            surface.blit(layers[start - 1]._cache, (0, 0))
+
+        cacheable = all(layer.key is not None for layer in layers[:start])
+        for layer in layers[start:]:
+            layer.draw(surface)
+            layer.dirty = False
+
+            # key がない層より上は毎フレーム描き直すので保持しない
+            cacheable = cacheable and layer.key is not None
+            if cacheable:
+                if layer._cache is None or layer._cache.get_size() != surface.get_size():
+                    layer._cache = surface.copy()
+                else:
+                    layer._cache.blit(surface, (0, 0))
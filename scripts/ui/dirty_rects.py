@@ -0,0 +1,76 @@
+import pygame
+
+
+class DirtyRectTracker:
+    """
+    前フレームとの差分から画面を更新する範囲を求める
+
+    ・描画後に、描いた要素ごとに (キー, 範囲, 状態) を mark で登録する
+    ・範囲か状態が変わった要素、増えた/消えた要素の範囲（前後両方）を更新範囲にする
+    ・重なる範囲はまとめ、合計が画面の full_ratio を超える場合は全体を更新する（None）
+    ・invalidate した次のフレームは全体を更新する
+
+    Args:
+        screen_rect (pygame.Rect): 画面の範囲
+        full_ratio (float): 全体を更新する面積の割合
+    """
+
+    def __init__(self, screen_rect: pygame.Rect, full_ratio: float = 0.5):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.full_ratio = full_ratio
+
+        self._prev: dict = {}   # key: 要素のキー, val: (範囲, 状態)
+        self._cur: dict = {}
+        self._full = True
+
+    def invalidate(self) -> None:
+        """次のフレームは全体を更新する"""
+        self._full = True
+
+    def begin(self) -> None:
+        self._cur = {}
+
+    def mark(self, key, rect: pygame.Rect, state=None) -> None:
+        """描いた要素を登録（state は前フレームと比較できる値）"""
+        self._cur[key] = (pygame.Rect(rect), state)
+
+    def end(self) -> list[pygame.Rect] | None:
+        """更新する範囲の一覧（全体を更新する場合は None）"""
+        prev, cur = self._prev, self._cur
+        self._prev = cur
+        if self._full:
+            self._full = False
+            return None
+
+        rects = []
+        for key, (rect, state) in cur.items():
+            old = prev.get(key)
+            if old is None:
+                rects.append(rect)
+            elif old != (rect, state):
+                rects.append(rect)
+                rects.append(old[0])
+        for key, (rect, _) in prev.items():
+            if key not in cur:
+                rects.append(rect)
+
+        rects = _merge(r.clip(self.screen_rect) for r in rects)
+        area = sum(r.w * r.h for r in rects)
+        if area > self.screen_rect.w * self.screen_rect.h * self.full_ratio:
+            return None
+        return rects
+
+
+def _merge(rects) -> list[pygame.Rect]:
+    """重なる範囲をまとめる"""
+    merged: list[pygame.Rect] = []
+    for rect in rects:
+        if rect.w <= 0 or rect.h <= 0:
+            continue
+        # まとめた結果が他と重なる場合があるので、重ならなくなるまで繰り返す
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect = rect.union(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
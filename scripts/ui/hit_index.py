@@ -0,0 +1,42 @@
+import pygame
+
+
+class HitIndex:
+    """
+    UIの当たり判定用の一様グリッド
+
+    ・登録した矩形を重なるセルすべてに入れ、点の判定はそのセルだけを調べる
+    ・複数が重なる場合は先に登録したものを返す（リストを先頭から調べた場合と同じ）
+    ・配置が変わったら clear して登録し直す
+
+    Args:
+        cell_size (int): セルの大きさ（ピクセル）
+    """
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[tuple[pygame.Rect, object]]] = {}
+
+    def clear(self) -> None:
+        self._cells.clear()
+
+    def add(self, rect: pygame.Rect, item) -> None:
+        """矩形と対応するオブジェクトを登録"""
+        if rect.w <= 0 or rect.h <= 0:
+            return
+        size = self.cell_size
+        entry = (pygame.Rect(rect), item)
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                self._cells.setdefault((cx, cy), []).append(entry)
+
+    def query(self, pos):
+        """点を含むオブジェクト（ない場合は None）"""
+        size = self.cell_size
+        cell = self._cells.get((int(pos[0]) // size, int(pos[1]) // size))
+        if cell is None:
+            return None
+        for rect, item in cell:
+            if rect.collidepoint(pos):
+                return item
+        return None
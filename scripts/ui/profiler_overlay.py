@@ -0,0 +1,91 @@
+import pygame
+from scripts.utils.draw import text_cache
+
+
+class ProfilerOverlay:
+    """
+    FrameProfiler の表示（区間ごとの p50/p95/p99 とフレーム時間のグラフ）
+
+    ・表は refresh_interval フレームごとに作り直す（毎フレーム集計すると表示自体が重くなるため）
+    ・数値は毎回変わるので、文字は text_cache を通さずに描く（キャッシュの統計を乱さないため）
+
+    Args:
+        profiler (FrameProfiler): 表示するプロファイラ
+        font (pygame.font.Font): 表示に使うフォント
+        pos (tuple[int, int]): 表示位置（左上）
+        refresh_interval (int): 表を作り直す間隔（フレーム数）
+    """
+
+    GRAPH_SIZE = (360, 80)
+    GRAPH_MAX_MS = 50.0     # グラフの上端
+    TARGET_MS = 1000.0 / 60  # 60FPS の基準線
+
+    def __init__(self, profiler, font: pygame.font.Font, pos: tuple[int, int] = (10, 10), refresh_interval: int = 30):
+        self.profiler = profiler
+        self.font = font
+        self.pos = pos
+        self.refresh_interval = refresh_interval
+
+        self._table: pygame.Surface | None = None
+        self._frames_since_refresh = 0
+
+        # 前回描いた範囲と描いた回数（差分更新用）
+        self.rect = pygame.Rect(pos, (0, 0))
+        self.render_count = 0
+
+    def render(self, surface: pygame.Surface) -> None:
+        self._frames_since_refresh += 1
+        if self._table is None or self._frames_since_refresh >= self.refresh_interval:
+            self._table = self._build_table()
+            self._frames_since_refresh = 0
+
+        x, y = self.pos
+        surface.blit(self._table, (x, y))
+        self._render_graph(surface, (x, y + self._table.get_height()))
+
+        self.rect = pygame.Rect(self.pos, (self.GRAPH_SIZE[0], self._table.get_height() + self.GRAPH_SIZE[1]))
+        self.render_count += 1
+
+    def _build_table(self) -> pygame.Surface:
+        color = (255, 255, 255)
+        line_h = self.font.get_linesize()
+        columns = (0, 200, 250, 300)
+        width = self.GRAPH_SIZE[0]
+
+        rows = [("section", "p50", "p95", "p99")]
+        for name, p50, p95, p99 in self.profiler.get_stats():
+            rows.append((name, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}"))
+
+        total = text_cache.hits + text_cache.misses
+        hit_rate = text_cache.hits / total if total else 0.0
+        footer = f"text cache: hit {hit_rate:.1%} ({len(text_cache)} entries)"
+
+        table = pygame.Surface((width, (len(rows) + 1) * line_h + 8), pygame.SRCALPHA)
+        table.fill((0, 0, 0, 180))
+        for i, row in enumerate(rows):
+            for col_x, text in zip(columns, row):
+                img = self.font.render(text, True, color)
+                # 数値は右揃え
+                if col_x > 0:
+                    col_x = col_x + 50 - img.get_width()
+                table.blit(img, (4 + col_x, 4 + i * line_h))
+        table.blit(self.font.render(footer, True, color), (4, 4 + len(rows) * line_h))
+        return table
+
+    def _render_graph(self, surface: pygame.Surface, pos: tuple[int, int]) -> None:
+        w, h = self.GRAPH_SIZE
+        rect = pygame.Rect(pos, (w, h))
+        surface.fill((0, 0, 0), rect)
+
+        def to_y(ms):
+            return rect.bottom - 1 - int(min(ms, self.GRAPH_MAX_MS) / self.GRAPH_MAX_MS * (h - 1))
+
+        # 60FPS の基準線
+        pygame.draw.line(surface, (80, 160, 80), (rect.left, to_y(self.TARGET_MS)), (rect.right - 1, to_y(self.TARGET_MS)))
+
+        # 直近のフレーム時間（右端が最新）
+        frame_times = self.profiler.get_frame_times()[-w:]
+        if len(frame_times) >= 2:
+            x0 = rect.right - len(frame_times)
+            points = [(x0 + i, to_y(ms)) for i, ms in enumerate(frame_times)]
+            pygame.draw.lines(surface, (255, 220, 80), False, points)
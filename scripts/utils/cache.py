@@ -0,0 +1,47 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    サイズ上限付きキャッシュ
+
+    上限を超えた場合は最も長く使われていないものから破棄する
+
+    Args:
+        maxsize (int): 保持する最大件数
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+        # 統計
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """値を取得（なければ default）"""
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value) -> None:
+        """値を保存"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
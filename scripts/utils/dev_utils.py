@@ -1,111 +1,111 @@
-from scripts.models.dice import Dice, DiceType
-from scripts.models.card import Card
+from scripts.models.dice import DieSpec, DiceType
+from scripts.models.card import CardSpec
 from scripts.models.unit import Unit
-from copy import deepcopy
+from scripts.models.deck import Deck
 
 
-def create_sample_cards() -> list[Card]:
+def create_sample_cards() -> list[CardSpec]:
     """サンプルカードを作成する"""
     card_list = []
 
-    card1 = Card(
+    card1 = CardSpec(
         id="three_slash",
         name="3斬撃",
         cost=2,
         dice_list=[
-            Dice(min_val=1, max_val=4, d_type=DiceType.SLASH),
-            Dice(min_val=2, max_val=5, d_type=DiceType.SLASH),
-            Dice(min_val=3, max_val=6, d_type=DiceType.SLASH),
+            DieSpec(min_val=1, max_val=4, d_type=DiceType.SLASH),
+            DieSpec(min_val=2, max_val=5, d_type=DiceType.SLASH),
+            DieSpec(min_val=3, max_val=6, d_type=DiceType.SLASH),
         ],
     )
     card_list.append(card1)
 
-    card2 = Card(
+    card2 = CardSpec(
         id="three_pierce",
         name="3突き",
         cost=2,
         dice_list=[
-            Dice(min_val=1, max_val=4, d_type=DiceType.PIERCE),
-            Dice(min_val=2, max_val=5, d_type=DiceType.PIERCE),
-            Dice(min_val=3, max_val=6, d_type=DiceType.PIERCE),
+            DieSpec(min_val=1, max_val=4, d_type=DiceType.PIERCE),
+            DieSpec(min_val=2, max_val=5, d_type=DiceType.PIERCE),
+            DieSpec(min_val=3, max_val=6, d_type=DiceType.PIERCE),
         ],
     )
     card_list.append(card2)
 
-    card3 = Card(
+    card3 = CardSpec(
         id="three_blunt",
         name="3打撃",
         cost=2,
         dice_list=[
-            Dice(min_val=1, max_val=4, d_type=DiceType.BLUNT),
-            Dice(min_val=2, max_val=5, d_type=DiceType.BLUNT),
-            Dice(min_val=3, max_val=6, d_type=DiceType.BLUNT),
+            DieSpec(min_val=1, max_val=4, d_type=DiceType.BLUNT),
+            DieSpec(min_val=2, max_val=5, d_type=DiceType.BLUNT),
+            DieSpec(min_val=3, max_val=6, d_type=DiceType.BLUNT),
         ],
     )
     card_list.append(card3)
 
-    card4 = Card(
+    card4 = CardSpec(
         id="three_evade",
         name="3回避",
         cost=2,
         dice_list=[
-            Dice(min_val=1, max_val=4, d_type=DiceType.EVADE),
-            Dice(min_val=2, max_val=5, d_type=DiceType.EVADE),
-            Dice(min_val=3, max_val=6, d_type=DiceType.EVADE),
+            DieSpec(min_val=1, max_val=4, d_type=DiceType.EVADE),
+            DieSpec(min_val=2, max_val=5, d_type=DiceType.EVADE),
+            DieSpec(min_val=3, max_val=6, d_type=DiceType.EVADE),
         ],
     )
     card_list.append(card4)
 
-    card5 = Card(
+    card5 = CardSpec(
         id="three_block",
         name="3防御",
         cost=2,
         dice_list=[
-            Dice(min_val=1, max_val=4, d_type=DiceType.BLOCK),
-            Dice(min_val=2, max_val=5, d_type=DiceType.BLOCK),
-            Dice(min_val=3, max_val=6, d_type=DiceType.BLOCK),
+            DieSpec(min_val=1, max_val=4, d_type=DiceType.BLOCK),
+            DieSpec(min_val=2, max_val=5, d_type=DiceType.BLOCK),
+            DieSpec(min_val=3, max_val=6, d_type=DiceType.BLOCK),
         ],
     )
     card_list.append(card5)
 
-    card6 = Card(
+    card6 = CardSpec(
         id="one_evade",
         name="1回避",
         cost=0,
         dice_list=[
-            Dice(min_val=1, max_val=6, d_type=DiceType.EVADE),
+            DieSpec(min_val=1, max_val=6, d_type=DiceType.EVADE),
         ],
     )
     card_list.append(card6)
 
-    card7 = Card(
+    card7 = CardSpec(
         id="one_block",
         name="1防御",
         cost=1,
         dice_list=[
-            Dice(min_val=1, max_val=6, d_type=DiceType.BLOCK),
+            DieSpec(min_val=1, max_val=6, d_type=DiceType.BLOCK),
         ],
     )
     card_list.append(card7)
 
-    card8 = Card(
+    card8 = CardSpec(
         id="one_slash",
         name="1斬撃",
         cost=1,
         dice_list=[
-            Dice(min_val=1, max_val=6, d_type=DiceType.SLASH),
+            DieSpec(min_val=1, max_val=6, d_type=DiceType.SLASH),
         ],
     )
     card_list.append(card8)
 
-    card9 = Card(
+    card9 = CardSpec(
         id="one_evade_block_slash",
         name="1回避 1防御 1斬撃",
         cost=1,
         dice_list=[
-            Dice(min_val=1, max_val=4, d_type=DiceType.EVADE),
-            Dice(min_val=2, max_val=5, d_type=DiceType.BLOCK),
-            Dice(min_val=3, max_val=6, d_type=DiceType.SLASH),
+            DieSpec(min_val=1, max_val=4, d_type=DiceType.EVADE),
+            DieSpec(min_val=2, max_val=5, d_type=DiceType.BLOCK),
+            DieSpec(min_val=3, max_val=6, d_type=DiceType.SLASH),
         ],
     )
     card_list.append(card9)
@@ -113,7 +113,7 @@ def create_sample_cards() -> list[Card]:
     return card_list
 
 
-def create_sample_units(deck, num=3, is_ally=True):
+def create_sample_units(deck, num=3, is_ally=True, velocity_dice_count=1):
 
     unit_list = []
 
@@ -126,8 +126,10 @@ def create_sample_units(deck, num=3, is_ally=True):
             max_light=3,
             min_speed=1,
             max_speed=6,
-            deck=deepcopy(deck),
+            deck=Deck(list(deck.card_list)),   # カードは共有し、山札/手札だけユニットごとに持つ
             is_ally=is_ally,
+            velocity_dice_count=velocity_dice_count,
+            sprite=f"{name_prefix}/{i % 3 + 1}",   # 画像は3種類を使い回す
         )
         unit_list.append(unit)
 
@@ -1,4 +1,6 @@
 from enum import Enum
+import pygame
+from scripts.utils.cache import LRUCache
 
 
 class Anchor(Enum):
@@ -13,8 +15,82 @@ class Anchor(Enum):
     MID_RIGHT = "midright"
 
 
+# 描画済みの文字列
+text_cache = LRUCache(maxsize=2048)
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+    """
+    文字列を描画（font.render の結果をキャッシュ）
+
+    ・(フォント名, サイズ, 文字列, 色, アンチエイリアス) ごとに1回だけ描画する
+    ・返す画像は共有されるため書き換えない
+    """
+    key = (font.name, font.style_name, font.point_size, text, tuple(color), antialias)
+    img = text_cache.get(key)
+    if img is None:
+        img = font.render(text, antialias, color)
+        text_cache.put(key, img)
+    return img
+
+
+# 幅に収めた文字列（key: (文字列, 最大幅, フォント名, 最大サイズ, 最小サイズ), val: (サイズ, 文字列)）
+fit_cache = LRUCache(maxsize=1024)
+
+
+def fit_text(
+    fonts: "FontManager",
+    name: str,
+    text: str,
+    max_width: int,
+    base_size: int = 20,
+    min_size: int = 12,
+) -> tuple[pygame.font.Font, str]:
+    """
+    文字列を幅に収めるフォントサイズと文字列を求める（結果はキャッシュ）
+
+    1) base_size から min_size の間で幅に収まる最大のサイズを二分探索
+    2) それでも無理なら min_size のまま、末尾を '…' で省略して収まる最長の長さを二分探索
+
+    Returns:
+        tuple[pygame.font.Font, str]: (フォント, 表示する文字列)
+    """
+    key = (text, max_width, name, base_size, min_size)
+    fitted = fit_cache.get(key)
+    if fitted is None:
+        fitted = _fit_text(fonts, name, text, max_width, base_size, min_size)
+        fit_cache.put(key, fitted)
+    size, fitted_text = fitted
+    return fonts.get(name, size), fitted_text
+
+
+def _fit_text(fonts, name, text, max_width, base_size, min_size) -> tuple[int, str]:
+    # 縮小（収まる最大のサイズ）
+    lo, hi = min_size, base_size
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if fonts.get(name, mid).size(text)[0] <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    font = fonts.get(name, lo)
+    if font.size(text)[0] <= max_width:
+        return lo, text
+
+    # 省略（収まる最長の長さ、収まらない場合は '…' のみ）
+    ell = "…"
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if font.size(text[:mid] + ell)[0] <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return min_size, text[:lo] + ell
+
+
 def draw_text(surface, font, text, color, pos, anchor: Anchor = Anchor.TOP_LEFT):
-    img = font.render(text, True, color)
+    img = render_text(font, text, True, color)
     rect = img.get_rect()
 
     if not hasattr(rect, anchor.value):
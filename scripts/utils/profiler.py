@@ -0,0 +1,152 @@
+import csv
+import functools
+import time
+from collections import deque
+
+
+class FrameProfiler:
+    """
+    フレームごとの処理時間の計測
+
+    ・有効にした時だけ計測対象のメソッドを計測用の関数に差し替え、無効にすると元に戻す（無効の間は計測の処理が一切走らない）
+    ・1フレーム内に複数回呼ばれたメソッドは合計時間を記録する
+    ・直近 capacity フレーム分だけ保持する（古いものから破棄）
+    ・フレーム時間は begin_frame から end_frame までの処理時間（clock.tick の待ち時間は含まない）
+
+    Args:
+        capacity (int): 保持するフレーム数
+    """
+
+    def __init__(self, capacity: int = 600):
+        self.capacity = capacity
+        self.enabled = False
+
+        # 計測対象 (クラス, メソッド名, 区間名)
+        self._targets: list[tuple[type, str, str]] = []
+        # 差し替えたメソッド (クラス, メソッド名, 元の関数 or None（継承していた場合）)
+        self._patched: list[tuple[type, str, object]] = []
+
+        # 1フレームの記録 (フレーム時間[ms], {区間名: 時間[ms]})
+        self.frames: deque[tuple[float, dict[str, float]]] = deque(maxlen=capacity)
+        self._current: dict[str, float] = {}
+        self._frame_start: float | None = None
+
+    def add_target(self, owner: type, attr: str, name: str | None = None) -> None:
+        """計測するメソッドを登録（name がない場合は「クラス名.メソッド名」）"""
+        name = name or f"{owner.__name__}.{attr}"
+        self._targets.append((owner, attr, name))
+        if self.enabled:
+            self._patch(owner, attr, name)
+
+    def add_subclasses(self, base: type, attrs: list[str]) -> None:
+        """base のサブクラスが自身で定義しているメソッドを登録"""
+        for cls in _iter_subclasses(base):
+            for attr in attrs:
+                if attr in cls.__dict__:
+                    self.add_target(cls, attr)
+
+    def toggle(self) -> None:
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self.frames.clear()
+        self._current = {}
+        self._frame_start = None
+        for owner, attr, name in self._targets:
+            self._patch(owner, attr, name)
+
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        self.enabled = False
+
+        # 後から差し替えたものから戻す
+        for owner, attr, original in reversed(self._patched):
+            if original is None:
+                delattr(owner, attr)
+            else:
+                setattr(owner, attr, original)
+        self._patched.clear()
+
+    def begin_frame(self) -> None:
+        """1フレームの計測を開始（clock.tick の後に呼ぶ）"""
+        self._current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """1フレームの記録を確定（フレーム時間は begin_frame からの経過時間、begin_frame の前に有効にしたフレームは記録しない）"""
+        if self._frame_start is not None:
+            self.frames.append(((time.perf_counter() - self._frame_start) * 1000.0, self._current))
+        self._current = {}
+        self._frame_start = None
+
+    def get_frame_times(self) -> list[float]:
+        return [frame_ms for frame_ms, _ in self.frames]
+
+    def get_stats(self) -> list[tuple[str, float, float, float]]:
+        """区間ごとの (区間名, p50, p95, p99)[ms]（呼ばれたフレームのみで集計、計測対象の登録順）"""
+        samples: dict[str, list[float]] = {name: [] for _, _, name in self._targets}
+        for _, sections in self.frames:
+            for name, ms in sections.items():
+                samples.setdefault(name, []).append(ms)
+
+        stats = [("frame", *percentiles(self.get_frame_times()))]
+        for name, values in samples.items():
+            if values:
+                stats.append((name, *percentiles(values)))
+        return stats
+
+    def export_csv(self, path: str) -> None:
+        """保持しているフレームを CSV に保存（1行1フレーム、呼ばれなかった区間は空欄）"""
+        names = list(dict.fromkeys(name for _, _, name in self._targets))
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "frame_ms", *names])
+            for i, (frame_ms, sections) in enumerate(self.frames):
+                writer.writerow([
+                    i,
+                    f"{frame_ms:.3f}",
+                    *(f"{sections[name]:.3f}" if name in sections else "" for name in names),
+                ])
+
+    def _patch(self, owner: type, attr: str, name: str) -> None:
+        original = owner.__dict__.get(attr)
+        func = getattr(owner, attr)
+        setattr(owner, attr, self._wrap(func, name))
+        self._patched.append((owner, attr, original))
+
+    def _wrap(self, func, name: str):
+        profiler = self
+        perf_counter = time.perf_counter
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                current = profiler._current
+                current[name] = current.get(name, 0.0) + (perf_counter() - start) * 1000.0
+
+        return wrapper
+
+
+def percentiles(values: list[float], ps=(50, 95, 99)) -> tuple[float, ...]:
+    """最近傍順位法によるパーセンタイル（値がない場合は 0）"""
+    if not values:
+        return tuple(0.0 for _ in ps)
+    values = sorted(values)
+    n = len(values)
+    return tuple(values[min(n - 1, max(0, -(-p * n // 100) - 1))] for p in ps)
+
+
+def _iter_subclasses(base: type):
+    for cls in base.__subclasses__():
+        yield cls
+        yield from _iter_subclasses(cls)